@@ -64,7 +64,7 @@ def load_default_config() -> Dict[str, Any]:
     # Create AgentConfig with defaults
     config = AgentConfig()
     # Convert to dict
-    config_dict = config.dict()
+    config_dict = config.model_dump()
     
     # Add any legacy fields that might be missing in AgentConfig
     # The AgentConfig model uses 'extra = "ignore"' so extra fields are allowed
@@ -4,7 +4,7 @@ Configuration models for the ThoughtMachine agent.
 """
 
 from typing import Optional, Callable, List, Any, Dict, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, model_validator
 from agent.logging.debug_log import debug_log
 
 from tools import SIMPLIFIED_TOOL_CLASSES
@@ -30,6 +30,9 @@ class AgentConfig(BaseModel):
     initial_input_tokens: int = 0
     initial_output_tokens: int = 0
     system_prompt: Optional[str] = None  # Custom system prompt (overrides file)
+    stream_responses: bool = Field(default=False, description="Stream LLM responses and emit partial content as stream_delta events")
+    response_cache: Literal["off", "deterministic", "always"] = Field(default="off", description="Opt-in reuse of responses for identical requests (model, messages, tools, parameters), shared by all agents in the process: 'deterministic' only at temperature 0, 'always' at any temperature. Cache hits report no token usage and repeat the same answer on retry")
+    tool_result_cache: bool = Field(default=False, description="Reuse results of cacheable (read-only) tools called again with identical arguments; cleared after any tool that may modify state runs. Changes made outside the agent are not seen until an entry expires")
     
     # Token monitoring configuration
     token_monitor_enabled: bool = Field(default=True, description="Enable automatic token usage warnings")
@@ -78,21 +81,13 @@ class AgentConfig(BaseModel):
         description="List of enabled tool class names"
     )
 
-    @field_validator('enabled_tools')
-    def filter_search_codebase_tool(cls, v, info):
-        """Ensure SearchCodebaseTool is only available when rag_enabled is True."""
-        rag_enabled = info.data.get('rag_enabled', False)
-        if not rag_enabled:
-            # Remove SearchCodebaseTool from enabled_tools
-            filtered = [tool for tool in v if tool != 'SearchCodebaseTool']
-            # Only return filtered if different from original (avoid infinite recursion)
-            if filtered != v:
-                return filtered
-        return v
-    
     @model_validator(mode='after')
     def filter_default_enabled_tools(self):
-        """Filter SearchCodebaseTool from default enabled_tools when rag_enabled=False."""
+        """Ensure SearchCodebaseTool is only enabled when rag_enabled is True.
+
+        Runs once per instance and covers both explicit and default
+        enabled_tools (field validators don't run on defaults).
+        """
         if not self.rag_enabled and self.enabled_tools:
             # Remove SearchCodebaseTool from enabled_tools
             filtered = [tool for tool in self.enabled_tools if tool != 'SearchCodebaseTool']
@@ -120,7 +115,8 @@ class AgentConfig(BaseModel):
         
         # Also filter based on enabled_tools if specified
         if self.enabled_tools:
-            tool_classes = [cls for cls in tool_classes if cls.__name__ in self.enabled_tools]
+            enabled = set(self.enabled_tools)  # O(1) membership per class
+            tool_classes = [cls for cls in tool_classes if cls.__name__ in enabled]
         
         return tool_classes
 
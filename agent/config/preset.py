@@ -82,7 +82,12 @@ class PresetLoader:
         if not YAML_AVAILABLE:
             return
 
-        for yaml_file in self.presets_dir.glob("*.yaml"):
+        # DirEntry caches the name and file type, so no Path or extra stat per entry
+        with os.scandir(self.presets_dir) as entries:
+            yaml_files = [entry.path for entry in entries
+                          if entry.name.endswith(".yaml") and entry.is_file()]
+
+        for yaml_file in yaml_files:
             try:
                 with open(yaml_file, 'r', encoding='utf-8') as f:
                     data = yaml.safe_load(f)
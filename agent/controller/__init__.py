@@ -9,28 +9,34 @@ from typing import Optional, List, Dict, Any
 from PyQt6.QtCore import QObject, pyqtSignal
 from agent.logging.debug_log import debug_log
 
+# Event types checked on every event; module-level frozensets avoid per-event allocation
+_TERMINAL_EVENT_TYPES = frozenset({"stopped", "error", "max_turns"})
+_QUERY_DONE_EVENT_TYPES = frozenset({"final", "user_interaction_requested"})
+_CONTENT_EVENT_TYPES = frozenset({"user_query", "turn", "tool_call", "tool_result", "final",
+                                  "llm_request", "llm_response", "raw_response"})
+
 class AgentController(QObject):
     """
     Runs the agent in a background thread and provides thread‑safe control
-    via start/stop/pause/resume and a queue for receiving events.
+    via start/stop/pause/resume; events are delivered by the event_occurred signal.
     """
+    # Run states guarded by _cv (a plain int read is the unpaused fast path)
+    _RUNNING = 0
+    _PAUSED = 1
+    _STOPPED = 2
+
     # Signals
     event_occurred = pyqtSignal(dict)
     conversation_updated = pyqtSignal(str)  # session_id when conversation changes
 
     def __init__(self):
         super().__init__()
-        # Thread‑safe queue for passing events from agent thread to main thread
-        self.event_queue = queue.Queue()
-
-        # Events for controlling the agent thread
-        self.stop_event = threading.Event()   # when set, agent should stop
-        self.pause_event = threading.Event()  # when set, agent can run (otherwise paused)
-        self.pause_event.set()                 # start unpaused
+        # Run state for controlling the agent thread (start unpaused)
+        self._state = self._RUNNING
+        self._cv = threading.Condition()
 
-        # Thread handle and running flag
+        # Thread handle; liveness is the thread's own is_alive()
         self.thread = None
-        self._running = False
         self._initial_conversation = None
         self._agent_override = None
         self.agent = None
@@ -47,22 +53,14 @@ class AgentController(QObject):
         if self.thread is not None and not self.thread.is_alive():
             # Thread has finished but state wasn't cleaned up
             debug_log(f"Thread dead, cleaning up state", level="DEBUG", component="Controller")
-            self._running = False
             self.thread = None
             self.agent = None  # Clear old agent reference
             self._keep_alive = True
             self._pause_requested = False
             self._processing_query = False
-            debug_log(f"Cleaned up dead thread, _running={self._running}", level="DEBUG", component="Controller")
+            debug_log(f"Cleaned up dead thread", level="DEBUG", component="Controller")
     def reset(self):
         """Reset controller to initial state, clearing all queues and events."""
-        # Clear event queue
-        while True:
-            try:
-                self.event_queue.get_nowait()
-            except queue.Empty:
-                break
-
         # Clear query queue  
         while True:
             try:
@@ -70,13 +68,11 @@ class AgentController(QObject):
             except queue.Empty:
                 break
 
-        # Reset events
-        self.stop_event.clear()
-        self.pause_event.set()  # start unpaused
+        # Reset run state
+        self._set_state(self._RUNNING)  # start unpaused
 
         # Reset state
         self.thread = None
-        self._running = False
         self._initial_conversation = None
         self.agent = None
         self._keep_alive = True
@@ -89,20 +85,16 @@ class AgentController(QObject):
 
     @property
     def is_running(self):
-        """Return True if the agent thread is alive and not shutting down."""
-        # If _running is False, agent is definitely not running
-        if not self._running:
-            debug_log(f"is_running: _running=False, returning False (thread alive={self.thread.is_alive() if self.thread else False})", level="DEBUG", component="Controller")
-            return False
-        # Check thread status
-        if self.thread is not None and self.thread.is_alive():
-            debug_log(f"is_running: thread alive, returning True (_running={self._running}, pause_event.is_set={self.pause_event.is_set()}, _pause_requested={self._pause_requested})", level="DEBUG", component="Controller")
+        """Return True if the agent thread is alive."""
+        # Read once: reset() may clear self.thread from another thread
+        thread = self.thread
+        if thread is not None and thread.is_alive():
+            debug_log(f"is_running: thread alive, returning True (state={self._state}, _pause_requested={self._pause_requested})", level="DEBUG", component="Controller")
             return True
         # Thread is dead or doesn't exist, ensure state is cleaned up
-        debug_log(f"is_running: thread dead or None, cleaning up (thread={self.thread})", level="DEBUG", component="Controller")
+        debug_log(f"is_running: thread dead or None, cleaning up (thread={thread})", level="DEBUG", component="Controller")
         self._cleanup_if_thread_dead()
-        debug_log(f"is_running: after cleanup, _running={self._running}", level="DEBUG", component="Controller")
-        return self._running
+        return False
     
     def get_config(self):
         """Return the current AgentConfig being used."""
@@ -120,14 +112,12 @@ class AgentController(QObject):
             **overrides: Additional config overrides when using preset_name.
         """
         debug_log(f"start called with query: {query[:50]}...", level="DEBUG", component="Controller")
-        # Clean up any dead thread state
-        self._cleanup_if_thread_dead()
-        if self._running:
+        # is_running also cleans up any dead thread state
+        if self.is_running:
             raise RuntimeError("Agent is already running. Stop it first.")
 
-        # Reset control events
-        self.stop_event.clear()
-        self.pause_event.set()   # ensure we start unpaused
+        # Reset run state
+        self._set_state(self._RUNNING)   # ensure we start unpaused
         # Reset internal state flags
         self._keep_alive = True
         self._pause_requested = False
@@ -159,22 +149,22 @@ class AgentController(QObject):
         self.query_queue.put(query)
 
         # Create and start the daemon thread
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self._running = True
+        self.thread = threading.Thread(target=self._run, name="AgentController", daemon=True)
         self.thread.start()
 
     def stop(self):
-        """Request the agent to pause after the current turn/tool."""
-        self.pause()   # treat stop as pause
+        """Stop the agent: an in-flight LLM stream is abandoned, then it idles like a pause."""
+        debug_log(f"stop() called, entering stopped state, setting _pause_requested=True", level="DEBUG", component="Controller")
+        self._halt(self._STOPPED)
 
     def continue_session(self, query: str):
         """Submit a new query to the already running agent."""
-        debug_log(f"continue_session called: query='{query[:50]}...' is_running={self.is_running} pause_event.is_set={self.pause_event.is_set()}", level="DEBUG", component="Controller")
+        debug_log(f"continue_session called: query='{query[:50]}...' is_running={self.is_running} state={self._state}", level="DEBUG", component="Controller")
         if os.environ.get('PAUSE_DEBUG'):
-            debug_log(f"Controller.continue_session: query='{query[:50]}...', is_running={self.is_running}, pause_event.is_set={self.pause_event.is_set()}, _pause_requested={self._pause_requested}", level="WARNING", component="PAUSE_FLOW")
+            debug_log(f"Controller.continue_session: query='{query[:50]}...', is_running={self.is_running}, state={self._state}, _pause_requested={self._pause_requested}", level="WARNING", component="PAUSE_FLOW")
         if not self.is_running:
             # Agent is not running, cannot continue
-            debug_msg = f"[Controller] Agent not running, cannot continue. _running={self._running}, thread alive={self.thread.is_alive() if self.thread else False}"
+            debug_msg = f"[Controller] Agent not running, cannot continue. thread alive={self.thread.is_alive() if self.thread else False}"
             if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
                 debug_log(debug_msg, level="DEBUG", component="Controller")
             if os.environ.get('PAUSE_DEBUG'):
@@ -190,7 +180,7 @@ class AgentController(QObject):
 
     def request_pause(self):
         """Request agent to pause after current turn."""
-        debug_log(f"request_pause called: is_running={self.is_running} _processing_query={self._processing_query} pause_event.is_set={self.pause_event.is_set()}", level="DEBUG", component="Controller")
+        debug_log(f"request_pause called: is_running={self.is_running} _processing_query={self._processing_query} state={self._state}", level="DEBUG", component="Controller")
         if not self.is_running:
             # Agent is not running, nothing to pause
             if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
@@ -205,8 +195,8 @@ class AgentController(QObject):
             # Agent is idle, send paused event directly
             if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
                 debug_log(f"Agent idle, sending paused event directly", level="DEBUG", component="Controller")
-            # Clear pause_event to prevent processing and mark as paused
-            self.pause_event.clear()
+            # Enter paused state to prevent processing
+            self._set_state(self._PAUSED)
             self._pause_requested = True
             # Signal agent to pause after current turn
             if hasattr(self, 'agent') and self.agent is not None and hasattr(self.agent, 'request_pause'):
@@ -245,8 +235,12 @@ class AgentController(QObject):
 
     def pause(self):
         """Pause the agent before the next turn (finishes current turn first)."""
-        debug_log(f"pause() called, clearing pause_event, setting _pause_requested=True", level="DEBUG", component="Controller")
-        self.pause_event.clear()
+        debug_log(f"pause() called, entering paused state, setting _pause_requested=True", level="DEBUG", component="Controller")
+        self._halt(self._PAUSED)
+
+    def _halt(self, state: int):
+        """Enter the paused or stopped state and ask the agent to pause."""
+        self._set_state(state)
         self._pause_requested = True
         # Signal agent to pause after current turn
         if hasattr(self, 'agent') and self.agent is not None and hasattr(self.agent, 'request_pause'):
@@ -260,14 +254,14 @@ class AgentController(QObject):
                 original_len = len(self.agent.conversation)
                 self.agent.conversation = ContextBuilder._cleanup_orphaned_tool_messages(self.agent.conversation)
                 if original_len != len(self.agent.conversation) and os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
-                    debug_log(f"Cleaned {original_len - len(self.agent.conversation)} orphaned tool messages on pause", level="WARNING", component="Controller")
+                    debug_log(f"Cleaned {original_len - len(self.agent.conversation)} orphaned tool messages on {'stop' if state == self._STOPPED else 'pause'}", level="WARNING", component="Controller")
 
     def resume(self):
         """Resume a paused agent."""
-        debug_log(f"resume() called, setting pause_event, clearing _pause_requested", level="DEBUG", component="Controller")
+        debug_log(f"resume() called, entering running state, clearing _pause_requested", level="DEBUG", component="Controller")
         if os.environ.get('PAUSE_DEBUG'):
-            debug_log(f"Controller.resume: setting pause_event, clearing _pause_requested", level="WARNING", component="PAUSE_FLOW")
-        self.pause_event.set()
+            debug_log(f"Controller.resume: entering running state, clearing _pause_requested", level="WARNING", component="PAUSE_FLOW")
+        self._set_state(self._RUNNING)
         self._pause_requested = False
         # Also clear pause request flag in agent if it exists
         if hasattr(self, 'agent') and self.agent is not None:
@@ -279,21 +273,37 @@ class AgentController(QObject):
 
 
 
+    def _set_state(self, state: int):
+        """Set the run state and wake the agent thread if it is blocked on pause."""
+        with self._cv:
+            self._state = state
+            self._cv.notify_all()
+
+    def _emit_stream_delta(self, event):
+        """Emit a stream_delta event to the live preview only.
+
+        Deltas are display-only and arrive once per streamed chunk, so they are
+        neither buffered nor logged (the assembled response follows as events).
+        """
+        event['session_id'] = self.current_session_id
+        self.event_occurred.emit(event)
+
     def _emit_event(self, event):
-        """Emit event both to queue and signal."""
+        """Emit event to the presenter through the event_occurred signal."""
+        event_type = event.get('type')
+        if event_type == "stream_delta":
+            # Never buffered or logged, whichever path it comes from
+            self._emit_stream_delta(event)
+            return
         # Attach session ID for event filtering
         event['session_id'] = self.current_session_id
-        # Put into queue for compatibility
-        self.event_queue.put(event)
         # Emit signal for presenter
-        debug_log(f"Emitting event_occurred: {event.get('type')}", level="DEBUG", component="Controller")
+        debug_log(f"Emitting event_occurred: {event_type}", level="DEBUG", component="Controller")
         self.event_occurred.emit(event)
         
         # Emit conversation_updated signal for conversation-changing events
-        content_event_types = {"user_query", "turn", "tool_call", "tool_result", "final", 
-                              "llm_request", "llm_response", "raw_response"}
-        if event.get("type") in content_event_types:
-            debug_log(f"Emitting conversation_updated for event type {event.get('type')}", 
+        if event_type in _CONTENT_EVENT_TYPES:
+            debug_log(f"Emitting conversation_updated for event type {event_type}", 
                      level="DEBUG", component="Controller")
             self.conversation_updated.emit(self.current_session_id if self.current_session_id else "")
 
@@ -304,22 +314,20 @@ class AgentController(QObject):
         try:
             # Define the stop_check function that the agent will call before each turn
             def should_stop():
-                # Check if we should stop
-                debug_log(f"should_stop called, pause_event.is_set={self.pause_event.is_set()}, stop_event.is_set={self.stop_event.is_set()}, _pause_requested={self._pause_requested}", level="DEBUG", component="Controller")
-                # If stop event is set, return True immediately
-                if self.stop_event.is_set():
+                # Fast path: a single int read while running
+                state = self._state
+                if state == self._RUNNING:
+                    return False
+                debug_log(f"should_stop called, state={state}, _pause_requested={self._pause_requested}", level="DEBUG", component="Controller")
+                # If stopped, return True immediately (aborts an in-flight stream)
+                if state == self._STOPPED:
                     if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
-                        debug_log(f"should_stop: stop_event is set, returning True", level="DEBUG", component="Controller")
+                        debug_log(f"should_stop: stopped, returning True", level="DEBUG", component="Controller")
                     return True
-                # If paused (pause_event cleared), return "PAUSED" instead of blocking
-                if not self.pause_event.is_set():
-                    if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
-                        debug_log(f"should_stop: pause_event not set, returning PAUSED", level="DEBUG", component="Controller")
-                    return "PAUSED"
-                # Not paused and not stopped
+                # Paused: return "PAUSED" instead of blocking
                 if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
-                    debug_log(f"should_stop: not paused, returning False", level="DEBUG", component="Controller")
-                return False
+                    debug_log(f"should_stop: paused, returning PAUSED", level="DEBUG", component="Controller")
+                return "PAUSED"
 
             # If an agent was pre-created (from preset), use it directly
             if hasattr(self, '_agent_override') and self._agent_override is not None:
@@ -338,8 +346,12 @@ class AgentController(QObject):
                 self.agent = agent
             else:
                 # Inject the stop_check into a copy of the config to avoid mutating the original
-                run_config = self._config.model_copy() if hasattr(self._config, 'model_copy') else self._config
-                run_config.stop_check = should_stop
+                if hasattr(self._config, 'model_copy'):
+                    # Shallow copy with the override applied in one step (no re-validation)
+                    run_config = self._config.model_copy(update={"stop_check": should_stop})
+                else:
+                    run_config = self._config
+                    run_config.stop_check = should_stop
                 # Create Agent instance with session if available
                 agent = Agent(run_config, session=self._session if hasattr(self, '_session') else None)
                 self.agent = agent  # store for potential reuse
@@ -349,16 +361,13 @@ class AgentController(QObject):
                 # Check if we should stop (paused or stopped)
                 stop_result = should_stop()
                 if stop_result:
-                    if stop_result == "PAUSED":
-                        # Paused, block here until resumed
-                        if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
-                            debug_log(f"PAUSED returned, waiting on pause_event", level="DEBUG", component="Controller")
-                        self.pause_event.wait()
-                        if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
-                            debug_log(f"Resumed from pause_event.wait()", level="DEBUG", component="Controller")
-                        continue
-                    # Otherwise stopped (True)
-                    # Agent is stopped, continue loop
+                    # Paused or stopped, block here until resumed
+                    if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
+                        debug_log(f"{'PAUSED' if stop_result == 'PAUSED' else 'Stopped'} returned, waiting for resume", level="DEBUG", component="Controller")
+                    with self._cv:
+                        self._cv.wait_for(lambda: self._state == self._RUNNING)
+                    if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
+                        debug_log(f"Resumed from pause wait", level="DEBUG", component="Controller")
                     continue
                 
                 # Wait for next query (only if not paused)
@@ -384,6 +393,10 @@ class AgentController(QObject):
                 self._processing_query = True
                 # Run the agent for this query
                 for event in agent.process_query(query):
+                    if event["type"] == "stream_delta":
+                        # Hot path: one event per streamed chunk, nothing else to decide
+                        self._emit_stream_delta(event)
+                        continue
                     debug_log(f"Event: {event['type']}", level="DEBUG", component="Controller")
                     # Put each event into the queue for the GUI to pick up
                     self._emit_event(event)
@@ -393,7 +406,7 @@ class AgentController(QObject):
                         break
 
                     # If this is a terminal event, decide what to do
-                    if event["type"] in ("stopped", "error", "max_turns"):
+                    if event["type"] in _TERMINAL_EVENT_TYPES:
                         # Treat as pause, keep thread alive
                         debug_log(f"Terminal event {event['type']} detected, treating as pause", level="DEBUG", component="Controller")
                         # Clear pause request flag
@@ -401,7 +414,7 @@ class AgentController(QObject):
                         # Send paused event to inform GUI
                         self._emit_event({"type": "paused"})
                         break
-                    elif event["type"] in ("final", "user_interaction_requested"):
+                    elif event["type"] in _QUERY_DONE_EVENT_TYPES:
                         # Agent has completed this query, pause and wait for next query
                         # Yield a paused event to inform GUI
                         if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
@@ -409,11 +422,12 @@ class AgentController(QObject):
                         self._emit_event({"type": "paused"})
                         break
                     # For other events (turn), continue processing
-                    # Check if we're paused between events
-                    if not self.pause_event.is_set():
+                    # Check if we're paused or stopped between events (a pause is never
+                    # honoured mid-stream; a stop makes the agent abandon the stream)
+                    if self._state != self._RUNNING:
                         # We're paused, break out of loop
                         if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
-                            debug_log(f"pause_event not set between events, breaking loop", level="DEBUG", component="Controller")
+                            debug_log(f"paused between events, breaking loop", level="DEBUG", component="Controller")
                         self._pause_requested = False
                         self._emit_event({"type": "paused"})
                         break
@@ -428,7 +442,6 @@ class AgentController(QObject):
             # Catch any unexpected exception and send an error event
             debug_log(f"Exception in _run: {e}", level="ERROR", component="Controller")
             traceback.print_exc()
-            self._running = False  # Mark as not running before sending error
             self._emit_event({
                 "type": "error",
                 "error_type": "CONTROLLER_ERROR",
@@ -439,5 +452,4 @@ class AgentController(QObject):
             if os.environ.get('THOUGHTMACHINE_DEBUG') == '1':
                 debug_log(f"Finally block: thread finishing", level="DEBUG", component="Controller")
             # Signal that the thread is finishing
-            self._emit_event({"type": "thread_finished"})
-            self._running = False
\ No newline at end of file
+            self._emit_event({"type": "thread_finished"})
\ No newline at end of file
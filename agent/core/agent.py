@@ -25,11 +25,10 @@ from agent.logging.debug_log import debug_log
 from pydantic import ValidationError
 from llm_providers.exceptions import ProviderError, RateLimitExceeded
 from tools import SIMPLIFIED_TOOL_CLASSES
-from tools.utils import model_to_openai_tool
+from tools.utils import tool_definitions_for
 from tools.final import Final
 from tools.request_user_interaction import RequestUserInteraction
 from tools.summarize_tool import SummarizeTool
-from fast_json_repair import loads as repair_loads
 from session.models import RuntimeParams
 from session.context_builder import ContextBuilder
 
@@ -46,7 +45,9 @@ from .debug_context import DebugContext
 try:
     import sys
     import os
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + "/../../")
+    _project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if _project_root not in sys.path:
+        sys.path.insert(0, _project_root)
     from debug_pruning import (
         debug_log, log_session_history, log_history_provider_reconstruction,
         log_message_insertion, log_pruning_operation, log_token_count,
@@ -94,6 +95,8 @@ class Agent:
         self.config = config
         self._session = session  # Use private attribute with property
         self._conversation = []  # Private storage for session-less mode
+        self._local_version_data = None  # Cached synthetic version/hash for session-less mode
+        self._conversation_mutations = 0  # Bumped on every change to the session-less conversation
         
         # Initialize logging if available
         self.logger = None
@@ -148,7 +151,7 @@ class Agent:
         
         # Tool setup
         self.tool_classes = config.tool_classes if config.tool_classes is not None else config.get_filtered_tool_classes()
-        self.tool_definitions = [model_to_openai_tool(cls) for cls in self.tool_classes]
+        self.tool_definitions = tool_definitions_for(self.tool_classes)
         
         # Initialize tool executor with security availability
         self.tool_executor = ToolExecutor(
@@ -286,7 +289,12 @@ class Agent:
             if hasattr(self, 'context_builder') and self.context_builder is not None and hasattr(self.context_builder, '_cached_context'):
                 self.context_builder._cached_context = None
         else:
-            self._conversation = value    
+            self._conversation = value
+            self._conversation_changed()
+
+    def _conversation_changed(self):
+        """Record a change to the session-less conversation (invalidates its cached version)."""
+        self._conversation_mutations += 1
     def _initialize_session_state(self):
         """Initialize session state based on existing history."""
         if self.session is not None:
@@ -521,16 +529,24 @@ class Agent:
                 'conversation_hash': self.session.conversation_hash,
             }
         else:
-            # No session, use local conversation with synthetic version
-            import hashlib
-            from session.utils import normalize_conversation_for_hash
-            conv_str = normalize_conversation_for_hash(self.conversation)
-            version_hash = hashlib.md5(conv_str.encode()).hexdigest()[:8]
-            version = int(version_hash, 16) if version_hash else 0
-            base_data = {
-                'conversation_version': version,
-                'conversation_hash': version_hash,
-            }
+            # No session, use local conversation with synthetic version.
+            # Serializing the whole history for every event is O(N), so the
+            # result is cached until the conversation is reassigned or marked
+            # changed (_conversation_changed); the length also catches appends.
+            cache_key = (self._conversation_mutations, len(self.conversation))
+            cached = self._local_version_data
+            if cached is None or cached[0] != cache_key:
+                import hashlib
+                from session.utils import normalize_conversation_for_hash
+                conv_str = normalize_conversation_for_hash(self.conversation)
+                version_hash = hashlib.md5(conv_str.encode()).hexdigest()[:8]
+                version = int(version_hash, 16) if version_hash else 0
+                cached = (cache_key, {
+                    'conversation_version': version,
+                    'conversation_hash': version_hash,
+                })
+                self._local_version_data = cached
+            base_data = dict(cached[1])
         
         # Add required conversation metadata for GUI
         conversation_id = self.session_id if self.session_id else base_data.get('conversation_hash', '')
@@ -630,7 +646,7 @@ class Agent:
         
         # Update tool classes
         self.tool_classes = new_config.tool_classes if new_config.tool_classes is not None else new_config.get_filtered_tool_classes()
-        self.tool_definitions = [model_to_openai_tool(cls) for cls in self.tool_classes]
+        self.tool_definitions = tool_definitions_for(self.tool_classes)
         
         # Recreate tool executor
         self.tool_executor = ToolExecutor(
@@ -746,6 +762,11 @@ class Agent:
             event_dict["timestamp"] = event_dict.get("created_at", time.time())
         yield event_dict
 
+        # Ensure any assistant message with tool_calls has reasoning_content field.
+        # Messages created by the turn loop below already satisfy this, so only
+        # history loaded from elsewhere needs patching - once per query, not per turn.
+        self._ensure_reasoning_content()
+
         prev_conversation_len = len(self.conversation)
         last_input_tokens = 0
         last_output_tokens = 0
@@ -767,32 +788,8 @@ class Agent:
             
             # Check stop signal
             if self.stop_check and self.stop_check():
-                # Update execution state: transition through PAUSING intermediate state
-                events = self.state.set_execution_state(ExecutionState.PAUSING)
-                for event in events:
-                    for yielded_event in self._handle_state_event(event):
-                        yield yielded_event
-                # Then transition to PAUSED
-                events = self.state.set_execution_state(ExecutionState.PAUSED)
-                for event in events:
-                    for yielded_event in self._handle_state_event(event):
-                        yield yielded_event
-
-                if self.logger:
-                    self.logger.log_stop_signal()
-                    self.logger.log_system_resources()
-                    self.logger.log_agent_end("stopped", "Stop signal received")
-                    self.logger.close()
-                stopped_event = {
-                    "type": "stopped",
-                    "turn": self._display_turn,
-                    "context_length": self.state.current_conversation_tokens,
-                    "usage": {"input": last_input_tokens, "output": last_output_tokens,
-                              "total_input": self.total_input_tokens, "total_output": self.total_output_tokens}
-                }
-                self._add_conversation_data_to_event(stopped_event)
-                yield stopped_event
-                return            
+                yield from self._stop_events(last_input_tokens, last_output_tokens)
+                return
             # Turn monitoring warning
             turn_events = self.state.update_turn_state(turn)
             for event in turn_events:
@@ -855,12 +852,6 @@ class Agent:
                 self._add_conversation_data_to_event(event_dict)
                 yield event_dict
             
-            # Ensure any assistant message with tool_calls has reasoning_content field
-            for msg in self.conversation:
-                if msg.get("role") == "assistant" and "tool_calls" in msg:
-                    if msg.get("reasoning_content") is None:
-                        msg["reasoning_content"] = ""
-            
             # Log conversation state before building context
             if self.logger and hasattr(self.logger, 'py_logger'):
                 system_msgs = [msg for msg in self.conversation if msg.get("role") == "system"]
@@ -875,8 +866,9 @@ class Agent:
             # Debug context monitoring
             self.debug_context.debug_context("before_build", context_builder=self.context_builder)
             
-            if hasattr(self, 'context_builder') and self.context_builder is not None:
-                messages = self.context_builder.build(
+            context_builder = getattr(self, 'context_builder', None)
+            if context_builder is not None:
+                messages = context_builder.build(
                     self.conversation,
                     max_tokens=max_context_tokens
                 )
@@ -886,27 +878,24 @@ class Agent:
             # Debug context monitoring: show runtime context
             self.debug_context.debug_context("after_build", messages=messages, context_builder=self.context_builder)
             
-            # Debug: print messages being sent to LLM
-            pause_debug(f"Messages being sent to LLM ({len(messages)}):")
-            for i, msg in enumerate(messages):
-                role = msg.get('role', 'unknown')
-                content_preview = str(msg.get('content', ''))[:100]
-                pause_debug(f"  [{i}] {role}: {content_preview}...")
+            # Debug: print messages being sent to LLM (skip building the previews when disabled)
+            if PAUSE_DEBUG:
+                pause_debug(f"Messages being sent to LLM ({len(messages)}):")
+                for i, msg in enumerate(messages):
+                    role = msg.get('role', 'unknown')
+                    content_preview = str(msg.get('content', ''))[:100]
+                    pause_debug(f"  [{i}] {role}: {content_preview}...")
             
             # Final safety cleanup: remove any orphaned tool messages that might have slipped through
-            original_len = len(messages)
-            messages = ContextBuilder._cleanup_orphaned_tool_messages(messages)
-            if original_len != len(messages):
-                logger.warning(f'[DEBUG_CONTEXT] Agent: cleaned {original_len - len(messages)} orphaned tool messages from final context')
+            # (skipped when the builder's last step was this same cleanup)
+            if not getattr(context_builder, 'cleans_orphaned_tool_messages', False):
+                original_len = len(messages)
+                messages = ContextBuilder._cleanup_orphaned_tool_messages(messages)
+                if original_len != len(messages):
+                    logger.warning(f'[DEBUG_CONTEXT] Agent: cleaned {original_len - len(messages)} orphaned tool messages from final context')
             
             if self.logger and hasattr(self.logger, 'py_logger'):
                 # Estimate token count for messages
-                # TODO: Use token_counter
-                import tiktoken
-                try:
-                    encoder = tiktoken.get_encoding("cl100k_base")
-                except Exception:
-                    encoder = None
                 total_tokens = sum(self.token_counter.estimate_tokens(msg) for msg in messages)
                 self.logger.py_logger.info(f"[CONTEXT] Built context: {len(messages)} messages, ~{total_tokens} tokens")
             
@@ -1028,11 +1017,15 @@ class Agent:
                 
                 # Measure LLM latency
                 llm_start_time = time.time()
-                response = self.llm_client.chat_completion(
-                    messages=messages,
-                    tools=tools if tools else None,
-                    **chat_kwargs
+                response = yield from self._stream_llm_response(
+                    messages,
+                    tools if tools else None,
+                    chat_kwargs
                 )
+                if response is None:
+                    # Stop requested mid-stream; the response was abandoned
+                    yield from self._stop_events(last_input_tokens, last_output_tokens)
+                    return
                 llm_duration_ms = (time.time() - llm_start_time) * 1000
                 
                 # Log LLM latency
@@ -1270,6 +1263,7 @@ class Agent:
                         "result": result,
                         "success": success,
                         "error": error,
+                        "cached": tool_info.get("cached", False),
                         "turn": self._display_turn  # Use display turn for grouping
                     })
                 
@@ -1294,6 +1288,7 @@ class Agent:
                         "result": tool["result"],
                         "success": tool["success"],
                         "error": tool["error"],
+                        "cached": tool["cached"],
                         "turn": tool["turn"]
                     }
                     self._add_conversation_data_to_event(event_dict)
@@ -1450,6 +1445,83 @@ class Agent:
                 yield final_event
                 return
     
+    def _ensure_reasoning_content(self):
+        """Give assistant tool-call messages an empty reasoning_content if missing.
+
+        Only reasoning models (deepseek-reasoner) reject tool-call turns without
+        the field, so the scan is skipped for every other model.
+        """
+        if "reasoner" not in (self.config.model or "").lower():
+            return
+        changed = False
+        for msg in self.conversation:
+            if msg.get("role") == "assistant" and "tool_calls" in msg:
+                if msg.get("reasoning_content") is None:
+                    msg["reasoning_content"] = ""
+                    changed = True
+        if changed:
+            self._conversation_changed()
+    
+    def _stream_llm_response(self, messages, tools, chat_kwargs):
+        """Run the LLM call, yielding stream_delta events; returns the LLMResponse.
+
+        Deltas are display-only: the assistant message is still recorded once,
+        from the assembled response, by the turn loop. Returns None if a stop
+        was requested while streaming (the response is abandoned).
+        """
+        stream = self.llm_client.stream_chat_completion(
+            messages=messages,
+            tools=tools,
+            **chat_kwargs
+        )
+        while True:
+            try:
+                delta = next(stream)
+            except StopIteration as stop:
+                return stop.value
+            # Only a hard stop (AgentController.stop(), whose stop_check returns
+            # True) aborts mid-response; a pause ("PAUSED") lets the turn finish
+            # and is handled before the next one
+            if self.stop_check and self.stop_check() is True:
+                # Closing the generator closes the provider's HTTP stream, so
+                # the model stops generating (and billing) right away
+                stream.close()
+                return None
+            yield {
+                "type": "stream_delta",
+                "content": delta.get("content", ""),
+                "reasoning": delta.get("reasoning", ""),
+                "turn": self._display_turn,
+            }
+    
+    def _stop_events(self, last_input_tokens, last_output_tokens):
+        """Transition to PAUSED on a stop signal and yield the resulting events."""
+        # Update execution state: transition through PAUSING intermediate state
+        events = self.state.set_execution_state(ExecutionState.PAUSING)
+        for event in events:
+            for yielded_event in self._handle_state_event(event):
+                yield yielded_event
+        # Then transition to PAUSED
+        events = self.state.set_execution_state(ExecutionState.PAUSED)
+        for event in events:
+            for yielded_event in self._handle_state_event(event):
+                yield yielded_event
+
+        if self.logger:
+            self.logger.log_stop_signal()
+            self.logger.log_system_resources()
+            self.logger.log_agent_end("stopped", "Stop signal received")
+            self.logger.close()
+        stopped_event = {
+            "type": "stopped",
+            "turn": self._display_turn,
+            "context_length": self.state.current_conversation_tokens,
+            "usage": {"input": last_input_tokens, "output": last_output_tokens,
+                      "total_input": self.total_input_tokens, "total_output": self.total_output_tokens}
+        }
+        self._add_conversation_data_to_event(stopped_event)
+        yield stopped_event
+
     def _apply_summary_pruning(self, summary: str, keep_recent_turns: int):
         """Add summary message to append-only history with metadata.
         
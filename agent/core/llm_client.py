@@ -5,10 +5,23 @@ Extracted from agent.py to separate LLM communication concerns.
 """
 
 import os
+import json
+import hashlib
 import logging
+import functools
+import threading
+import collections
+import dataclasses
+import copy
 from typing import Optional, List, Dict, Any
 from agent.logging.debug_log import debug_log
 
+# orjson is optional; it serializes the (large) cache-key payload much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from llm_providers.factory import ProviderFactory
 from llm_providers.exceptions import (
     ProviderError,
@@ -23,6 +36,37 @@ from llm_providers.exceptions import (
 )
 
 
+# Known system_prompt.txt locations, in lookup order (the last is cwd-relative)
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_SYSTEM_PROMPT_PATHS = (
+    os.path.join(_SCRIPT_DIR, "system_prompt.txt"),
+    os.path.join(_SCRIPT_DIR, "..", "system_prompt.txt"),
+    "./system_prompt.txt"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_system_prompt_file() -> str:
+    """Read system_prompt.txt from the first known location.
+
+    The file is static for the process lifetime, so the result is cached.
+    A failed lookup raises and is not cached.
+    """
+    for path in _SYSTEM_PROMPT_PATHS:
+        try:
+            with open(path, "r") as f:
+                return f.read()
+        except FileNotFoundError:
+            continue
+    raise RuntimeError("Could not find system_prompt.txt in any known location")
+
+
+# Process-wide cache of LLM responses for identical requests (see LLMClient._response_cache_key)
+_RESPONSE_CACHE_MAXSIZE = 64
+_response_cache = collections.OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
 class LLMError(ProviderError):
     """Generic LLM error for provider-independent error handling."""
     def __init__(self, error_type: str, message: str, original_exception: Exception = None):
@@ -85,24 +129,8 @@ class LLMClient:
         return HistoryProvider(session=self.session, token_limit=token_limit)
     
     def load_system_prompt(self) -> str:
-        """Load system prompt from file."""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        possible_paths = [
-            os.path.join(script_dir, "system_prompt.txt"),
-            os.path.join(script_dir, "..", "system_prompt.txt"),
-            "./system_prompt.txt"
-        ]
-        system_prompt = None
-        for path in possible_paths:
-            try:
-                with open(path, "r") as f:
-                    system_prompt = f.read()
-                    break
-            except FileNotFoundError:
-                continue
-        if system_prompt is None:
-            raise RuntimeError("Could not find system_prompt.txt in any known location")
-        return system_prompt
+        """Load system prompt from file (read once per process)."""
+        return _read_system_prompt_file()
     
     def ensure_system_prompt(self, conversation: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -144,37 +172,144 @@ class LLMClient:
             RateLimitExceeded: If rate limit is hit.
             LLMError: For provider-independent errors (authentication, timeout, etc.).
         """
+        cache_key = self._response_cache_key(messages, tools, kwargs)
+        if cache_key is not None:
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
         try:
             response = self.provider.chat_completion(
                 messages=messages,
                 tools=tools,
                 **kwargs
             )
+            if cache_key is not None:
+                self._store_cached_response(cache_key, response)
             return response
         except RateLimitExceeded as e:
             # Re-raise for handling by caller (agent has special rate limit handling)
             raise
         except ProviderError as e:
-            # Map provider-specific errors to generic LLMError
-            error_mapping = {
-                AuthenticationError: "authentication_error",
-                ModelNotFoundError: "model_not_found",
-                TokenLimitExceededError: "token_limit_exceeded",
-                ProviderTimeoutError: "timeout",
-                InvalidConfigError: "invalid_config",
-                ProviderNotFoundError: "provider_not_found",
-                ToolFormatError: "tool_format_error",
-            }
-            error_type = "provider_error"
-            for provider_exception, generic_type in error_mapping.items():
-                if isinstance(e, provider_exception):
-                    error_type = generic_type
-                    break
-            raise LLMError(
-                error_type=error_type,
-                message=str(e),
-                original_exception=e
+            raise self._to_llm_error(e)
+    
+    def stream_chat_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ):
+        """
+        Make a streaming LLM chat completion request.
+        
+        Generator: yields partial deltas ({"content": ...} / {"reasoning": ...})
+        and returns the final LLM response object. When config.stream_responses
+        is disabled this makes a blocking call and yields nothing.
+        
+        Raises:
+            RateLimitExceeded: If rate limit is hit.
+            LLMError: For provider-independent errors (authentication, timeout, etc.).
+        """
+        if not getattr(self.config, 'stream_responses', False):
+            return self.chat_completion(messages=messages, tools=tools, **kwargs)
+        cache_key = self._response_cache_key(messages, tools, kwargs)
+        if cache_key is not None:
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+        try:
+            response = yield from self.provider.stream_chat_completion(
+                messages=messages,
+                tools=tools,
+                **kwargs
             )
+            if cache_key is not None:
+                self._store_cached_response(cache_key, response)
+            return response
+        except RateLimitExceeded:
+            raise
+        except ProviderError as e:
+            raise self._to_llm_error(e)
+    
+    def _response_cache_key(self, messages, tools, kwargs) -> Optional[str]:
+        """Return the response cache key for a request, or None if it must not be cached."""
+        mode = getattr(self.config, 'response_cache', 'off')
+        if mode == 'off':
+            return None
+        if mode == 'deterministic' and kwargs.get('temperature', self.config.temperature) != 0:
+            return None
+        request = {
+            "provider": self.config.provider_type,
+            "base_url": self.config.base_url,
+            "model": self.config.model,
+            "messages": messages,
+            "tools": tools,
+            "kwargs": kwargs,
+        }
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(request, default=str, option=orjson.OPT_SORT_KEYS)
+            else:
+                payload = json.dumps(request, sort_keys=True, default=str).encode()
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def _get_cached_response(cache_key: str):
+        """Return a copy of a cached response with zero usage, or None on a miss."""
+        with _response_cache_lock:
+            response = _response_cache.get(cache_key)
+            if response is None:
+                return None
+            _response_cache.move_to_end(cache_key)
+        debug_log(f"Response cache hit ({cache_key[:12]})", level="DEBUG", component="LLMClient")
+        # No tokens were billed for this call, so don't count them again
+        return dataclasses.replace(
+            response,
+            tool_calls=copy.deepcopy(response.tool_calls),
+            usage={},
+            latency_ms=0.0,
+        )
+
+    @staticmethod
+    def _store_cached_response(cache_key: str, response) -> None:
+        """Remember a response, evicting the least recently used entry when full."""
+        if not dataclasses.is_dataclass(response):
+            return
+        # Drop the SDK object and detach tool_calls from the caller's copy
+        entry = dataclasses.replace(
+            response,
+            tool_calls=copy.deepcopy(response.tool_calls),
+            raw_response=None,
+        )
+        with _response_cache_lock:
+            _response_cache[cache_key] = entry
+            _response_cache.move_to_end(cache_key)
+            while len(_response_cache) > _RESPONSE_CACHE_MAXSIZE:
+                _response_cache.popitem(last=False)
+
+    @staticmethod
+    def _to_llm_error(e: ProviderError) -> LLMError:
+        """Map provider-specific errors to generic LLMError."""
+        error_mapping = {
+            AuthenticationError: "authentication_error",
+            ModelNotFoundError: "model_not_found",
+            TokenLimitExceededError: "token_limit_exceeded",
+            ProviderTimeoutError: "timeout",
+            InvalidConfigError: "invalid_config",
+            ProviderNotFoundError: "provider_not_found",
+            ToolFormatError: "tool_format_error",
+        }
+        error_type = "provider_error"
+        for provider_exception, generic_type in error_mapping.items():
+            if isinstance(e, provider_exception):
+                error_type = generic_type
+                break
+        return LLMError(
+            error_type=error_type,
+            message=str(e),
+            original_exception=e
+        )
     
     def format_tools(self, tool_definitions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
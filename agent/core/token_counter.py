@@ -8,6 +8,7 @@ import json
 import tiktoken
 from typing import Optional, List, Dict, Any
 from agent.logging.debug_log import debug_log
+from session.utils import estimate_message_tokens
 
 
 class TokenCounter:
@@ -22,6 +23,8 @@ class TokenCounter:
         """
         self.config = config
         self._token_encoder = None
+        # (tool_definitions list, estimated tokens) - the agent passes the same list every turn
+        self._tool_tokens_cache = None
     
     def _get_encoder(self):
         """Get or initialize token encoder."""
@@ -46,17 +49,13 @@ class TokenCounter:
         """
         # DEBUG: Add logging for token counting
         debug_log('token_counter', f"estimate_tokens called with type: {type(text_or_message)}")
-        if isinstance(text_or_message, dict):
-            content_preview = str(text_or_message.get('content', ''))[:100].replace('\n', ' ') if 'content' in text_or_message else 'no content'
-            debug_log('token_counter', f"  role: {text_or_message.get('role', 'unknown')}, content preview: {content_preview}")
         
         encoder = self._get_encoder()
         
         if isinstance(text_or_message, dict):
-            # Convert dict to JSON string for tokenization (more accurate for API)
-            text = json.dumps(text_or_message)
-        else:
-            text = str(text_or_message)
+            # Tokenize the dict's JSON form (more accurate for API); memoized per message
+            return estimate_message_tokens(text_or_message, encoder)
+        text = str(text_or_message)
         
         if encoder is not None:
             tokens = encoder.encode(text)
@@ -93,9 +92,7 @@ class TokenCounter:
         
         # Add tool definition tokens (crude estimate)
         if tool_definitions:
-            # JSON stringify and estimate
-            tools_json = json.dumps(tool_definitions)
-            total_tokens += len(tools_json) // 4
+            total_tokens += self._estimate_tool_tokens(tool_definitions)
         
         # Add some overhead for JSON structure, field names, etc.
         # OpenAI's actual token count includes JSON structure, field names, etc.
@@ -104,6 +101,17 @@ class TokenCounter:
         
         return total_tokens
     
+    def _estimate_tool_tokens(self, tool_definitions) -> int:
+        """Crude token estimate for tool definitions, memoized for an unchanged list."""
+        cache = self._tool_tokens_cache
+        if cache is not None and cache[0] is tool_definitions:
+            return cache[1]
+        # JSON stringify and estimate
+        tools_json = json.dumps(tool_definitions)
+        tokens = len(tools_json) // 4
+        self._tool_tokens_cache = (tool_definitions, tokens)
+        return tokens
+
     def get_model_context_window(self) -> int:
         """
         Get approximate context window size for the current model.
@@ -5,12 +5,24 @@ Extracted from agent.py to separate tool execution concerns.
 """
 
 import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 from pydantic import ValidationError
 from agent.logging.debug_log import debug_log
 
-from fast_json_repair import loads as repair_loads
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError,
+# so the repair fallback below handles both parsers identically.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 from tools.final import Final
 from tools.final_report import FinalReport
 from agent.core.turn_transaction import TurnTransaction
@@ -21,7 +33,9 @@ from tools.summarize_tool import SummarizeTool
 try:
     import sys
     import os
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + "/../../")
+    _project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if _project_root not in sys.path:
+        sys.path.insert(0, _project_root)
     from debug_pruning import (
         debug_log, log_session_history, log_history_provider_reconstruction,
         log_message_insertion, log_pruning_operation, log_token_count,
@@ -39,6 +53,25 @@ except ImportError:
     log_summary_operation = lambda *args, **kwargs: None
 
 
+# Upper bound on worker threads for a run of parallel-safe tool calls
+_MAX_PARALLEL_TOOLS = 8
+
+# Tool result cache bounds: entry count and age in seconds
+_TOOL_CACHE_MAXSIZE = 512
+_TOOL_CACHE_TTL = 300.0
+
+
+def _parse_arguments(arguments_str):
+    """Parse a tool call's JSON arguments (raises json.JSONDecodeError on bad JSON).
+
+    Argument-less calls often arrive as "" rather than "{}"; map those to {}
+    directly instead of going through a decode error and the repair pass.
+    """
+    if not arguments_str or arguments_str.isspace():
+        return {}
+    return _json_loads(arguments_str)
+
+
 class ToolExecutor:
     """Handles tool execution, JSON repair, and tool result processing."""
     
@@ -54,10 +87,17 @@ class ToolExecutor:
             security_available: Whether security module is available.
         """
         self.tool_classes = tool_classes
+        # Name -> class index so each tool call is an O(1) lookup (first match wins)
+        self._tool_by_name = {}
+        for cls in tool_classes:
+            self._tool_by_name.setdefault(cls.__name__, cls)
         self.config = config
         self.state = state
         self.logger = logger
         self.security_available = security_available
+        # (tool_name, canonical arguments) -> (timestamp, execution result)
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         
         if security_available:
             from thoughtmachine.security import CapabilityRegistry
@@ -107,7 +147,11 @@ class ToolExecutor:
                 turn_transaction.add_tool_result(message)
             else:
                 add_to_conversation_func(message)
-        for tool_call in tool_calls:
+
+        # index -> (arguments, execution result) for calls already run as part
+        # of a concurrent batch of parallel-safe tools
+        prefetched = {}
+        for index, tool_call in enumerate(tool_calls):
             tool_name = tool_call["function"]["name"]
             
             # Check if tool is allowed in current state
@@ -131,54 +175,72 @@ class ToolExecutor:
                 })
                 continue
             
-            arguments_str = tool_call["function"]["arguments"]
-            
-            try:
-                arguments = json.loads(arguments_str)
-            except json.JSONDecodeError:
+            if index in prefetched:
+                arguments, tool_execution_result = prefetched.pop(index)
+            else:
+                tool_execution_result = None
+                arguments_str = tool_call["function"]["arguments"]
+
                 try:
-                    arguments = repair_loads(arguments_str)
-                    if self.logger:
-                        self.logger.py_logger.info(f"JSON repaired for {tool_name}")
-                except Exception as e:
-                    tool_result = f"Invalid JSON in arguments: {e}. Raw: {arguments_str}"
-                    if self.logger:
-                        self.logger.log_error("JSON_DECODE_ERROR", f"Failed to parse JSON for {tool_name}: {e}")
-                    add_tool_result({
-                        "role": "tool",
-                        "tool_call_id": tool_call["id"],
-                        "content": tool_result
-                    })
-                    executed_tools.append({
-                        "name": tool_name,
-                        "arguments": {"error": "Invalid JSON", "raw": arguments_str},
-                        "result": tool_result
-                    })
-                    continue
+                    arguments = _parse_arguments(arguments_str)
+                except json.JSONDecodeError:
+                    try:
+                        # Imported on first use: only malformed JSON needs the repair library
+                        from fast_json_repair import loads as repair_loads
+                        # Already known not to be valid JSON, so skip repair's own loads() attempt
+                        arguments = repair_loads(arguments_str, skip_json_loads=True)
+                        if self.logger:
+                            self.logger.py_logger.info(f"JSON repaired for {tool_name}")
+                    except Exception as e:
+                        tool_result = f"Invalid JSON in arguments: {e}. Raw: {arguments_str}"
+                        if self.logger:
+                            self.logger.log_error("JSON_DECODE_ERROR", f"Failed to parse JSON for {tool_name}: {e}")
+                        add_tool_result({
+                            "role": "tool",
+                            "tool_call_id": tool_call["id"],
+                            "content": tool_result
+                        })
+                        executed_tools.append({
+                            "name": tool_name,
+                            "arguments": {"error": "Invalid JSON", "raw": arguments_str},
+                            "result": tool_result
+                        })
+                        continue
             
-            # Log tool call
-            if self.logger:
+            # Log tool call (calls in a concurrent batch were logged when it started)
+            if self.logger and tool_execution_result is None:
                 self.logger.log_tool_call(tool_name, arguments, tool_call["id"])
             
             # Find matching tool class
-            tool_class = next((cls for cls in self.tool_classes if cls.__name__ == tool_name), None)
+            tool_class = self._tool_by_name.get(tool_name)
             if not tool_class:
                 error_msg = f"Unknown tool: {tool_name}"
                 tool_result = error_msg
             else:
-                tool_execution_result = self._execute_single_tool(
-                    tool_class, 
-                    arguments, 
-                    tool_name, 
-                    agent_id,
-                    lambda: final_detected,
-                    lambda: final_content,
-                    lambda: user_interaction_requested,
-                    lambda: user_interaction_message,
-                    lambda: summary_requested,
-                    lambda: summary_text,
-                    lambda: summary_keep_recent_turns
-                )
+                if tool_execution_result is None:
+                    flag_getters = (
+                        lambda: final_detected,
+                        lambda: final_content,
+                        lambda: user_interaction_requested,
+                        lambda: user_interaction_message,
+                        lambda: summary_requested,
+                        lambda: summary_text,
+                        lambda: summary_keep_recent_turns
+                    )
+                    if getattr(tool_class, 'parallel_safe', False):
+                        prefetched = self._execute_parallel_run(
+                            tool_calls, index, tool_class, arguments, agent_id, flag_getters
+                        )
+                        if index in prefetched:
+                            tool_execution_result = prefetched.pop(index)[1]
+                    if tool_execution_result is None:
+                        tool_execution_result = self._execute_single_tool(
+                            tool_class,
+                            arguments,
+                            tool_name,
+                            agent_id,
+                            *flag_getters
+                        )
                 tool_result = tool_execution_result['result']
                 tool_type = tool_execution_result.get('tool_type', 'normal')
                 
@@ -217,7 +279,8 @@ class ToolExecutor:
             executed_tools.append({
                 "name": tool_name,
                 "arguments": arguments,
-                "result": tool_result
+                "result": tool_result,
+                "cached": bool(tool_class and tool_execution_result.get('cached'))
             })
         
         return (
@@ -229,6 +292,74 @@ class ToolExecutor:
             summary_keep_recent_turns if summary_requested else None
         )
     
+    def _execute_parallel_run(self, tool_calls, start, tool_class, arguments, agent_id, flag_getters):
+        """Execute the run of consecutive parallel-safe calls beginning at *start* concurrently.
+
+        The run stops at the first call that is not allowed, not parallel-safe
+        or has arguments needing repair, so ordering relative to any other tool
+        is unchanged. Returns {index: (arguments, execution result)}, or {}
+        when the run is a single call and should just execute inline.
+        """
+        batch = [(start, tool_calls[start]["function"]["name"], tool_class, arguments)]
+        for index in range(start + 1, len(tool_calls)):
+            function = tool_calls[index]["function"]
+            name = function["name"]
+            cls = self._tool_by_name.get(name)
+            if cls is None or not getattr(cls, 'parallel_safe', False) or not self.state.is_tool_allowed(name):
+                break
+            try:
+                batch.append((index, name, cls, _parse_arguments(function["arguments"])))
+            except json.JSONDecodeError:
+                break
+        if len(batch) < 2:
+            return {}
+
+        if self.logger:
+            for index, name, _, args in batch[1:]:
+                self.logger.log_tool_call(name, args, tool_calls[index]["id"])
+
+        def run(item):
+            _, name, cls, args = item
+            return self._execute_single_tool(cls, args, name, agent_id, *flag_getters)
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_TOOLS, len(batch))) as pool:
+            results = list(pool.map(run, batch))
+        return {item[0]: (item[3], result) for item, result in zip(batch, results)}
+
+    def _result_cache_key(self, tool_name: str, tool_args: Dict[str, Any]):
+        """Return the cache key for a call, or None if its arguments don't serialize."""
+        try:
+            if orjson is not None:
+                return (tool_name, orjson.dumps(tool_args, default=str, option=orjson.OPT_SORT_KEYS))
+            return (tool_name, json.dumps(tool_args, sort_keys=True, default=str))
+        except (TypeError, ValueError):
+            return None
+
+    def _get_cached_result(self, key) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached execution result for key, or None."""
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > _TOOL_CACHE_TTL:
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+        return dict(result, cached=True)
+
+    def _store_cached_result(self, key, result: Dict[str, Any]) -> None:
+        with self._result_cache_lock:
+            self._result_cache[key] = (time.monotonic(), result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > _TOOL_CACHE_MAXSIZE:
+                self._result_cache.popitem(last=False)
+
+    def clear_result_cache(self) -> None:
+        """Drop all cached tool results (a tool with side effects may have run)."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
     def _execute_single_tool(
         self,
         tool_class,
@@ -280,7 +411,17 @@ class ToolExecutor:
                     tool_result = f"Security check failed: {e}"
                     raise
             
-            tool_instance = tool_class(**tool_args)
+            # Read-only tools: reuse an identical earlier call's result
+            cache_enabled = getattr(self.config, 'tool_result_cache', False)
+            cache_key = None
+            if cache_enabled and getattr(tool_class, 'cacheable', False):
+                cache_key = self._result_cache_key(tool_name, tool_args)
+                if cache_key is not None:
+                    cached = self._get_cached_result(cache_key)
+                    if cached is not None:
+                        return cached
+
+            tool_instance = tool_class.model_validate(tool_args)
             # Set logger if available
             if self.logger:
                 # Set traditional Python logger
@@ -296,7 +437,13 @@ class ToolExecutor:
                     # Try to set agent logger if it's also an AgentLogger (unlikely)
                     if hasattr(self.logger, 'log_tool_debug') and hasattr(tool_instance, '_set_agent_logger'):
                         tool_instance._set_agent_logger(self.logger)
-            tool_result = tool_instance.execute()
+            try:
+                tool_result = tool_instance.execute()
+            finally:
+                # A tool that may modify state can change what cached reads
+                # returned; cleared afterwards so nothing cached meanwhile survives
+                if cache_enabled and tool_instance.modifies_state():
+                    self.clear_result_cache()
             
             # Check for special tool types
             if isinstance(tool_instance, Final) or isinstance(tool_instance, FinalReport):
@@ -319,10 +466,13 @@ class ToolExecutor:
                     'summary_keep_recent_turns': tool_instance.keep_recent_turns
                 }
             else:
-                return {
+                result = {
                     'result': tool_result,
                     'tool_type': 'normal'
                 }
+                if cache_key is not None:
+                    self._store_cached_result(cache_key, result)
+                return result
             
         except ValidationError as e:
             return {
@@ -36,6 +36,7 @@ class EventType(enum.Enum):
     LLM_REQUEST = "llm_request"
     LLM_RESPONSE = "llm_response"
     RAW_RESPONSE = "raw_response"
+    STREAM_DELTA = "stream_delta"  # partial content/reasoning while a response streams
     
     # Tool execution
     TOOL_CALL = "tool_call"
@@ -399,6 +400,7 @@ def create_event(
         EventType.TOKEN_UPDATE: BaseEvent,
         EventType.EXECUTION_STATE_CHANGE: BaseEvent,
         EventType.SESSION_STATE_CHANGE: BaseEvent,
+        EventType.STREAM_DELTA: BaseEvent,
     }
     
     event_class = event_class_map.get(event_type, BaseEvent)
@@ -11,11 +11,18 @@ import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import fnmatch
+import functools
 import gc
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from agent.config.models import AgentConfig
 import agent.knowledge.dependencies as deps
+
+# blake3 is optional; hashlib.blake2b is used for content digests without it
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 import atexit
 import signal
 import sys
@@ -86,6 +93,21 @@ def split_text_with_overlap(text: str, chunk_size: int = 1500, chunk_overlap: in
     return chunks
 
 
+def _file_digest(path: str) -> Optional[str]:
+    """Return a hex content digest of a file, or None if it can't be read."""
+    hasher = blake3.blake3() if blake3 is not None else hashlib.blake2b()
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(65536)
+                if not block:
+                    break
+                hasher.update(block)
+    except OSError:
+        return None
+    return hasher.hexdigest()
+
+
 def compute_workspace_hash(workspace_path: str) -> str:
     """
     Compute a deterministic hash for the workspace.
@@ -101,6 +123,9 @@ def compute_workspace_hash(workspace_path: str) -> str:
 
 _GITIGNORE_CACHE = {}
 
+# Worker threads used to read and parse files in chunk_codebase
+_PARSE_WORKERS = 8
+
 
 def load_gitignore_spec(workspace_path: Path):
     """Load .gitignore patterns from workspace using pathspec."""
@@ -165,37 +190,37 @@ def load_gitignore_spec(workspace_path: Path):
         return None
 
 
+# Common cache/build directories never indexed
+_SKIP_DIRS = frozenset({
+    '__pycache__', '.git', '.svn', '.hg', '.idea', '.vscode',
+    'node_modules', 'build', 'dist', 'target', 'venv', '.env',
+    '.pytest_cache', '.mypy_cache', '.coverage'
+})
+
+# Common binary/archive extensions never indexed
+_SKIP_EXTENSIONS = frozenset({
+    '.pyc', '.pyo', '.pyd', '.so', '.dll', '.exe',
+    '.zip', '.tar', '.gz', '.bz2', '.xz', '.rar',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt',
+    '.pptx', '.mp3', '.mp4', '.avi', '.mov', '.wmv',
+    '.db', '.sqlite', '.sqlite3'
+})
+
+
 def should_skip_file(file_path: Path, workspace_path: Path) -> bool:
     """
     Determine if a file should be skipped based on .gitignore patterns and heuristics.
     """
-    # Skip hidden files and directories (except .gitignore itself)
-    if any(part.startswith('.') for part in file_path.parts):
-        # Allow .gitignore files to be read
-        if file_path.name == '.gitignore':
-            pass
-        else:
+    # Skip common cache/build directories and hidden files and directories
+    # (except .gitignore itself), in one pass over the path parts
+    is_gitignore = file_path.name == '.gitignore'
+    for part in file_path.parts:
+        if part in _SKIP_DIRS or (part.startswith('.') and not is_gitignore):
             return True
     
-    # Skip common cache/build directories
-    skip_dirs = {
-        '__pycache__', '.git', '.svn', '.hg', '.idea', '.vscode',
-        'node_modules', 'build', 'dist', 'target', 'venv', '.env',
-        '.pytest_cache', '.mypy_cache', '.coverage'
-    }
-    if any(part in skip_dirs for part in file_path.parts):
-        return True
-    
     # Skip common binary/archive extensions
-    skip_extensions = {
-        '.pyc', '.pyo', '.pyd', '.so', '.dll', '.exe',
-        '.zip', '.tar', '.gz', '.bz2', '.xz', '.rar',
-        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico',
-        '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt',
-        '.pptx', '.mp3', '.mp4', '.avi', '.mov', '.wmv',
-        '.db', '.sqlite', '.sqlite3'
-    }
-    if file_path.suffix.lower() in skip_extensions:
+    if file_path.suffix.lower() in _SKIP_EXTENSIONS:
         return True
     
     # Check against .gitignore patterns if available
@@ -216,12 +241,61 @@ def should_skip_file(file_path: Path, workspace_path: Path) -> bool:
     return False
 
 
+def iter_workspace_files(workspace_path: Path):
+    """
+    Yield (os.DirEntry, relative posix path) for every file should_skip_file keeps.
+
+    Same result as filtering workspace_path.rglob("*") through should_skip_file,
+    but hidden and cache/build directories are pruned when reached instead of
+    being walked entry by entry, and file checks are plain string tests.
+    """
+    # should_skip_file tests every part of the full path, so a workspace that
+    # itself lives under a hidden or skipped directory yields nothing
+    if any(part.startswith('.') or part in _SKIP_DIRS for part in workspace_path.parts):
+        return
+    spec = load_gitignore_spec(workspace_path)
+    
+    stack = [(str(workspace_path), "")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Could not scan directory {dir_path}: {e}")
+            continue
+        for entry in entries:
+            name = entry.name
+            if name in _SKIP_DIRS:
+                continue
+            rel_path = prefix + name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith('.'):
+                        stack.append((entry.path, rel_path + '/'))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if name.startswith('.') and name != '.gitignore':
+                continue
+            if os.path.splitext(name)[1].lower() in _SKIP_EXTENSIONS:
+                continue
+            if spec is not None and spec.match_file(rel_path):
+                logger.debug(f"File {rel_path} matches gitignore pattern")
+                continue
+            yield entry, rel_path
+
+
+@functools.lru_cache(maxsize=1)
 def get_supported_languages() -> Dict[str, Any]:
     """
     Get tree-sitter language parsers for supported languages.
     
     Returns a dict mapping file extensions to language parsers.
     Currently supports Python, JavaScript, TypeScript, Java, Go, and Rust.
+    Loaded once per process (it is called for every parsed file).
     """
     if not deps.DEPENDENCIES.get("tree_sitter", False):
         return {}
@@ -826,6 +900,43 @@ def _extract_rust_chunks(content: str, root_node, file_path: Path, language: str
     return chunks
 
 
+# File extension -> language for indexed files
+_SUPPORTED_EXTENSIONS = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.cs': 'csharp',
+    '.fs': 'fsharp',
+    '.vb': 'vb',
+    '.sql': 'sql',
+    '.html': 'html',
+    '.css': 'css',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.toml': 'toml',
+    '.xml': 'xml',
+    '.sh': 'bash',
+    '.bash': 'bash',
+    '.md': 'markdown',
+    '.txt': 'text',
+}
+
+
 def chunk_codebase(workspace_path: Path, config: AgentConfig) -> List[Dict[str, Any]]:
     """
     Walk through workspace and chunk all supported files.
@@ -833,50 +944,24 @@ def chunk_codebase(workspace_path: Path, config: AgentConfig) -> List[Dict[str,
     Returns a list of chunks ready for embedding.
     """
     chunks = []
-    supported_extensions = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.jsx': 'javascript',
-        '.ts': 'typescript',
-        '.tsx': 'typescript',
-        '.java': 'java',
-        '.c': 'c',
-        '.cpp': 'cpp',
-        '.h': 'c',
-        '.hpp': 'cpp',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.rb': 'ruby',
-        '.php': 'php',
-        '.swift': 'swift',
-        '.kt': 'kotlin',
-        '.scala': 'scala',
-        '.cs': 'csharp',
-        '.fs': 'fsharp',
-        '.vb': 'vb',
-        '.sql': 'sql',
-        '.html': 'html',
-        '.css': 'css',
-        '.json': 'json',
-        '.yaml': 'yaml',
-        '.yml': 'yaml',
-        '.toml': 'toml',
-        '.xml': 'xml',
-        '.sh': 'bash',
-        '.bash': 'bash',
-        '.md': 'markdown',
-        '.txt': 'text',
-    }
-    
-    for ext, lang in supported_extensions.items():
-        for file_path in workspace_path.rglob(f"*{ext}"):
-            if should_skip_file(file_path, workspace_path):
-                continue
-            
-            relative_path = file_path.relative_to(workspace_path)
-            logger.debug(f"Processing {relative_path}")
-            
-            file_chunks = parse_file_with_tree_sitter(file_path, lang, config)
+    
+    # One pruned walk instead of an rglob per extension
+    work_items = []
+    for entry, relative_path in iter_workspace_files(workspace_path):
+        lang = _SUPPORTED_EXTENSIONS.get(os.path.splitext(entry.name)[1])
+        if lang is None:
+            continue
+        work_items.append((Path(entry.path), lang, relative_path))
+    
+    def parse_one(item):
+        file_path, lang, relative_path = item
+        logger.debug(f"Processing {relative_path}")
+        return parse_file_with_tree_sitter(file_path, lang, config)
+    
+    # Reading files is I/O bound, so overlap it across a few threads; map()
+    # keeps the chunks in walk order
+    with ThreadPoolExecutor(max_workers=_PARSE_WORKERS) as executor:
+        for file_chunks in executor.map(parse_one, work_items):
             chunks.extend(file_chunks)
     
     return chunks
@@ -942,6 +1027,20 @@ def create_or_get_chroma_collection(workspace_hash: str, config: AgentConfig, fo
         logger.info(f"Created new collection: {collection_name}")
     
     return collection
+
+
+@functools.lru_cache(maxsize=2)
+def _load_embedding_model(model_name: str, device: str):
+    """Load a SentenceTransformer once per (model, device) for the process.
+
+    incremental_index embeds each modified file separately, so without this
+    the model was reloaded from disk for every file.
+    """
+    from sentence_transformers import SentenceTransformer
+    logger.info(f"Loading embedding model: {model_name} (device: {device})")
+    return SentenceTransformer(model_name, device=device)
+
+
 def embed_chunks_batched(chunks: List[Dict[str, Any]], config: AgentConfig, collection, workspace_hash: str, batch_size: int = 32, truncate_dim: int = 256):
     """
     Embed chunks using sentence-transformers in batches and add to collection.
@@ -957,7 +1056,6 @@ def embed_chunks_batched(chunks: List[Dict[str, Any]], config: AgentConfig, coll
     if not deps.DEPENDENCIES.get("sentence_transformers", False):
         raise ImportError("sentence_transformers is not available")
     
-    from sentence_transformers import SentenceTransformer
     import torch
 
     # Load model with GPU acceleration if available
@@ -965,10 +1063,9 @@ def embed_chunks_batched(chunks: List[Dict[str, Any]], config: AgentConfig, coll
     
     # Check for CUDA availability
     device = 'cuda' if torch.cuda.is_available() else 'cpu'
-    logger.info(f"Loading embedding model: {model_name} (device: {device})")
     
-    # Load model with appropriate device
-    model = SentenceTransformer(model_name, device=device)
+    # Load model with appropriate device (cached across calls)
+    model = _load_embedding_model(model_name, device)
     total_chunks = len(chunks)
     processed = 0
     
@@ -1004,10 +1101,10 @@ def embed_chunks_batched(chunks: List[Dict[str, Any]], config: AgentConfig, coll
         if (i // batch_size) % 10 == 0 or i + batch_size >= total_chunks:
             logger.info(f"Processed {processed}/{total_chunks} chunks ({processed/total_chunks*100:.1f}%)")
         
-        # Force garbage collection to free memory
+        # Force garbage collection to free memory (collect() is synchronous,
+        # so no pause is needed afterwards)
         del embeddings
         gc.collect()
-        time.sleep(0.05)  # Small pause to let GC work
     
     logger.info(f"Finished embedding all {total_chunks} chunks")
     return processed
@@ -1082,6 +1179,18 @@ def index_codebase(workspace_path: str, config: AgentConfig, force: bool = False
         return False, msg
 
 
+def _save_index_state(state_file: Path, index_state: Dict[str, Any]) -> None:
+    """Write the incremental index state file (failures are logged, not raised)."""
+    try:
+        import json
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump(index_state, f, indent=2)
+        logger.info(f"Saved index state to: {state_file}")
+    except Exception as e:
+        logger.warning(f"Failed to save index state: {e}")
+
+
 def incremental_index(workspace_path: str, config: AgentConfig) -> Tuple[bool, str]:
     """
     Incrementally update an existing codebase index.
@@ -1132,55 +1241,51 @@ def incremental_index(workspace_path: str, config: AgentConfig) -> Tuple[bool, s
             except Exception as e:
                 logger.warning(f"Failed to load index state: {e}. Creating new state.")
         
-        # Get collection to check existing documents
-        collection = create_or_get_chroma_collection(workspace_hash, config, force=False)
-        existing_count = collection.count()
-        logger.info(f"Collection currently contains {existing_count} documents")
-        
         # Scan for modified files
         logger.info("Scanning for modified files...")
         modified_files = []
         deleted_files = []
         
         # Track current file modifications
-        for file_path in workspace_path.rglob("*"):
-            if should_skip_file(file_path, workspace_path):
+        seen_keys = set()
+        touched_files = 0  # content unchanged, only the stored mtime was refreshed
+        for entry, rel_path in iter_workspace_files(workspace_path):
+            # State keys use native separators (as str(Path.relative_to) did)
+            file_key = rel_path if os.sep == '/' else rel_path.replace('/', os.sep)
+            seen_keys.add(file_key)
+            
+            # One stat per file (follows symlinks, like Path.stat)
+            try:
+                st = entry.stat()
+            except OSError as e:
+                logger.warning(f"Could not stat file {entry.path}: {e}")
                 continue
+            mtime = st.st_mtime
+            file_size = st.st_size
             
-            if not file_path.is_file():
+            # Quick check: unchanged size and mtime means the file is unchanged
+            old_info = index_state.get(file_key)
+            if old_info is not None and old_info["size"] == file_size and old_info["mtime"] == mtime:
                 continue
             
-            # Get file stats
-            try:
-                mtime = file_path.stat().st_mtime
-                file_size = file_path.stat().st_size
-                file_info = {
-                    "path": str(file_path.relative_to(workspace_path)),
-                    "mtime": mtime,
-                    "size": file_size
-                }
-                
-                # Check if file has changed
-                file_key = str(file_path.relative_to(workspace_path))
-                if file_key in index_state:
-                    old_info = index_state[file_key]
-                    if old_info["mtime"] == mtime and old_info["size"] == file_size:
-                        # File unchanged, skip
-                        continue
-                
-                # File is new or modified
-                modified_files.append(file_path)
-                # Update state
-                index_state[file_key] = {"mtime": mtime, "size": file_size}
-                
-            except Exception as e:
-                logger.warning(f"Could not stat file {file_path}: {e}")
+            # Same size but a new mtime (touch, git checkout): compare content
+            # before paying for re-parsing and re-embedding the file
+            digest = _file_digest(entry.path)
+            if (old_info is not None and old_info["size"] == file_size
+                    and digest is not None and old_info.get("hash") == digest):
+                old_info["mtime"] = mtime
+                touched_files += 1
                 continue
+            
+            # File is new or modified; keep the walk's strings so processing
+            # needs no Path arithmetic (suffix, relative_to) per file
+            modified_files.append((file_key, entry.path))
+            # Update state
+            index_state[file_key] = {"mtime": mtime, "size": file_size, "hash": digest}
         
-        # Identify deleted files (present in state but not on disk)
+        # Identify deleted files (present in state but not found by the walk)
         for file_key in list(index_state.keys()):
-            full_path = workspace_path / file_key
-            if not full_path.exists():
+            if file_key not in seen_keys:
                 deleted_files.append(file_key)
                 # Remove from state
                 del index_state[file_key]
@@ -1188,10 +1293,18 @@ def incremental_index(workspace_path: str, config: AgentConfig) -> Tuple[bool, s
         logger.info(f"Found {len(modified_files)} modified/new files and {len(deleted_files)} deleted files")
         
         if not modified_files and not deleted_files:
+            if touched_files:
+                _save_index_state(state_file, index_state)
             msg = "No changes detected. Index is up to date."
             logger.info(msg)
             return True, msg
         
+        # Open the collection only once there is work to do, so an up-to-date
+        # workspace costs a directory walk and never starts the Chroma client
+        collection = create_or_get_chroma_collection(workspace_hash, config, force=False)
+        existing_count = collection.count()
+        logger.info(f"Collection currently contains {existing_count} documents")
+        
         # Delete documents for removed files
         if deleted_files:
             logger.info(f"Removing {len(deleted_files)} deleted files from index...")
@@ -1213,29 +1326,15 @@ def incremental_index(workspace_path: str, config: AgentConfig) -> Tuple[bool, s
         
         # Process modified/new files
         total_chunks = 0
-        for file_path in modified_files:
+        for file_key, file_path in modified_files:
             try:
                 # Determine language from extension
-                ext = file_path.suffix.lower()
-                supported_extensions = {
-                    '.py': 'python', '.js': 'javascript', '.jsx': 'javascript',
-                    '.ts': 'typescript', '.tsx': 'typescript', '.java': 'java',
-                    '.c': 'c', '.cpp': 'cpp', '.h': 'c', '.hpp': 'cpp',
-                    '.go': 'go', '.rs': 'rust', '.rb': 'ruby', '.php': 'php',
-                    '.swift': 'swift', '.kt': 'kotlin', '.scala': 'scala',
-                    '.cs': 'csharp', '.fs': 'fsharp', '.vb': 'vb', '.sql': 'sql',
-                    '.html': 'html', '.css': 'css', '.json': 'json',
-                    '.yaml': 'yaml', '.yml': 'yaml', '.toml': 'toml', '.xml': 'xml',
-                    '.sh': 'bash', '.bash': 'bash', '.md': 'markdown', '.txt': 'text'
-                }
-                
-                if ext not in supported_extensions:
+                ext = os.path.splitext(file_key)[1].lower()
+                language = _SUPPORTED_EXTENSIONS.get(ext)
+                if language is None:
                     continue
                 
-                language = supported_extensions[ext]
-                
                 # First, remove existing chunks for this file (if any)
-                file_key = str(file_path.relative_to(workspace_path))
                 existing_results = collection.get(
                     where={"file_path": {"$contains": file_key}}
                 )
@@ -1244,7 +1343,7 @@ def incremental_index(workspace_path: str, config: AgentConfig) -> Tuple[bool, s
                     logger.debug(f"Removed {len(existing_results['ids'])} existing chunks for {file_key}")
                 
                 # Parse and create new chunks
-                file_chunks = parse_file_with_tree_sitter(file_path, language, config)
+                file_chunks = parse_file_with_tree_sitter(Path(file_path), language, config)
                 if not file_chunks:
                     continue
                 
@@ -1258,14 +1357,7 @@ def incremental_index(workspace_path: str, config: AgentConfig) -> Tuple[bool, s
                 continue
         
         # Save updated state
-        try:
-            import json
-            state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(state_file, 'w', encoding='utf-8') as f:
-                json.dump(index_state, f, indent=2)
-            logger.info(f"Saved index state to: {state_file}")
-        except Exception as e:
-            logger.warning(f"Failed to save index state: {e}")
+        _save_index_state(state_file, index_state)
         
         # Count total documents
         final_count = collection.count()
@@ -374,16 +374,21 @@ class AgentLogger:
             try:
                 self._file_handle.close()
                 
-                # Create backup
+                # Create backup; os.replace overwrites the oldest backup on
+                # every platform and a missing file needs no separate probe
                 for i in range(self.max_backup_files - 1, 0, -1):
                     old_file = f"{self.log_file_path}.{i}"
                     new_file = f"{self.log_file_path}.{i + 1}"
-                    if os.path.exists(old_file):
-                        os.rename(old_file, new_file)
+                    try:
+                        os.replace(old_file, new_file)
+                    except FileNotFoundError:
+                        pass
                 
                 # Move current to .1
-                if os.path.exists(self.log_file_path):
-                    os.rename(self.log_file_path, f"{self.log_file_path}.1")
+                try:
+                    os.replace(self.log_file_path, f"{self.log_file_path}.1")
+                except FileNotFoundError:
+                    pass
                 
                 # Open new file
                 self._file_handle = open(self.log_file_path, 'a', encoding='utf-8')
@@ -45,6 +45,7 @@ class RefactoredAgentPresenter(QObject):
     error_occurred = pyqtSignal(str, str)
     config_changed = pyqtSignal(dict)
     conversation_changed = pyqtSignal()
+    response_streamed = pyqtSignal(str)
 
     def __init__(self):
         """Initialize refactored presenter with modular architecture."""
@@ -84,6 +85,7 @@ class RefactoredAgentPresenter(QObject):
         self.gui_integration.error_occurred.connect(self.error_occurred)
         self.gui_integration.config_changed.connect(self.config_changed)
         self.gui_integration.conversation_changed.connect(self.conversation_changed)
+        self.gui_integration.response_streamed.connect(self.response_streamed)
         # Connect controller events
         self.controller.event_occurred.connect(self._handle_controller_event)
         self.controller.conversation_updated.connect(self._on_conversation_change)
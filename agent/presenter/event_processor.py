@@ -30,6 +30,10 @@ class EventProcessor:
         self.state_bridge = state_bridge
         self.session_lifecycle = session_lifecycle
         self.gui_integration = gui_integration
+        # Partial response of the turn currently streaming: (turn, content parts, reasoning parts)
+        self._stream_turn = None
+        self._stream_content = []
+        self._stream_reasoning = []
         
         debug_log(f"Initialized", level="DEBUG", component="EventProcessor")
     
@@ -40,6 +44,13 @@ class EventProcessor:
         Args:
             event: Event dictionary from AgentController
         """
+        if event.get("type") == "stream_delta":
+            # One event per streamed chunk: skip typed conversion and logging
+            self._process_stream_delta_event(event)
+            return
+        # Any other event means the streamed response (if any) has been assembled
+        self._stream_turn = None
+
         # Convert to typed event for consistent handling
         typed_event = ev.convert_from_legacy_format(event)
         event_type = typed_event.type.value
@@ -98,6 +109,26 @@ class EventProcessor:
         if self.gui_integration:
             self.gui_integration.emit_status_message(f"Event: {event_type}")
     
+    def _process_stream_delta_event(self, event: Dict[str, Any]) -> None:
+        """Accumulate a streamed chunk and publish the partial response."""
+        event_session_id = event.get("session_id")
+        current_id = self.state_bridge.current_session_id
+        if event_session_id is not None and current_id and str(event_session_id) != str(current_id):
+            return
+        turn = event.get("turn")
+        if turn != self._stream_turn:
+            self._stream_turn = turn
+            self._stream_content = []
+            self._stream_reasoning = []
+        if event.get("content"):
+            self._stream_content.append(event["content"])
+        if event.get("reasoning"):
+            self._stream_reasoning.append(event["reasoning"])
+        if self.gui_integration:
+            # Show the answer once it starts; until then show the reasoning
+            parts = self._stream_content or self._stream_reasoning
+            self.gui_integration.emit_response_streamed("".join(parts))
+    
     def _process_turn_event(self, event: Dict[str, Any]) -> None:
         """Process a turn event."""
         # Update token counts
@@ -25,6 +25,7 @@ class GUIIntegration(QObject):
         error_occurred(error: str, traceback: str): Emitted for errors
         config_changed(config: dict): Emitted when configuration changes
         conversation_changed(): Emitted when conversation changes
+        response_streamed(text: str): Emitted with the partial response while it streams
     """
     
     # Signals
@@ -36,6 +37,7 @@ class GUIIntegration(QObject):
     error_occurred = pyqtSignal(str, str)
     config_changed = pyqtSignal(dict)
     conversation_changed = pyqtSignal()
+    response_streamed = pyqtSignal(str)
     
     def __init__(self):
         super().__init__()
@@ -81,3 +83,7 @@ class GUIIntegration(QObject):
         """Emit conversation_changed signal."""
         self.conversation_changed.emit()
 
+    def emit_response_streamed(self, text: str) -> None:
+        """Emit response_streamed signal."""
+        self.response_streamed.emit(text)
+
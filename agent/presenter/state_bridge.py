@@ -107,11 +107,10 @@ class StateBridge:
             )
         
         # Create tools list from enabled tool names
-        enabled_tools = config.get("enabled_tools", [])
-        tool_classes = []
-        for tool_cls in SIMPLIFIED_TOOL_CLASSES:
-            if tool_cls.__name__ in enabled_tools:
-                tool_classes.append(tool_cls)
+        # Set lookup keeps this linear in the number of tools (the config holds a list)
+        enabled_tools = set(config.get("enabled_tools", []))
+        tool_classes = [tool_cls for tool_cls in SIMPLIFIED_TOOL_CLASSES
+                        if tool_cls.__name__ in enabled_tools]
         
         # Build agent_kwargs with proper field mapping
         agent_kwargs = {}
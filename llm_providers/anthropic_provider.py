@@ -47,6 +47,8 @@ class AnthropicProvider(LLMProvider):
         )
         
         self.converter = ToolFormatConverter()
+        # (source tools list, converted tools) - the agent sends the same list every turn
+        self._converted_tools = None
     
     def chat_completion(
         self, 
@@ -83,11 +85,18 @@ class AnthropicProvider(LLMProvider):
             }
             
             if system_msg:
-                api_kwargs["system"] = system_msg
+                # Mark the system prompt as a cache breakpoint: Anthropic only
+                # caches prefixes (tools + system) that are explicitly marked,
+                # and ours is identical on every turn of a session.
+                api_kwargs["system"] = [{
+                    "type": "text",
+                    "text": system_msg,
+                    "cache_control": {"type": "ephemeral"}
+                }]
             
             # Add tools if provided
             if tools:
-                api_kwargs["tools"] = self.converter.to_anthropic(tools)
+                api_kwargs["tools"] = self._to_anthropic_tools(tools)
             
             # Make API call
             logger.debug(f"Anthropic API call: model={api_kwargs.get('model')}, temperature={api_kwargs.get('temperature')}, max_tokens={api_kwargs.get('max_tokens')}, tools_count={len(tools) if tools else 0}, api_key={self.config.api_key}")
@@ -181,6 +190,15 @@ class AnthropicProvider(LLMProvider):
                 provider_error.raw_response = e.response
             raise provider_error
     
+    def _to_anthropic_tools(self, tools: List[Dict]) -> List[Dict]:
+        """Convert tools to Anthropic format, reusing the result for an unchanged list."""
+        cached = self._converted_tools
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        converted = self.converter.to_anthropic(tools)
+        self._converted_tools = (tools, converted)
+        return converted
+    
     def parse_response(self, raw_response: Any, start_time: float) -> LLMResponse:
         """Parse Anthropic-specific response format """
         latency = (time.time() - start_time) * 1000
@@ -253,10 +271,17 @@ class AnthropicProvider(LLMProvider):
         # Extract usage
         usage = {}
         if hasattr(raw_response, 'usage'):
+            # With prompt caching, input_tokens only counts the uncached part;
+            # add cache reads/writes back so prompt_tokens is the full prompt size.
+            prompt_tokens = (
+                raw_response.usage.input_tokens
+                + (getattr(raw_response.usage, 'cache_read_input_tokens', None) or 0)
+                + (getattr(raw_response.usage, 'cache_creation_input_tokens', None) or 0)
+            )
             usage = {
-                "prompt_tokens": raw_response.usage.input_tokens,
+                "prompt_tokens": prompt_tokens,
                 "completion_tokens": raw_response.usage.output_tokens,
-                "total_tokens": raw_response.usage.input_tokens + raw_response.usage.output_tokens
+                "total_tokens": prompt_tokens + raw_response.usage.output_tokens
             }
         
         return LLMResponse(
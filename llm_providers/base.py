@@ -3,7 +3,7 @@ Abstract base classes for LLM providers.
 Implements the Adapter pattern for provider abstraction.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Generator
 from dataclasses import dataclass
 import time
 import logging
@@ -72,6 +72,21 @@ class LLMProvider(ABC):
         """
         pass
     
+    def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict]] = None,
+        **kwargs
+    ) -> Generator[Dict[str, str], None, LLMResponse]:
+        """
+        Streaming completion - yields partial deltas ({"content": ...} or
+        {"reasoning": ...}) and returns the final LLMResponse.
+        Providers without streaming support yield nothing and fall back to
+        a blocking chat_completion call.
+        """
+        yield from ()
+        return self.chat_completion(messages, tools=tools, **kwargs)
+    
     @abstractmethod
     def count_tokens(self, messages: List[Dict], tools: Optional[List] = None) -> int:
         """Token counting for cost tracking"""
@@ -2,13 +2,15 @@
 OpenAI-compatible provider implementation.
 Works with OpenAI, DeepSeek, OpenCode/Big Pickle, and any OpenAI-compatible API.
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Generator
 import time
 import logging
 import os
+import re
 import sys
+import functools
 
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError
+from openai import OpenAI, APIError, RateLimitError, APIConnectionError, BadRequestError, UnprocessableEntityError
 import tiktoken
 
 from .base import LLMProvider, ProviderConfig, LLMResponse
@@ -19,6 +21,78 @@ logger = logging.getLogger(__name__)
 if os.environ.get('DEBUG_OPENAI'):
     logger.setLevel(logging.DEBUG)
 
+
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(api_key, base_url, timeout, max_retries, default_headers):
+    """Return a shared OpenAI client for these connection settings.
+
+    Each client owns an httpx connection pool; reusing it across Agent
+    instances (restart, new session) avoids a fresh TCP+TLS handshake.
+    default_headers is a sorted tuple of items so the arguments are hashable.
+    """
+    client_kwargs = {
+        "api_key": api_key,
+        "timeout": timeout,
+        "max_retries": max_retries,
+    }
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    if default_headers:
+        client_kwargs["default_headers"] = dict(default_headers)
+    return OpenAI(**client_kwargs)
+
+
+# <think>...</think> blocks some models inline in content instead of a reasoning field
+_THINK_RE = re.compile(r'<think>(.*?)</think>', flags=re.DOTALL)
+
+# Attribute names providers use for reasoning output, in priority order
+_REASONING_FIELDS = ('reasoning_content', 'reasoning', 'thinking')
+
+
+def _field_values(obj) -> Dict[str, Any]:
+    """Return an SDK object's field values as a plain dict.
+
+    Provider-specific fields (reasoning_content etc.) are pydantic extras,
+    which live in __pydantic_extra__ rather than __dict__. Reading both once
+    avoids a getattr per field, and the AttributeError raised internally
+    for every field a provider doesn't send.
+    """
+    fields = getattr(obj, '__dict__', None)
+    if fields is None:
+        return {}
+    extra = getattr(obj, '__pydantic_extra__', None)
+    if extra:
+        fields = {**fields, **extra}
+    return fields
+
+
+def _reasoning_from(fields: Dict[str, Any]) -> Optional[str]:
+    """Return the first non-empty reasoning field, if any."""
+    for attr_name in _REASONING_FIELDS:
+        value = fields.get(attr_name)
+        if value:
+            return value
+    return None
+
+def _tool_call_fields(tc):
+    """Return (index, id, name, arguments) of a tool call or tool-call delta.
+
+    Accepts the SDK object and plain dict forms parse_response handles, with
+    StepFun 'custom' calls read like 'function' ones. Missing parts are None.
+    """
+    if isinstance(tc, dict):
+        func = (tc.get('custom') if 'custom' in tc else tc.get('function')) or {}
+        return tc.get('index'), tc.get('id'), func.get('name'), func.get('arguments')
+    func = getattr(tc, 'function', None)
+    if func is None:
+        func = _field_values(tc).get('custom')
+    if isinstance(func, dict):
+        name, arguments = func.get('name'), func.get('arguments')
+    else:
+        name, arguments = getattr(func, 'name', None), getattr(func, 'arguments', None)
+    return getattr(tc, 'index', None), getattr(tc, 'id', None), name, arguments
+
+
 class OpenAICompatibleProvider(LLMProvider):
     """
     Provider for OpenAI-compatible APIs.
@@ -58,10 +132,19 @@ class OpenAICompatibleProvider(LLMProvider):
         logger.debug(f"OpenAI client final kwargs: base_url={client_kwargs.get('base_url')}, default_headers={client_kwargs.get('default_headers')}")
         debug_log(f"client final kwargs: base_url={client_kwargs.get('base_url')}, default_headers={client_kwargs.get('default_headers')}", component="OPENAI")
         
-        self.client = OpenAI(**client_kwargs)
+        self.client = _get_openai_client(
+            config.api_key,
+            client_kwargs.get("base_url"),
+            config.timeout,
+            config.max_retries,
+            tuple(sorted(client_kwargs.get("default_headers", {}).items()))
+        )
         logger.debug(f"OpenAI client created with base_url={self.client.base_url if hasattr(self.client, 'base_url') else 'default'}")
         debug_log(f"client created with base_url={self.client.base_url if hasattr(self.client, 'base_url') else 'default'}", component="OPENAI")
         
+        # Set once the server rejects a streaming request; later calls are blocking
+        self._streaming_rejected = False
+        
         # Initialize tokenizer for token counting (lazy loading)
         self.encoding = None
         # We'll try to load tiktoken only when needed
@@ -385,6 +468,133 @@ class OpenAICompatibleProvider(LLMProvider):
         
         return messages_normalized
 
+    def _prepare_completion_kwargs(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict]],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Normalize messages for the target API and build create() kwargs."""
+        # DeepSeek requires message IDs - add them if missing
+        if "deepseek" in self.config.model.lower() or (self.config.base_url and "deepseek" in self.config.base_url.lower()):
+            # DeepSeek requires string message IDs and normalized tool calls;
+            # _normalize_deepseek_tool_calls copies each message and adds both in one pass
+            messages = self._normalize_deepseek_tool_calls(messages)
+            logger.debug(f"DeepSeek: Added IDs to {len(messages)} messages")
+                
+        # StepFun requires proper tool call structure
+        #print(f"[STEPFUN_CHECK_DEBUG] Checking if model contains 'stepfun': model='{self.config.model.lower()}', base_url='{self.config.base_url}'", file=sys.stderr)
+        # Check for StepFun via OpenRouter or directly
+        is_stepfun = "stepfun" in self.config.model.lower()
+        is_openrouter = self.config.base_url and "openrouter" in self.config.base_url.lower()
+        #print(f"[STEPFUN_CHECK_DEBUG] is_stepfun={is_stepfun}, is_openrouter={is_openrouter}", file=sys.stderr)
+        
+        # If using OpenRouter with StepFun model, we need special handling
+        # OpenRouter expects standard OpenAI format (type='function' with 'function' field)
+        # but StepFun returns 'custom' format. We need to convert between them.
+        if is_stepfun or (is_openrouter and is_stepfun):
+            #print(f"[STEPFUN_DEBUG] Processing {len(messages)} messages for StepFun (OpenRouter: {is_openrouter})", file=sys.stderr)
+            messages = self._normalize_stepfun_tool_calls(messages, is_openrouter=is_openrouter)
+        
+        # Prepare completion kwargs
+        completion_kwargs = {
+            "model": self.config.model,
+            "messages": messages,
+        }
+        # Apply any explicit kwargs first
+        completion_kwargs.update(kwargs)
+        # Set defaults for missing parameters
+        if "temperature" not in completion_kwargs:
+            completion_kwargs["temperature"] = self.config.temperature
+        if "max_tokens" not in completion_kwargs and self.config.max_tokens is not None:
+            completion_kwargs["max_tokens"] = self.config.max_tokens
+        if "top_p" not in completion_kwargs and getattr(self.config, "top_p", None) is not None:
+            completion_kwargs["top_p"] = self.config.top_p            
+        # Add tools if provided
+        if tools:
+            completion_kwargs["tools"] = self.format_tools(tools)
+            completion_kwargs["tool_choice"] = kwargs.get("tool_choice", "auto")
+        return completion_kwargs
+
+    def _translate_error(self, e: Exception, response: Any = None) -> Exception:
+        """Map an exception raised during an API call to a provider exception."""
+        if isinstance(e, RateLimitError):
+            # Include raw response if available
+            rate_limit_error = RateLimitExceeded(f"Rate limit exceeded: {e}")
+            if hasattr(e, 'response'):
+                rate_limit_error.raw_response = e.response
+            return rate_limit_error
+        if isinstance(e, APIError):
+            # Debug logging for authentication errors
+            import os
+            if os.environ.get('DEBUG_OPENAI'):
+                debug_log(f"APIError caught: {e}", component="OPENAI")
+                debug_log(f"Error type: {type(e)}", component="OPENAI")
+                debug_log(f"Error string: {str(e)}", component="OPENAI")
+                if hasattr(e, 'response'):
+                    try:
+                        resp_text = str(e.response)
+                        if len(resp_text) > 1000:
+                            resp_text = resp_text[:1000] + f"... (truncated, total {len(resp_text)} chars)"
+                        debug_log(f"Error response: {resp_text}", component="OPENAI")
+                    except:
+                        pass
+            # Special handling for DeepSeek authentication via APIConnectionError
+            if isinstance(e, APIConnectionError):
+                # Debug logging
+                if os.environ.get('DEBUG_OPENAI'):
+                    debug_log(f"APIConnectionError caught: {e}", component="OPENAI")
+                    debug_log(f"Base URL: {self.config.base_url}", component="OPENAI")
+                # Check if this is a DeepSeek endpoint
+                base_url = str(self.config.base_url or "").lower()
+                if "deepseek" in base_url:
+                    if os.environ.get('DEBUG_OPENAI'):
+                        debug_log(f"Treating as DeepSeek authentication error", component="OPENAI")
+                    auth_error = AuthenticationError(f"Authentication failed (DeepSeek connection error): {e}")
+                    if hasattr(e, 'response'):
+                        auth_error.raw_response = e.response
+                    return auth_error
+                else:
+                    if os.environ.get('DEBUG_OPENAI'):
+                        debug_log(f"Not DeepSeek, passing through as API error", component="OPENAI")
+            
+            if "authentication" in str(e).lower() or "api key" in str(e).lower():
+                auth_error = AuthenticationError(f"Authentication failed: {e}")
+                if hasattr(e, 'response'):
+                    auth_error.raw_response = e.response
+                return auth_error
+            api_error = ProviderError(f"API error: {e}")
+            if hasattr(e, 'response'):
+                api_error.raw_response = e.response
+            return api_error
+        # Add more debug info about what was returned
+        import os
+        if os.environ.get('DEBUG_OPENAI'):
+            debug_log(f"Exception type: {type(e)}", component="OPENAI")
+            debug_log(f"Exception message: {e}", component="OPENAI")
+            # Try to get the response if it exists in the exception
+            if hasattr(e, 'response'):
+                try:
+                    resp_text = str(e.response)
+                    if len(resp_text) > 1000:
+                        resp_text = resp_text[:1000] + f"... (truncated, total {len(resp_text)} chars)"
+                    debug_log(f"Exception response: {resp_text}", component="OPENAI")
+                except:
+                    pass
+        
+        # Create a ProviderError with the raw response if available
+        err_msg = f"Unexpected error: {e}"
+        provider_error = ProviderError(err_msg)
+        if hasattr(e, 'response'):
+            provider_error.raw_response = e.response
+            provider_error.args = (f"{err_msg}. Response: {e.response}",)
+        
+        # Also attach the actual response object from the API call if it exists
+        if response is not None:
+            provider_error.raw_response = response
+            
+        return provider_error
+
     def chat_completion(
         self, 
         messages: List[Dict[str, str]], 
@@ -393,92 +603,14 @@ class OpenAICompatibleProvider(LLMProvider):
     ) -> LLMResponse:
         """Execute chat completion with OpenAI-compatible API"""
         start_time = time.time()
+        response = None
         
         try:
-            # DeepSeek requires message IDs - add them if missing
-            if "deepseek" in self.config.model.lower() or (self.config.base_url and "deepseek" in self.config.base_url.lower()):
-                #print(f"[DEEPSEEK_DEBUG] Processing {len(messages)} messages for DeepSeek", file=sys.stderr)
-                # DeepSeek requires message IDs - add them if missing
-                messages_with_ids = []
-                for i, msg in enumerate(messages):
-                    msg_copy = msg.copy()
-                    # Add ID if missing or None or not string
-                    if "id" not in msg_copy or msg_copy["id"] is None or not isinstance(msg_copy["id"], str):
-                        msg_copy["id"] = str(i)  # DeepSeek expects string IDs
-                    # Also ensure tool messages have proper structure
-                    if msg_copy.get("role") == "tool" and "tool_call_id" in msg_copy:
-                        # Keep tool_call_id, also ensure id field exists
-                        pass
-                    messages_with_ids.append(msg_copy)
-                    #print(f"[DEEPSEEK_DEBUG] Message {i}: role={msg_copy.get('role')}, id={msg_copy.get('id')}, has_tool_call_id={'tool_call_id' in msg_copy}", file=sys.stderr)
-                messages = messages_with_ids
-                # Normalize tool calls for DeepSeek
-                messages = self._normalize_deepseek_tool_calls(messages)
-                #print(f"[DEEPSEEK_TOOL_NORM] Normalized tool calls in {len(messages)} messages", file=sys.stderr)
-                #print(f"[DEBUG_DEEPSEEK] Added IDs to {len(messages)} messages", file=sys.stderr)
-                logger.debug(f"DeepSeek: Added IDs to {len(messages)} messages")
-                #print(f"[DEBUG_DEEPSEEK] Added IDs to {len(messages)} messages", file=sys.stderr)
-                # Debug: print all messages with IDs
-                for i, msg in enumerate(messages):
-                    #print(f"[DEBUG_DEEPSEEK_AFTER] Message {i}: role={msg.get('role')}, id={msg.get('id')}", file=sys.stderr)
-                    pass
-                    
-            # StepFun requires proper tool call structure
-            #print(f"[STEPFUN_CHECK_DEBUG] Checking if model contains 'stepfun': model='{self.config.model.lower()}', base_url='{self.config.base_url}'", file=sys.stderr)
-            # Check for StepFun via OpenRouter or directly
-            is_stepfun = "stepfun" in self.config.model.lower()
-            is_openrouter = self.config.base_url and "openrouter" in self.config.base_url.lower()
-            #print(f"[STEPFUN_CHECK_DEBUG] is_stepfun={is_stepfun}, is_openrouter={is_openrouter}", file=sys.stderr)
-            
-            # If using OpenRouter with StepFun model, we need special handling
-            # OpenRouter expects standard OpenAI format (type='function' with 'function' field)
-            # but StepFun returns 'custom' format. We need to convert between them.
-            if is_stepfun or (is_openrouter and is_stepfun):
-                #print(f"[STEPFUN_DEBUG] Processing {len(messages)} messages for StepFun (OpenRouter: {is_openrouter})", file=sys.stderr)
-                messages = self._normalize_stepfun_tool_calls(messages, is_openrouter=is_openrouter)
-            
-            # Prepare completion kwargs
-            completion_kwargs = {
-                "model": self.config.model,
-                "messages": messages,
-            }
-            # Apply any explicit kwargs first
-            completion_kwargs.update(kwargs)
-            # Set defaults for missing parameters
-            if "temperature" not in completion_kwargs:
-                completion_kwargs["temperature"] = self.config.temperature
-            if "max_tokens" not in completion_kwargs and self.config.max_tokens is not None:
-                completion_kwargs["max_tokens"] = self.config.max_tokens
-            if "top_p" not in completion_kwargs and getattr(self.config, "top_p", None) is not None:
-                completion_kwargs["top_p"] = self.config.top_p            
-            # Add tools if provided
-            if tools:
-                completion_kwargs["tools"] = self.format_tools(tools)
-                completion_kwargs["tool_choice"] = kwargs.get("tool_choice", "auto")
+            completion_kwargs = self._prepare_completion_kwargs(messages, tools, kwargs)
             
             # Make API call
             logger.debug(f"OpenAI API call: model={completion_kwargs.get('model')}, temperature={completion_kwargs.get('temperature')}, max_tokens={completion_kwargs.get('max_tokens')}, tools_count={len(tools) if tools else 0}, base_url={self.client.base_url if hasattr(self.client, 'base_url') else 'default'}, api_key={self.config.api_key}")
             #print(f"[DEBUG_OPENAI] API call: model={completion_kwargs.get('model')}, temperature={completion_kwargs.get('temperature')}, max_tokens={completion_kwargs.get('max_tokens')}, tools_count={len(tools) if tools else 0}, base_url={self.client.base_url if hasattr(self.client, 'base_url') else 'default'}, api_key={self.config.api_key}", file=sys.stderr)
-            # Debug: print final messages being sent (DeepSeek only)
-            if "deepseek" in self.config.model.lower() or (self.config.base_url and "deepseek" in self.config.base_url.lower()):
-                #print(f"[DEEPSEEK_DEBUG_FINAL] Sending {len(completion_kwargs.get('messages', []))} messages to API", file=sys.stderr)
-                for i, msg in enumerate(completion_kwargs.get('messages', [])):
-                    #print(f"[DEEPSEEK_DEBUG_FINAL] Message {i}: {msg}", file=sys.stderr)
-                    pass
-            # Debug: print final messages being sent (StepFun only)
-            #print(f"[API_CALL_DEBUG] Model: {self.config.model}, Base URL: {self.config.base_url}", file=sys.stderr)
-            if "stepfun" in self.config.model.lower():
-                #print(f"[STEPFUN_DEBUG_FINAL] Sending {len(completion_kwargs.get('messages', []))} messages to API", file=sys.stderr)
-                for i, msg in enumerate(completion_kwargs.get('messages', [])):
-                    #print(f"[STEPFUN_DEBUG_FINAL] Message {i}: {msg}", file=sys.stderr)
-                    pass
-            else:
-                # Still log messages for debugging
-                #print(f"[API_CALL_DEBUG] Sending {len(completion_kwargs.get('messages', []))} messages", file=sys.stderr)
-                for i, msg in enumerate(completion_kwargs.get('messages', [])):
-                    if msg.get("role") == "assistant" and "tool_calls" in msg:
-                        #print(f"[API_CALL_DEBUG] Message {i} has tool_calls: {msg['tool_calls']}", file=sys.stderr)
-                        pass
             
             response = self.client.chat.completions.create(**completion_kwargs)
             
@@ -532,84 +664,118 @@ class OpenAICompatibleProvider(LLMProvider):
             
             return llm_response
             
-        except RateLimitError as e:
-            # Include raw response if available
-            rate_limit_error = RateLimitExceeded(f"Rate limit exceeded: {e}")
-            if hasattr(e, 'response'):
-                rate_limit_error.raw_response = e.response
-            raise rate_limit_error
-        except APIError as e:
-            # Debug logging for authentication errors
-            import os
-            if os.environ.get('DEBUG_OPENAI'):
-                debug_log(f"APIError caught: {e}", component="OPENAI")
-                debug_log(f"Error type: {type(e)}", component="OPENAI")
-                debug_log(f"Error string: {str(e)}", component="OPENAI")
-                if hasattr(e, 'response'):
-                    try:
-                        resp_text = str(e.response)
-                        if len(resp_text) > 1000:
-                            resp_text = resp_text[:1000] + f"... (truncated, total {len(resp_text)} chars)"
-                        debug_log(f"Error response: {resp_text}", component="OPENAI")
-                    except:
-                        pass
-            # Special handling for DeepSeek authentication via APIConnectionError
-            if isinstance(e, APIConnectionError):
-                # Debug logging
-                if os.environ.get('DEBUG_OPENAI'):
-                    debug_log(f"APIConnectionError caught: {e}", component="OPENAI")
-                    debug_log(f"Base URL: {self.config.base_url}", component="OPENAI")
-                # Check if this is a DeepSeek endpoint
-                base_url = str(self.config.base_url or "").lower()
-                if "deepseek" in base_url:
-                    if os.environ.get('DEBUG_OPENAI'):
-                        debug_log(f"Treating as DeepSeek authentication error", component="OPENAI")
-                    auth_error = AuthenticationError(f"Authentication failed (DeepSeek connection error): {e}")
-                    if hasattr(e, 'response'):
-                        auth_error.raw_response = e.response
-                    raise auth_error
-                else:
-                    if os.environ.get('DEBUG_OPENAI'):
-                        debug_log(f"Not DeepSeek, passing through as API error", component="OPENAI")
-            
-            if "authentication" in str(e).lower() or "api key" in str(e).lower():
-                auth_error = AuthenticationError(f"Authentication failed: {e}")
-                if hasattr(e, 'response'):
-                    auth_error.raw_response = e.response
-                raise auth_error
-            api_error = ProviderError(f"API error: {e}")
-            if hasattr(e, 'response'):
-                api_error.raw_response = e.response
-            raise api_error
         except Exception as e:
-            # Add more debug info about what was returned
-            import os
-            if os.environ.get('DEBUG_OPENAI'):
-                debug_log(f"Exception type: {type(e)}", component="OPENAI")
-                debug_log(f"Exception message: {e}", component="OPENAI")
-                # Try to get the response if it exists in the exception
-                if hasattr(e, 'response'):
-                    try:
-                        resp_text = str(e.response)
-                        if len(resp_text) > 1000:
-                            resp_text = resp_text[:1000] + f"... (truncated, total {len(resp_text)} chars)"
-                        debug_log(f"Exception response: {resp_text}", component="OPENAI")
-                    except:
-                        pass
-            
-            # Create a ProviderError with the raw response if available
-            err_msg = f"Unexpected error: {e}"
-            provider_error = ProviderError(err_msg)
-            if hasattr(e, 'response'):
-                provider_error.raw_response = e.response
-                provider_error.args = (f"{err_msg}. Response: {e.response}",)
+            raise self._translate_error(e, response)
+
+    def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict]] = None,
+        **kwargs
+    ) -> Generator[Dict[str, str], None, LLMResponse]:
+        """Execute a streaming chat completion.
+
+        Yields {"content": ...} / {"reasoning": ...} deltas as they arrive and
+        returns the assembled LLMResponse (same shape as chat_completion).
+        Falls back to a blocking chat_completion (yielding nothing) when the
+        server rejects the streaming request.
+        """
+        if self._streaming_rejected:
+            return self.chat_completion(messages, tools, **kwargs)
+        start_time = time.time()
+        stream = None
+        content_parts = []
+        reasoning_parts = []
+        tool_call_parts = {}  # index -> {"id", "name", "arguments": [fragments]}
+        usage = {}
+        
+        try:
+            completion_kwargs = self._prepare_completion_kwargs(messages, tools, kwargs)
+            completion_kwargs["stream"] = True
+            # Usage is only reported on the final chunk when explicitly requested
+            completion_kwargs["stream_options"] = {"include_usage": True}
+            logger.debug(f"OpenAI streaming API call: model={completion_kwargs.get('model')}, tools_count={len(tools) if tools else 0}")
             
-            # Also attach the actual response object from the API call if it exists
-            if 'response' in locals():
-                provider_error.raw_response = response
+            try:
+                stream = self.client.chat.completions.create(**completion_kwargs)
+            except (BadRequestError, UnprocessableEntityError) as e:
+                # Some OpenAI-compatible servers reject stream/stream_options
+                logger.warning(f"Streaming request rejected ({e}); using blocking completions for this provider")
+                self._streaming_rejected = True
+                return self.chat_completion(messages, tools, **kwargs)
+            for chunk in stream:
+                chunk_usage = getattr(chunk, 'usage', None)
+                if chunk_usage:
+                    usage = {
+                        "prompt_tokens": chunk_usage.prompt_tokens,
+                        "completion_tokens": chunk_usage.completion_tokens,
+                        "total_tokens": chunk_usage.total_tokens
+                    }
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta is None:
+                    continue
+                delta_fields = _field_values(delta)
                 
-            raise provider_error
-    
+                text = delta_fields.get('content')
+                if text:
+                    content_parts.append(text)
+                    yield {"content": text}
+                
+                # Reasoning deltas use the same attribute names as full responses
+                reasoning_text = _reasoning_from(delta_fields)
+                if reasoning_text:
+                    reasoning_parts.append(reasoning_text)
+                    yield {"reasoning": reasoning_text}
+                
+                # Tool calls arrive as fragments keyed by index
+                for tc in delta_fields.get('tool_calls') or []:
+                    index, call_id, name, arguments = _tool_call_fields(tc)
+                    if index is None:
+                        index = len(tool_call_parts)
+                    entry = tool_call_parts.setdefault(index, {"id": None, "name": "", "arguments": []})
+                    if call_id:
+                        entry["id"] = call_id
+                    if name and not entry["name"]:
+                        entry["name"] = name
+                    if arguments:
+                        entry["arguments"].append(arguments)
+        except ProviderError:
+            # Already translated by the blocking fallback
+            raise
+        except Exception as e:
+            raise self._translate_error(e)
+        finally:
+            # Release the HTTP connection if the consumer stopped early
+            if stream is not None and hasattr(stream, 'close'):
+                stream.close()
+        
+        # Always use 'function' type internally (see parse_response)
+        tool_calls = [
+            {
+                "id": entry["id"],
+                "type": "function",
+                "function": {
+                    "name": entry["name"],
+                    "arguments": "".join(entry["arguments"])
+                }
+            }
+            for _, entry in sorted(tool_call_parts.items())
+        ] or None
+        
+        latency = (time.time() - start_time) * 1000
+        llm_response = self._build_response(
+            "".join(content_parts),
+            "".join(reasoning_parts) or None,
+            tool_calls,
+            usage,
+            None,
+            latency
+        )
+        self.track_usage(llm_response)
+        return llm_response
+
     def parse_response(self, raw_response: Any, start_time: float) -> LLMResponse:
         """Parse OpenAI-compatible response"""
         import os
@@ -655,89 +821,34 @@ class OpenAICompatibleProvider(LLMProvider):
             raise ValueError("Response has empty choices list")
         
         message = raw_response.choices[0].message
+        message_fields = _field_values(message)
         # Extract content (store locally to avoid mutating message object)
-        content = message.content or ""
+        content = message_fields.get('content') or ""
         # Extract tool calls if present
         tool_calls = None
-        if hasattr(message, 'tool_calls') and message.tool_calls:
+        raw_tool_calls = message_fields.get('tool_calls')
+        if raw_tool_calls:
+            # Build plain dicts directly from the known fields. StepFun 'custom'
+            # tool calls (incl. via OpenRouter) are normalized to the 'function'
+            # shape our tool executor expects, so every call has the same layout.
             tool_calls = []
-            #print(f"[PARSE_RESPONSE_DEBUG] Processing {len(message.tool_calls)} tool calls from response", file=sys.stderr)
-            for idx, tc in enumerate(message.tool_calls):
-                # DEBUG: Log raw tool call structure
-                #print(f"[PARSE_RESPONSE_DEBUG] Tool call {idx} raw: type={type(tc)}", file=sys.stderr)
-                if hasattr(tc, '__dict__'):
-                    #print(f"[PARSE_RESPONSE_DEBUG] Tool call {idx} attributes: {list(tc.__dict__.keys())}", file=sys.stderr)
-                    pass
-                elif isinstance(tc, dict):
-                    #print(f"[PARSE_RESPONSE_DEBUG] Tool call {idx} dict keys: {list(tc.keys())}", file=sys.stderr)
-                    pass
-                
-                # Handle both dictionary and object tool calls
+            for tc in raw_tool_calls:
                 if hasattr(tc, 'function'):
                     # Object format (OpenAI SDK)
-                    #print(f"[PARSE_RESPONSE_DEBUG] Tool call {idx} has 'function' attribute", file=sys.stderr)
-                    name = tc.function.name
-                    arguments = tc.function.arguments
-                    tc_id = tc.id
-                else:
-                    # Dictionary format
-                    #print(f"[PARSE_RESPONSE_DEBUG] Tool call {idx} checking dict format", file=sys.stderr)
-                    # Check for different tool call formats
-                    if 'custom' in tc:
-                        #print(f"[PARSE_RESPONSE_DEBUG] Tool call {idx} has 'custom' field: {tc.get('custom')}", file=sys.stderr)
-                        custom_data = tc.get('custom', {})
-                        name = custom_data.get('name')
-                        arguments = custom_data.get('arguments')
-                        tc_id = tc.get('id')
-                    else:
-                        func = tc.get("function", {})
-                        name = func.get("name")
-                        arguments = func.get("arguments")
-                        tc_id = tc.get("id")
-                # Determine type based on original structure
-                tc_type = "function"
-                if hasattr(tc, 'type'):
-                    tc_type = tc.type
-                elif isinstance(tc, dict) and 'type' in tc:
-                    tc_type = tc.get('type')
-                
-                #print(f"[PARSE_RESPONSE_DEBUG] Tool call {idx} parsed: id={tc_id}, name={name}, original_type={tc_type}", file=sys.stderr)
-                
-                # Check if we're using OpenRouter with StepFun
-                # If so, convert to standard OpenAI format (type='function' with 'function' field)
-                is_stepfun = "stepfun" in self.config.model.lower()
-                is_openrouter = self.config.base_url and "openrouter" in self.config.base_url.lower()
-                
-                # Build tool call - convert to function format for OpenRouter
-                # StepFun via OpenRouter expects standard OpenAI format
-                if is_openrouter and is_stepfun and tc_type == "custom":
-                    #print(f"[PARSE_RESPONSE_DEBUG] Converting StepFun custom format to OpenAI function format for OpenRouter", file=sys.stderr)
+                    function = tc.function
                     tool_calls.append({
-                        "id": tc_id,
+                        "id": tc.id,
                         "type": "function",
-                        "function": {
-                            "name": name,
-                            "arguments": arguments
-                        }
+                        "function": {"name": function.name, "arguments": function.arguments}
                     })
                 else:
-                    # Preserve original format
-                    # Ensure tc_type is valid ('function' or 'custom')
-                    if tc_type not in ['function', 'custom']:
-                        #print(f"[PARSE_RESPONSE_DEBUG] Warning: unknown tool call type '{tc_type}', defaulting to 'function'", file=sys.stderr)
-                        tc_type = 'function'
-                    
-                    # Normalize to 'function' key for internal use
-                    # The 'custom' type is for StepFun API compatibility, but our tool executor
-                    # expects 'function' key
+                    # Dictionary format ('custom' for StepFun, else 'function')
+                    func = tc.get('custom', {}) if 'custom' in tc else tc.get("function", {})
                     tool_calls.append({
-                        "id": tc_id,
-                        "type": "function",  # Always use 'function' type internally
-                        "function": {  # Always use 'function' key
-                            "name": name,
-                            "arguments": arguments
-                        }
-                    })        
+                        "id": tc.get("id"),
+                        "type": "function",
+                        "function": {"name": func.get("name"), "arguments": func.get("arguments")}
+                    })
         #print(f"[PARSE_RESPONSE_DEBUG] Final tool_calls: {tool_calls}", file=sys.stderr)
         
         # Extract usage
@@ -749,22 +860,29 @@ class OpenAICompatibleProvider(LLMProvider):
                 "total_tokens": raw_response.usage.total_tokens
             }
         
-        # Extract reasoning content - check multiple attribute names
-        reasoning = None
-        # Try various attribute names used by different providers
-        for attr_name in ('reasoning_content', 'reasoning', 'thinking'):
-            if hasattr(message, attr_name) and getattr(message, attr_name):
-                reasoning = getattr(message, attr_name)
-                break
+        # Extract reasoning content - providers use different attribute names
+        reasoning = _reasoning_from(message_fields)
         
+        return self._build_response(content, reasoning, tool_calls, usage, raw_response, latency)
+
+    def _build_response(
+        self,
+        content: str,
+        reasoning: Optional[str],
+        tool_calls: Optional[List[Dict]],
+        usage: Dict[str, int],
+        raw_response: Any,
+        latency: float
+    ) -> LLMResponse:
+        """Build the normalized LLMResponse shared by blocking and streaming calls."""
         # Fallback: extract reasoning from <think> tags in content
-        if not reasoning:
-            import re
-            think_match = re.search(r'<think>(.*?)</think>', content, flags=re.DOTALL)
+        # (plain substring test first; the regexes only run when a tag is present)
+        if not reasoning and '<think>' in content:
+            think_match = _THINK_RE.search(content)
             if think_match:
                 reasoning = think_match.group(1).strip()
                 # Remove the </think> tags from content to avoid duplication
-                content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL).strip()
+                content = _THINK_RE.sub('', content).strip()
         
         return LLMResponse(
             content=content,
@@ -1,10 +1,13 @@
 """Main entry point for the ThoughtMachine GUI."""
 import sys
-from PyQt6.QtWidgets import QApplication
-from qt_gui.main_window import AgentGUI
 
 
 def main():
+    # Deferred so importing this module (e.g. from the QML frontend or
+    # tooling) doesn't pay for loading PyQt6 and the whole window tree.
+    from PyQt6.QtWidgets import QApplication
+    from qt_gui.main_window import AgentGUI
+
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     gui = AgentGUI()
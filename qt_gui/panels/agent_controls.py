@@ -408,20 +408,29 @@ class AgentControlsPanel(QGroupBox):
         # Add a "None" option to indicate no preset
         self.preset_combo.addItem("None", None)
 
-        if os.path.isdir(presets_dir):
-            for filename in sorted(os.listdir(presets_dir)):
-                if filename.endswith(".yaml") or filename.endswith(".yml"):
-                    filepath = os.path.join(presets_dir, filename)
-                    try:
-                        with open(filepath, 'r') as f:
-                            data = yaml.safe_load(f)
-                            name = data.get('name', filename)
-                            # Store the filepath as user data
-                            self.preset_combo.addItem(name, filepath)
-                    except Exception as e:
-                        debug_log(f"Error loading preset {filepath}: {e}", level="ERROR")
-        else:
+        # scandir supplies the file type from the directory read itself, so
+        # subdirectories named *.yaml are skipped without an extra stat each
+        try:
+            with os.scandir(presets_dir) as it:
+                entries = sorted(
+                    (entry for entry in it
+                     if entry.name.endswith((".yaml", ".yml")) and entry.is_file()),
+                    key=lambda entry: entry.name,
+                )
+        except (FileNotFoundError, NotADirectoryError):
             debug_log(f"Presets directory '{presets_dir}' not found.", level="WARNING")
+            return
+
+        for entry in entries:
+            filepath = entry.path
+            try:
+                with open(filepath, 'r') as f:
+                    data = yaml.safe_load(f)
+                    name = data.get('name', entry.name)
+                    # Store the filepath as user data
+                    self.preset_combo.addItem(name, filepath)
+            except Exception as e:
+                debug_log(f"Error loading preset {filepath}: {e}", level="ERROR")
 
     def _on_preset_changed(self, index):
         """Handle preset selection change.
@@ -732,7 +741,7 @@ class AgentControlsPanel(QGroupBox):
         config["workspace_path"] = workspace_path
         config["tool_output_limit"] = self.tool_output_limit_spinbox.value()
         config["detail"] = self.detail_combo.currentText()
-        config["enabled_tools"] = [name for name, cb in self.tool_checkboxes.items() if cb.isChecked()]
+        config["enabled_tools"] = self.get_enabled_tool_names()
         # Provider-specific config (empty dict for now)
         config["provider_config"] = {}
         # Preset selection
@@ -2,10 +2,7 @@
 import html
 import datetime
 from PyQt6.QtCore import Qt, QModelIndex, QVariant, QSortFilterProxyModel, QSize, QPoint, QAbstractListModel
-from PyQt6.QtWidgets import (
-    QStyledItemDelegate, QStyleOptionViewItem, QStyle,
-    QFrame, QLabel, QVBoxLayout, QSizePolicy
-)
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle
 from PyQt6.QtGui import QPainter, QPalette, QTextDocument
 
 # Import from other extracted modules
@@ -759,51 +756,3 @@ class EventDelegate(QStyledItemDelegate):
                 add_line(f"Cumulative tokens: input {usage['total_input']}, output {usage['total_output']}")
 
         return '\n'.join(lines)
-
-
-class EventFrame(QFrame):
-    """A frame that holds a single event with structured content lines."""
-
-    def __init__(self, title, event_type, parent=None):
-        super().__init__(parent)
-        self.setFrameStyle(QFrame.Shape.Box)
-        self.setLineWidth(1)
-        layout = QVBoxLayout()
-        layout.setSpacing(2)
-
-        # Title
-        title_label = QLabel(f"<b>{title}</b>")
-        title_label.setStyleSheet("background-color: #e0e0e0; padding: 3px;")
-        layout.addWidget(title_label)
-
-        # Content area
-        self.content_layout = QVBoxLayout()
-        self.content_layout.setSpacing(2)
-        layout.addLayout(self.content_layout)
-
-        self.setLayout(layout)
-
-    def add_content_line(self, text, style="", use_markdown=False):
-        """Add a simple text line (label)."""
-        # Unescape any HTML entities in the text for PlainText format
-        unescaped_text = html.unescape(text)
-
-        if use_markdown:
-            # Convert markdown to HTML using Qt's built-in markdown support
-            html_text = MarkdownRenderer.markdown_to_html(unescaped_text, style)
-            label = QLabel(html_text)
-            label.setWordWrap(True)
-            label.setTextFormat(Qt.TextFormat.RichText)
-            # Don't apply style sheet for markdown labels - already handled inline
-        else:
-            # Use plain text format
-            label = QLabel(unescaped_text)
-            label.setWordWrap(True)
-            label.setTextFormat(Qt.TextFormat.PlainText)
-            if style:
-                label.setStyleSheet(style)
-
-        label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        # Set size policy to allow vertical expansion for wrapped text
-        label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
-        self.content_layout.addWidget(label)
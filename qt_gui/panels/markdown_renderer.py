@@ -1,7 +1,6 @@
 """Markdown Renderer: Convert markdown to HTML using Qt's built-in support with fallback."""
 import re
 import html as html_module
-from PyQt6.QtGui import QTextDocument
 
 
 class MarkdownRenderer:
@@ -24,13 +23,13 @@ class MarkdownRenderer:
 
         # Try Qt's built-in markdown support first
         try:
+            from PyQt6.QtGui import QTextDocument
             doc = QTextDocument()
             doc.setMarkdown(unescaped_text)
             html_result = doc.toHtml()
 
             # Extract just the body content (Qt adds full HTML document)
             # Look for <body> tag case-insensitively
-            import re
             body_match = re.search(r'<body[^>]*>(.*?)</body>', html_result, re.IGNORECASE | re.DOTALL)
             if body_match:
                 body_content = body_match.group(1).strip()
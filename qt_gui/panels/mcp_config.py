@@ -59,7 +59,7 @@ class MCPConfigDialog(QDialog):
 
     def _refresh_list(self):
         """Refresh the server list display."""
-        self.server_list.clear()
+        entries = []
         for server in self.config.get("servers", []):
             name = server.get('name', 'Unnamed')
             # Determine display field based on transport
@@ -68,7 +68,10 @@ class MCPConfigDialog(QDialog):
                 display = server.get('command', 'N/A')
             else:
                 display = server.get('url', server.get('host', 'N/A'))
-            self.server_list.addItem(f"{name} - {display}")
+            entries.append(f"{name} - {display}")
+        # One addItems call instead of a per-row addItem loop
+        self.server_list.clear()
+        self.server_list.addItems(entries)
 
     def _add_server(self):
         """Add a new MCP server."""
@@ -311,8 +311,7 @@ class OutputPanel(QWidget):
             else:
                 # Regular tools: truncate plain text, no markdown
                 truncated = self._truncate_plain_text(content, tool_name)
-                full_content_escaped = html.escape(content, quote=True)
-                return f'<div style="font-family: monospace, monospace; white-space: pre-wrap;" data-full-content="{full_content_escaped}">{html.escape(truncated)}</div>'
+                return f'<div style="font-family: monospace, monospace; white-space: pre-wrap;">{html.escape(truncated)}</div>'
         elif event_type == "user_query":
             # Check if this is a system notification in user clothing
             if self._is_system_message(content):
@@ -350,28 +349,38 @@ class OutputPanel(QWidget):
         if not ENABLE_RESULT_TRUNCATION:
             return content
 
-        lines = content.split('\n')
-
-        # Limit number of lines
-        if len(lines) > MAX_LINES_PER_RESULT:
-            lines = lines[:MAX_LINES_PER_RESULT]
-            lines.append('...')
-
-        # Process each line
+        # Walk only the lines that can be shown with find() instead of
+        # splitting the whole result, so a large tool result is never copied;
+        # only the displayed prefix of each line is sliced out.
         truncated_lines = []
         total_chars = 0
-        for line in lines:
+        start = 0
+        content_len = len(content)
+        for _ in range(MAX_LINES_PER_RESULT):
+            end = content.find('\n', start)
+            if end == -1:
+                end = content_len
+            line_len = end - start
+
             # Check total character limit
-            if total_chars + len(line) > MAX_RESULT_LENGTH:
+            if total_chars + line_len > MAX_RESULT_LENGTH:
                 truncated_lines.append('...')
-                break
+                return '\n'.join(truncated_lines)
 
             # Limit line length
-            if len(line) > 100:
-                line = line[:100] + '...'
+            if line_len > 100:
+                line = content[start:start + 100] + '...'
+            else:
+                line = content[start:end]
 
             truncated_lines.append(line)
             total_chars += len(line)
+            if end == content_len:
+                break
+            start = end + 1
+        else:
+            # More lines than MAX_LINES_PER_RESULT
+            truncated_lines.append('...')
 
         return '\n'.join(truncated_lines)
 
@@ -384,6 +393,21 @@ class OutputPanel(QWidget):
         self.output_textedit.setTextCursor(cursor)
         self._auto_scroll_if_bottom()
 
+    def _append_html_batch(self, html_parts) -> None:
+        """Append several rendered events with one cursor and one scroll."""
+        if not html_parts:
+            return
+        cursor = self.output_textedit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for part in html_parts:
+            cursor.insertBlock()
+            cursor.insertHtml(part)
+            cursor.insertBlock()
+        cursor.endEditBlock()
+        self.output_textedit.setTextCursor(cursor)
+        self._auto_scroll_if_bottom()
+
     def _auto_scroll_if_bottom(self) -> None:
         scrollbar = self.output_textedit.verticalScrollBar()
         if scrollbar.value() >= scrollbar.maximum() - 5:
@@ -402,19 +426,7 @@ class OutputPanel(QWidget):
         """
         from ..debug_log import debug_log
         debug_log(f"DEBUG load_session_history: processing {len(history)} messages", level="DEBUG", component="OutputPanel")
-        for i, msg in enumerate(history):
-            debug_log(f"DEBUG load_session_history message {i}: role={msg.get('role')}, keys={list(msg.keys())}", level="DEBUG", component="OutputPanel")
-            if msg.get('role') == 'assistant':
-                tool_calls = msg.get('tool_calls', [])
-                debug_log(f"DEBUG load_session_history assistant tool_calls count: {len(tool_calls)}", level="DEBUG", component="OutputPanel")
-                for tc in tool_calls:
-                    tool_id = tc.get('id', '')
-                    tool_name = tc.get('function', {}).get('name', 'unknown')
-                    debug_log(f"DEBUG load_session_history tool_call mapping: id={tool_id}, name={tool_name}", level="DEBUG", component="OutputPanel")
-            elif msg.get('role') == 'tool' and 'tool_call_id' in msg:
-                tool_call_id = msg.get('tool_call_id', '')
-                debug_log(f"DEBUG load_session_history tool_result: tool_call_id={tool_call_id}", level="DEBUG", component="OutputPanel")
-        
+
         if suppress_scroll:
             self.set_updates_enabled(False)
 
@@ -451,8 +463,14 @@ class OutputPanel(QWidget):
         
         # Second pass: display messages
         debug_log(f"DEBUG load_session_history second pass: displaying {len(history)} messages", level="DEBUG", component="OutputPanel")
+        # Render everything first and insert it with a single cursor pass, so a
+        # rebuild costs one document edit instead of one per message.
+        html_parts = []
         for message in history:
-            self.display_message(message)
+            event = self._message_to_event(message)
+            if self._should_display(event):
+                html_parts.append(self._render_event(event))
+        self._append_html_batch(html_parts)
 
         if suppress_scroll:
             self.set_updates_enabled(True)
@@ -547,6 +565,30 @@ class OutputPanel(QWidget):
         """
         debug_log(f"DEBUG display_message keys: {list(message.keys())}", level="DEBUG", component="OutputPanel")
         debug_log(f"DEBUG display_message role: {message.get('role')}", level="DEBUG", component="OutputPanel")
+        self.display_event(self._message_to_event(message))
+
+    def display_messages(self, messages) -> None:
+        """Display several user_history messages as one batch.
+
+        All messages are rendered first and inserted with a single cursor
+        pass while repaints are suspended, so a burst of new messages costs
+        one layout and one scroll instead of one per message.
+        """
+        html_parts = []
+        for message in messages:
+            event = self._message_to_event(message)
+            if self._should_display(event):
+                html_parts.append(self._render_event(event))
+        if not html_parts:
+            return
+        self.set_updates_enabled(False)
+        try:
+            self._append_html_batch(html_parts)
+        finally:
+            self.set_updates_enabled(True)
+
+    def _message_to_event(self, message) -> dict:
+        """Convert a user_history message into an event dict for rendering."""
         # Convert message to event format if needed
         event = message.copy()  # Create copy to avoid modifying original
         
@@ -558,8 +600,7 @@ class OutputPanel(QWidget):
         # Ensure required fields
         if 'content' not in event:
             event['content'] = ''
-        
-        self.display_event(event)
+        return event
     
     # Smart scroller compatibility (was removed in Phase 1)
     @property
@@ -99,6 +99,8 @@ class SessionTab(QWidget):
         self._conversation_debounce_timer.setSingleShot(True)
         self._conversation_debounce_timer.setInterval(100)  # 100ms debounce
         self._conversation_debounce_timer.timeout.connect(self._on_conversation_debounced)
+        # Set while a debounce restart is queued, so a burst of changes posts only one
+        self._debounce_restart_pending = False
         
         # Create or load session
         if session_id:
@@ -150,7 +152,6 @@ class SessionTab(QWidget):
     def _on_session_conversation_changed(self):
         """Callback triggered when session's user_history changes via ObservableList."""
         from .debug_log import debug_log
-        from PyQt6.QtCore import QTimer as QTimer
         
         debug_log(f"[SessionTab] Session conversation changed callback triggered", level="DEBUG")
         
@@ -161,7 +162,22 @@ class SessionTab(QWidget):
         
         # Always use singleShot to ensure execution in main thread
         # ObservableList callback may be called from background thread
-        QTimer.singleShot(0, lambda: self._conversation_debounce_timer.start())
+        self._schedule_debounce_restart()
+
+    def _schedule_debounce_restart(self):
+        """Queue one restart of the conversation debounce timer on the main thread.
+
+        ObservableList fires on every mutation, so a turn that appends many
+        messages would otherwise queue one singleShot per message.
+        """
+        if self._debounce_restart_pending:
+            return
+        self._debounce_restart_pending = True
+        QTimer.singleShot(0, self._restart_conversation_debounce)
+
+    def _restart_conversation_debounce(self):
+        self._debounce_restart_pending = False
+        self._conversation_debounce_timer.start()
     
     def create_new_session(self):
         """Create fresh session with auto-generated name."""
@@ -328,12 +344,8 @@ class SessionTab(QWidget):
             # Use new bulk load method with scroll suppression
             self.output_panel.load_session_history(user_history, suppress_scroll=True)
         else:
-            # Append messages incrementally
-            for message in messages_to_append:
-                self.output_panel.display_message(message)
-            
-            # Auto-scroll only if already at bottom
-            self.output_panel._auto_scroll_if_bottom()
+            # Append new messages as one batch (single document edit and scroll)
+            self.output_panel.display_messages(messages_to_append)
         
         # Update tracking variables
         self._last_conversation_version = target_session.conversation_version
@@ -565,6 +577,7 @@ class SessionTab(QWidget):
         self.presenter.error_occurred.connect(self.on_error_occurred)
         self.presenter.config_changed.connect(self.on_config_changed)
         self.presenter.conversation_changed.connect(self.on_conversation_changed)
+        self.presenter.response_streamed.connect(self.on_response_streamed)
 
     # ----- Signal Handlers -----
 
@@ -633,6 +646,14 @@ class SessionTab(QWidget):
         if main_window:
             main_window.statusBar().showMessage(message, 2000)
 
+    def on_response_streamed(self, text):
+        """Show the tail of the response that is still streaming in the status bar."""
+        main_window = self.window()
+        if main_window:
+            tail = " ".join(text[-120:].split())
+            # No timeout: the next status message replaces it once the turn completes
+            main_window.statusBar().showMessage(f"Responding: {tail}")
+
     def _format_event_html(self, event):
         """Format event as HTML for display in QTextEdit."""
 #         delegate = EventDelegate()
@@ -657,7 +678,6 @@ class SessionTab(QWidget):
     @pyqtSlot()
     def on_conversation_changed(self):
         """Handle conversation changes from presenter."""
-        from PyQt6.QtCore import QTimer as QTimer
         # Debounce to prevent excessive rebuilds
         # Ensure timer exists
         if not hasattr(self, '_conversation_debounce_timer'):
@@ -665,7 +685,7 @@ class SessionTab(QWidget):
             debug_log(f"[SessionTab] Timer not yet initialized in on_conversation_changed, skipping", level="WARNING")
             return
         # Use singleShot to ensure execution in main thread
-        QTimer.singleShot(0, lambda: self._conversation_debounce_timer.start())
+        self._schedule_debounce_restart()
     
     def _on_conversation_debounced(self):
         """Debounced handler for conversation changes."""
@@ -693,15 +713,14 @@ class SessionTab(QWidget):
         # Get current messages
         messages = self.session.user_history
         # Display new messages
-        new_count = 0
-        for i in range(self._displayed_message_count, len(messages)):
-            msg = messages[i]
+        new_messages = messages[self._displayed_message_count:]
+        for i, msg in enumerate(new_messages, self._displayed_message_count):
             debug_log(f"GUI update: displaying message {i}: role={msg.get('role')}, type={msg.get('type')}, tool_name={msg.get('tool_name', 'N/A')}", level="DEBUG")
             # Log extra details for tool results
             if 'tool_result' in msg:
                 debug_log(f"  TOOL RESULT: tool_call_id={msg.get('tool_call_id', 'N/A')}, content length={len(msg.get('content', '')) if msg.get('content') else 0}, is_error={msg.get('is_error', False)}", level="DEBUG")
-            self.output_panel.display_message(msg)
-            new_count += 1
+        self.output_panel.display_messages(new_messages)
+        new_count = len(new_messages)
         self._displayed_message_count = len(messages)
         debug_log(f"Displayed {new_count} new messages via GUI update", level="DEBUG")
 
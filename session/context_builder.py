@@ -12,7 +12,9 @@ import os
 import logging
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + "/../")
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 try:
     from debug_pruning import debug_log
@@ -21,6 +23,8 @@ except ImportError:
     DEBUG_PRUNING_AVAILABLE = False
     debug_log = lambda *args, **kwargs: None
 
+from .utils import estimate_message_tokens
+
 logger = logging.getLogger(__name__)
 
 # Debug flag for context building logging
@@ -30,6 +34,10 @@ DEBUG_CONTEXT = os.environ.get('DEBUG_CONTEXT') is not None
 class ContextBuilder(ABC):
     """Abstract base class for context building strategies."""
 
+    # True if build() already passes its result through _cleanup_orphaned_tool_messages,
+    # so callers can skip their own (idempotent) cleanup pass
+    cleans_orphaned_tool_messages = False
+
     @abstractmethod
     def build(self, user_history: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -51,18 +59,16 @@ class ContextBuilder(ABC):
         content_preview = str(message.get('content', ''))[:100].replace('\n', ' ') if 'content' in message else 'no content'
         debug_log('context_builder', f"  content preview: {content_preview}")
         
-        import json
         if encoder is None:
             try:
                 encoder = tiktoken.get_encoding("cl100k_base")  # OpenAI default
             except Exception:
                 # Fallback: rough estimate
-                return len(json.dumps(message)) // 4
+                encoder = None
 
         # Tokenize the entire message as JSON to include all fields (role, content, tool_calls, etc.)
         # This matches how the OpenAI API counts tokens for the message object
-        message_json = json.dumps(message)
-        token_count = len(encoder.encode(message_json))
+        token_count = estimate_message_tokens(message, encoder)
         debug_log('context_builder', f"  estimated tokens: {token_count}")
         return token_count
 
@@ -190,6 +196,70 @@ class ContextBuilder(ABC):
         return result
 
 
+class _HistoryIndex:
+    """Incremental partition of a history list, as used by SummaryBuilder.build.
+
+    Tracks the main prompt, the latest summary, and the system warnings and
+    turns that follow it. History is append-only, so each build() only has to
+    feed in the messages appended since the previous call.
+    """
+
+    def __init__(self, history: List[Dict[str, Any]]):
+        self.history = history
+        self.length = 0
+        self.last = None
+        self.main_prompt = None
+        self.summary_idx = -1
+        self.summary_msg = None
+        self.system_warnings = []
+        self.turns = []
+        self.current_turn = []
+
+    def update(self):
+        """Index messages appended to the history since the last call."""
+        history = self.history
+        for i in range(self.length, len(history)):
+            self._add(i, history[i])
+        self.length = len(history)
+        if self.length:
+            self.last = history[-1]
+
+    def _add(self, i: int, msg: Dict[str, Any]):
+        role = msg.get("role")
+        if role == "system":
+            if 'Summary of previous conversation:' in (msg.get('content') or ''):
+                # Latest summary: everything before it is dropped from context
+                self.summary_idx = i
+                self.summary_msg = msg
+                self.system_warnings = []
+                self.turns = []
+                self.current_turn = []
+            elif self.main_prompt is None:
+                self.main_prompt = msg
+            elif msg != self.main_prompt:
+                self.system_warnings.append(msg)
+            return
+
+        # Same grouping rules as SummaryBuilder._group_messages_into_turns
+        if role == "user" or (role == "assistant" and msg.get("tool_calls")):
+            if self.current_turn:
+                self.turns.append(self.current_turn)
+            self.current_turn = [msg]
+        elif self.current_turn:
+            if role == 'tool':
+                prev = self.current_turn[-1]
+                if prev.get('role') == 'assistant' and prev.get('tool_calls'):
+                    self.current_turn.append(msg)
+            else:
+                self.current_turn.append(msg)
+
+    def all_turns(self) -> List[List[Dict[str, Any]]]:
+        """Return the grouped turns after the latest summary."""
+        if self.current_turn:
+            return self.turns + [self.current_turn]
+        return list(self.turns)
+
+
 class SummaryBuilder(ContextBuilder):
     """
     Advanced strategy: keep recent messages + a summary of earlier conversation.
@@ -205,9 +275,25 @@ class SummaryBuilder(ContextBuilder):
     end (newest messages) first to preserve the originally-kept turns.
     """
 
+    cleans_orphaned_tool_messages = True
+
     def __init__(self, default_keep_turns: int = 5):
         """Initialize with default number of turns to keep when no summary exists."""
         self.default_keep_turns = default_keep_turns
+        # Incremental index of the last history passed to build()
+        self._history_index = None
+
+    def _index_history(self, user_history: List[Dict[str, Any]]) -> _HistoryIndex:
+        """Return an up-to-date index for user_history, reusing the previous one if it only grew."""
+        index = self._history_index
+        if (index is None or index.history is not user_history
+                or len(user_history) < index.length
+                or (index.length and user_history[index.length - 1] is not index.last)):
+            # Different list, or not a pure append since last time: re-index from scratch
+            index = _HistoryIndex(user_history)
+            self._history_index = index
+        index.update()
+        return index
 
     def build(self, user_history: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -234,8 +320,9 @@ class SummaryBuilder(ContextBuilder):
         if not user_history:
             return []
         
-        # Find main system prompt and latest summary
-        main_prompt, summary_idx, summary_msg = self._find_main_prompt_and_summary(user_history)
+        # Find main system prompt and latest summary (indexed incrementally across calls)
+        index = self._index_history(user_history)
+        main_prompt, summary_idx, summary_msg = index.main_prompt, index.summary_idx, index.summary_msg
         debug_log('summary_builder', f"SummaryBuilder.build: found summary_idx={summary_idx}, summary_msg exists={summary_msg is not None}")
         
         # Debug: log what we found
@@ -251,25 +338,8 @@ class SummaryBuilder(ContextBuilder):
             keep_turns = summary_msg.get('pruning_keep_recent_turns', self.default_keep_turns)
         debug_log('summary_builder', f"SummaryBuilder.build: keep_turns={keep_turns}")
         
-        # Get messages after summary (or all messages if no summary)
-        if summary_idx >= 0:
-            # Summary will be added separately, so take messages after summary
-            post_summary = user_history[summary_idx + 1:]  # excludes summary
-        else:
-            post_summary = user_history
-
-        # Separate system warnings and non-system messages
-        system_warnings = []
-        non_system = []
-        for msg in post_summary:
-            if msg.get('role') == 'system':
-                # Exclude main_prompt if it appears in post_summary (should not happen)
-                if main_prompt is not None and msg == main_prompt:
-                    continue
-                # Keep all other system messages (including warnings)
-                system_warnings.append(msg)
-            else:
-                non_system.append(msg)
+        # System messages after the summary (excluding the main prompt), e.g. token/turn warnings
+        system_warnings = index.system_warnings
 
         # DEBUG: Log system warnings collected
         if os.environ.get('DEBUG_CONTEXT'):
@@ -278,9 +348,9 @@ class SummaryBuilder(ContextBuilder):
                 content_preview = warn.get('content', '')[:100].replace('\n', ' ')
                 logger.debug(f'  [{i}] {content_preview}')
 
-        # Group into turns
-        turns = self._group_messages_into_turns(non_system)
-        debug_log('summary_builder', f"SummaryBuilder.build: grouped {len(non_system)} non-system messages into {len(turns)} turns")
+        # Non-system messages after the summary, grouped into turns
+        turns = index.all_turns()
+        debug_log('summary_builder', f"SummaryBuilder.build: {len(turns)} turns after summary")
 
         # Determine which turns to keep
         if summary_msg is not None:
@@ -14,7 +14,9 @@ import os
 import sys
 
 # Import our clean debug logging
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + "/../")
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 try:
     from debug_pruning import (
         debug_log, log_session_history, log_history_provider_reconstruction,
@@ -75,6 +77,9 @@ if DEBUG_HISTORY_PROVIDER or DEBUG_CONTEXT:
 
 class HistoryProvider:
     """Manages conversation history for token-limited LLM context windows."""
+
+    # build() delegates to SummaryBuilder, which cleans its output
+    cleans_orphaned_tool_messages = True
     
     def __init__(self, session: Session, token_limit: Optional[int] = None):
         self._session = session
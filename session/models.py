@@ -194,7 +194,8 @@ class Session:
     security_config: Dict[str, Any] = field(default_factory=get_default_security_config)  # session security policy
     _conversation_changed_callbacks: List[Any] = field(default_factory=list, compare=False, repr=False)
     _conversation_version: int = field(default=0, compare=False, repr=False)  # Increments on each history change
-    conversation_hash: str = field(default="", compare=False, repr=False)  # Hash of current conversation content
+    _conversation_hash: str = field(default="", compare=False, repr=False)  # Cached hash, see conversation_hash
+    _conversation_hash_version: int = field(default=-1, compare=False, repr=False)  # Version the cached hash is for
 
     def __post_init__(self):
         # Ensure context_length reflects token counts if not already set
@@ -204,12 +205,6 @@ class Session:
         self._wrap_user_history()
         # Ensure session has a name
         self.ensure_name()
-        # Compute initial conversation hash
-        try:
-            conv_str = self._normalize_conversation_for_hash(self.user_history)
-            self.conversation_hash = hashlib.md5(conv_str.encode()).hexdigest()[:8]
-        except Exception:
-            self.conversation_hash = ""
 
     def _wrap_user_history(self):
         """Wrap user_history with ObservableList if not already wrapped."""
@@ -276,13 +271,8 @@ class Session:
             cb_repr = cb.__qualname__ if hasattr(cb, '__qualname__') else repr(cb)
             debug_log(f'  Callback {i}: {cb_repr}', level='DEBUG', component='SESSION')
         self.updated_at = datetime.now()
+        # Bumping the version invalidates conversation_hash (recomputed on next read)
         self._conversation_version += 1
-        # Update conversation hash
-        try:
-            conv_str = self._normalize_conversation_for_hash(self.user_history)
-            self.conversation_hash = hashlib.md5(conv_str.encode()).hexdigest()[:8]
-        except Exception:
-            self.conversation_hash = ""
         for callback in self._conversation_changed_callbacks:
             try:
                 callback_repr = callback.__qualname__ if hasattr(callback, '__qualname__') else repr(callback)
@@ -311,6 +301,22 @@ class Session:
         """Get current conversation version (increments on each change)."""
         return self._conversation_version
 
+    @property
+    def conversation_hash(self) -> str:
+        """Hash of current conversation content.
+
+        Computed on first read after a change rather than on every mutation,
+        so a turn appending several messages serializes the history once.
+        """
+        if self._conversation_hash_version != self._conversation_version:
+            try:
+                conv_str = self._normalize_conversation_for_hash(self.user_history)
+                self._conversation_hash = hashlib.md5(conv_str.encode()).hexdigest()[:8]
+            except Exception:
+                self._conversation_hash = ""
+            self._conversation_hash_version = self._conversation_version
+        return self._conversation_hash
+
     def get_conversation_snapshot(self) -> List[Dict[str, Any]]:
         """
         Get immutable snapshot of conversation.
@@ -484,7 +490,7 @@ class Session:
         self.context_length = data.get('context_length', 0)
         # agent_context will be rebuilt later by ContextBuilder
         self.agent_context = []
-        # conversation_hash will be recomputed on next change
+        # conversation_hash is recomputed lazily (the clear/extend above bumped the version)
         # _conversation_changed_callbacks and _conversation_version remain unchanged
         # agent_instance remains unchanged
 
@@ -134,9 +134,16 @@ class FileSystemSessionStore(SessionStore):
         """Get the file path for a session ID."""
         return self.sessions_dir / f"{session_id}.json"
 
+    def _session_files(self) -> List[Path]:
+        """List the session JSON files in the sessions directory."""
+        # DirEntry caches the name and file type, so no glob matching or extra stat per entry
+        with os.scandir(self.sessions_dir) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()]
+
     def _find_session_path(self, session_id: str) -> Optional[Path]:
         """Find the actual file path for a session ID by scanning JSON files."""
-        for file_path in self.sessions_dir.glob("*.json"):
+        for file_path in self._session_files():
             try:
                 with open(file_path, 'r') as f:
                     data = json.load(f)
@@ -207,7 +214,7 @@ class FileSystemSessionStore(SessionStore):
         Reads each JSON file and extracts a few fields.
         """
         sessions = []
-        for file_path in self.sessions_dir.glob("*.json"):
+        for file_path in self._session_files():
             try:
                 with open(file_path, 'r') as f:
                     data = json.load(f)
@@ -1,8 +1,18 @@
 """Utilities for session management."""
 
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any
 
+# orjson is optional; with OPT_SORT_KEYS it emits the same compact, key-sorted
+# layout as the json.dumps call below (non-ASCII kept as UTF-8, not escaped)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def normalize_conversation_for_hash(conversation: List[Dict[str, Any]]) -> str:
     """Create normalized JSON representation for consistent hashing.
@@ -36,4 +46,44 @@ def normalize_conversation_for_hash(conversation: List[Dict[str, Any]]) -> str:
             
         normalized.append(norm_msg)
     
-    return json.dumps(normalized, sort_keys=True, separators=(',', ':'))
\ No newline at end of file
+    if orjson is not None:
+        try:
+            return orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            pass  # e.g. non-str keys or out-of-range ints: use the stdlib encoder
+    return json.dumps(normalized, sort_keys=True, separators=(',', ':'))
+
+
+# (digest of the message JSON, id(encoder)) -> (encoder, token count). Keyed by
+# content, so an edited message never gets a stale count and no message is kept
+# alive; the entry holds the encoder so its id can't be reused while it lives.
+_MESSAGE_TOKEN_CACHE_MAXSIZE = 4096
+_message_token_cache = OrderedDict()
+_message_token_cache_lock = threading.Lock()
+
+
+def estimate_message_tokens(message: Dict[str, Any], encoder=None) -> int:
+    """Token count of a message's JSON form (len // 4 without an encoder).
+
+    Encoded counts are memoized by a digest of the JSON, so per-turn token
+    estimates don't re-encode every unchanged history message.
+    """
+    message_json = json.dumps(message)
+    if encoder is None:
+        return len(message_json) // 4
+
+    key = (hashlib.blake2b(message_json.encode(), digest_size=16).digest(), id(encoder))
+    with _message_token_cache_lock:
+        entry = _message_token_cache.get(key)
+        if entry is not None and entry[0] is encoder:
+            _message_token_cache.move_to_end(key)
+            return entry[1]
+
+    count = len(encoder.encode(message_json))
+
+    with _message_token_cache_lock:
+        _message_token_cache[key] = (encoder, count)
+        _message_token_cache.move_to_end(key)
+        while len(_message_token_cache) > _MESSAGE_TOKEN_CACHE_MAXSIZE:
+            _message_token_cache.popitem(last=False)
+    return count
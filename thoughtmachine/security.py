@@ -5,10 +5,11 @@ with comprehensive logging.
 """
 
 import os
+import stat
 import sys
+import functools
 import logging
 import hashlib
-import docker
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from datetime import datetime
@@ -91,6 +92,16 @@ def _redact_sensitive_data(data: Any) -> Any:
         return data
 
 
+@functools.lru_cache(maxsize=32)
+def _canonical_workspace(workspace_abs: str) -> str:
+    """Resolve symlinks in an absolute workspace path once per process.
+
+    Batch tools validate every target against the same workspace, and
+    realpath costs a syscall per path component.
+    """
+    return os.path.realpath(workspace_abs)
+
+
 def validate_path(path: str, mode: str = 'read', workspace_path: Optional[str] = None) -> str:
     """
     Validate that a given path is within the allowed workspace.
@@ -130,8 +141,7 @@ def validate_path(path: str, mode: str = 'read', workspace_path: Optional[str] =
         except Exception:
             return target_abs
 
-    workspace_abs = os.path.abspath(workspace_path)
-    workspace_abs = os.path.realpath(workspace_abs)
+    workspace_abs = _canonical_workspace(os.path.abspath(workspace_path))
     
     # Ensure target is within workspace
     try:
@@ -181,7 +191,9 @@ def validate_path(path: str, mode: str = 'read', workspace_path: Optional[str] =
     
     # Log successful access
     try:
-        file_size = os.path.getsize(canonical_abs) if os.path.exists(canonical_abs) and os.path.isfile(canonical_abs) else None
+        # One stat instead of exists() + isfile() + getsize()
+        st = os.stat(canonical_abs)
+        file_size = st.st_size if stat.S_ISREG(st.st_mode) else None
     except Exception:
         file_size = None
     
@@ -231,7 +243,9 @@ def setup_docker_sandbox(
         # Import DockerExecutor (lazy import to avoid circular dependencies)
         import sys
         import os
-        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        if module_dir not in sys.path:  # called per container setup; don't grow sys.path
+            sys.path.insert(0, module_dir)
         from docker_executor import DockerExecutor
     except ImportError as e:
         raise DockerSetupError(f"Could not import DockerExecutor: {e}")
@@ -23,8 +23,11 @@ FILE_TOOL_BLACKLIST: Set[str] = {
 }
 
 def _update_simplified_toolset() -> None:
-    """Update SIMPLIFIED_TOOL_CLASSES based on current TOOL_CLASSES and blacklist."""
-    global SIMPLIFIED_TOOL_CLASSES
+    """Update SIMPLIFIED_TOOL_CLASSES based on current TOOL_CLASSES and blacklist.
+
+    The list is updated in place so modules that already imported it see
+    the same canonical list rather than a stale copy.
+    """
     seen_classes: Set[Type[ToolBase]] = set()
     simplified = []
     
@@ -41,13 +44,27 @@ def _update_simplified_toolset() -> None:
     except ImportError:
         pass
     
-    SIMPLIFIED_TOOL_CLASSES = simplified
+    SIMPLIFIED_TOOL_CLASSES[:] = simplified
+
+def _rebuild_tool_models(classes) -> None:
+    """Finish pydantic schema/validator construction for tool classes up front.
+
+    This keeps the first call of each tool from paying for a lazy rebuild.
+    """
+    for cls in classes:
+        try:
+            cls.model_rebuild(raise_errors=False)
+        except Exception as e:
+            logger.debug(f"model_rebuild failed for {cls.__name__}: {e}")
 
 def register_tool(cls: Type[ToolBase]) -> Type[ToolBase]:
     """Decorator to register tool classes and update simplified toolset."""
     if cls not in TOOL_CLASSES:
         TOOL_CLASSES.append(cls)
-        _update_simplified_toolset()
+        _rebuild_tool_models([cls])
+        # Only the new class can change the simplified view; no full rebuild
+        if cls.__name__ not in FILE_TOOL_BLACKLIST and cls not in SIMPLIFIED_TOOL_CLASSES:
+            SIMPLIFIED_TOOL_CLASSES.append(cls)
     return cls
 
 # Import all tool modules explicitly
@@ -208,5 +225,6 @@ except Exception as e:
 
 # Initialize SIMPLIFIED_TOOL_CLASSES
 _update_simplified_toolset()
+_rebuild_tool_models(TOOL_CLASSES)
 
 __all__ = ['TOOL_CLASSES', 'SIMPLIFIED_TOOL_CLASSES', 'register_tool', 'ToolBase']
\ No newline at end of file
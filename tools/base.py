@@ -34,6 +34,14 @@ class ToolBase(BaseModel):
     # Security capabilities required by this tool
     requires_capabilities: ClassVar[List[str]] = []
 
+    # Read-only tools with no ordering dependency on other calls in the same
+    # turn may be executed concurrently by the ToolExecutor.
+    parallel_safe: ClassVar[bool] = False
+
+    # Deterministic read-only tools whose results the ToolExecutor may reuse
+    # for identical arguments until a tool that may modify state runs.
+    cacheable: ClassVar[bool] = False
+
     # Logger instance for tool debugging
     _logger: Optional[logging.Logger] = None
     _agent_logger: Optional[Any] = None
@@ -178,6 +186,14 @@ class ToolBase(BaseModel):
     def execute(self) -> str:
         raise NotImplementedError
 
+    def modifies_state(self) -> bool:
+        """Whether this call may change files or other state that read-only tools see.
+
+        parallel_safe and cacheable tools are read-only; tools whose effect
+        depends on their arguments override this.
+        """
+        return not (self.parallel_safe or self.cacheable)
+
     def model_dump_tool(self) -> dict:
         """Dump all fields except 'execute' method."""
         return self.model_dump(exclude={'execute'})
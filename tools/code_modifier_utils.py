@@ -7,7 +7,6 @@ from typing import Optional, Tuple, Dict, Any
 import difflib
 import libcst as cst
 import textwrap
-import os
 
 from .code_modifier import CodeModifier
 
@@ -1,11 +1,75 @@
-from typing import Literal, Optional
+from typing import ClassVar, Literal, Optional
 from pydantic import Field
 from datetime import datetime, date, time, timedelta
+import functools
 from .base import ToolBase
 
+try:
+    # Optional C parser for ISO 8601, much faster than fromisoformat/strptime
+    from ciso8601 import parse_datetime as _parse_iso_fast
+except ImportError:
+    _parse_iso_fast = None
+
+# Fallback strptime formats tried when a string is not ISO format, split by
+# separator: a string can only match formats using the separator it contains
+_DASH_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+)
+_SLASH_DATETIME_FORMATS = (
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+)
+
+# (separator, number of ':') -> the formats, in priority order, that can
+# match such a string; ':' is a literal in every format, so a format whose
+# colon count differs from the string's always fails. Trying only these keeps
+# strptime's small internal regex cache (5 entries) from being churned.
+_FORMATS_BY_SHAPE = {}
+for _sep, _formats in (('-', _DASH_DATETIME_FORMATS), ('/', _SLASH_DATETIME_FORMATS)):
+    for _fmt in _formats:
+        _FORMATS_BY_SHAPE.setdefault((_sep, _fmt.count(':')), []).append(_fmt)
+del _sep, _formats, _fmt
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime_cached(dt_string: str) -> datetime:
+    """Parse a datetime string using common formats (results are cached)."""
+    if '/' in dt_string:
+        # ISO strings never contain '/', so skip straight to the slash formats
+        sep = '/'
+    else:
+        # Try ISO format first
+        if _parse_iso_fast is not None:
+            try:
+                return _parse_iso_fast(dt_string)
+            except ValueError:
+                pass  # fromisoformat below still covers forms ciso8601 rejects
+        try:
+            return datetime.fromisoformat(dt_string)
+        except ValueError:
+            pass
+        sep = '-'
+
+    # Try common formats
+    for fmt in _FORMATS_BY_SHAPE.get((sep, dt_string.count(':')), ()):
+        try:
+            return datetime.strptime(dt_string, fmt)
+        except ValueError:
+            continue
+
+    raise ValueError(f"Could not parse datetime string: {dt_string}. Supported formats: ISO format (YYYY-MM-DD[THH:MM:SS]), YYYY-MM-DD HH:MM:SS, YYYY-MM-DD HH:MM, YYYY-MM-DD, DD/MM/YYYY HH:MM:SS, DD/MM/YYYY HH:MM, DD/MM/YYYY, MM/DD/YYYY HH:MM:SS, MM/DD/YYYY HH:MM, MM/DD/YYYY")
+
+
 class DateTimeTool(ToolBase):
     """Access date and time information and perform datetime operations."""
     tool: Literal["DateTimeTool"] = "DateTimeTool"
+    parallel_safe: ClassVar[bool] = True
     
     operation: Literal["current_datetime", "current_date", "current_time", "format", "parse", "difference"] = Field(
         description="Operation: current_datetime, current_date, current_time, format, parse, or difference."
@@ -97,29 +161,4 @@ class DateTimeTool(ToolBase):
     
     def _parse_datetime(self, dt_string: str) -> datetime:
         """Parse a datetime string using common formats."""
-        # Try ISO format first
-        try:
-            return datetime.fromisoformat(dt_string)
-        except ValueError:
-            pass
-        
-        # Try common formats
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d",
-            "%d/%m/%Y %H:%M:%S",
-            "%d/%m/%Y %H:%M",
-            "%d/%m/%Y",
-            "%m/%d/%Y %H:%M:%S",
-            "%m/%d/%Y %H:%M",
-            "%m/%d/%Y",
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(dt_string, fmt)
-            except ValueError:
-                continue
-        
-        raise ValueError(f"Could not parse datetime string: {dt_string}. Supported formats: ISO format (YYYY-MM-DD[THH:MM:SS]), YYYY-MM-DD HH:MM:SS, YYYY-MM-DD HH:MM, YYYY-MM-DD, DD/MM/YYYY HH:MM:SS, DD/MM/YYYY HH:MM, DD/MM/YYYY, MM/DD/YYYY HH:MM:SS, MM/DD/YYYY HH:MM, MM/DD/YYYY")
+        return _parse_datetime_cached(dt_string)
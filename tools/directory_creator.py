@@ -1,5 +1,4 @@
 from typing import Literal
-from pathlib import Path
 from .base import ToolBase
 import os
 from pydantic import Field
@@ -14,29 +13,26 @@ class DirectoryCreator(ToolBase):
 
     def execute(self) -> str:
         try:
-            directory = Path(self.directory_path)
             # Validate directory path is within workspace
             try:
-                validated_path = self._validate_path(str(directory))
-                directory = Path(validated_path)
+                validated_path = self._validate_path(self.directory_path)
             except ValueError as e:
                 return self._truncate_output(f"Error: {e}")
             
-            # Check if directory already exists
-            if directory.exists():
+            # Create the directory; mkdir itself reports an existing path, so
+            # no separate existence checks are needed before or after
+            try:
+                if self.parents:
+                    os.makedirs(validated_path)
+                else:
+                    os.mkdir(validated_path)
+            except FileExistsError:
                 if self.exist_ok:
                     return self._truncate_output(f"Directory '{self.directory_path}' already exists (exist_ok=True)")
                 else:
                     return self._truncate_output(f"Error: Directory '{self.directory_path}' already exists and exist_ok=False")
             
-            # Create the directory
-            directory.mkdir(parents=self.parents, exist_ok=self.exist_ok)
-            
-            # Verify it was created
-            if directory.exists():
-                return self._truncate_output(f"Successfully created directory '{self.directory_path}'")
-            else:
-                return self._truncate_output(f"Error: Failed to create directory '{self.directory_path}'")
+            return self._truncate_output(f"Successfully created directory '{self.directory_path}'")
                 
         except Exception as e:
             return self._truncate_output(f"Error creating directory: {e}")
@@ -16,6 +16,8 @@ class DirectoryTreeTool(ToolBase):
     - Optional skip_line_count parameter for performance
     """
     tool: Literal["DirectoryTreeTool"] = "DirectoryTreeTool"
+    parallel_safe: ClassVar[bool] = True
+    cacheable: ClassVar[bool] = True
     
     # Common binary file extensions where line counting should be skipped
     BINARY_EXTENSIONS: ClassVar[set[str]] = {'.pyc', '.pyo', '.so', '.dll', '.exe', '.bin', '.o', '.a', '.lib', '.dylib',
@@ -67,19 +69,15 @@ class DirectoryTreeTool(ToolBase):
 
     
     def _build_tree(self, dir_path: pathlib.Path, current_depth: int) -> Dict[str, Any]:
-        """Recursively build tree structure."""
-        # Debug: write to file
-        try:
-            import os
-            with open('tree_debug.txt', 'a', encoding='utf-8') as f:
-                f.write(f"_build_tree: {dir_path.name}, depth={current_depth}, cwd={os.getcwd()}\n")
-        except Exception as e:
-            with open('debug_error.txt', 'a') as f2:
-                f2.write(f"Error: {e}\n")
+        """Recursively build tree structure.
+
+        Each node also carries dir_count (directories below it), so the summary
+        does not need a second pass over the tree.
+        """
         self._debug_log(f"_build_tree: {dir_path.name}, depth={current_depth}")
         if self.max_depth > 0 and current_depth >= self.max_depth:
             self._debug_log(f"max_depth reached, returning empty")
-            return {'type': 'directory', 'path': dir_path, 'name': dir_path.name, 'children': [], 'file_count': 0, 'total_size': 0, 'line_count': 0}
+            return {'type': 'directory', 'path': dir_path, 'name': dir_path.name, 'children': [], 'file_count': 0, 'dir_count': 0, 'total_size': 0, 'line_count': 0}
         
         tree_node = {
             'type': 'directory',
@@ -87,40 +85,40 @@ class DirectoryTreeTool(ToolBase):
             'name': dir_path.name,
             'children': [],
             'file_count': 0,
+            'dir_count': 0,
             'total_size': 0,
             'line_count': 0
         }
         
         try:
-            entries = list(dir_path.iterdir())
-            
-            # Filter hidden files if needed
-            if not self.show_hidden:
-                entries = [e for e in entries if not e.name.startswith('.')]
+            # DirEntry caches the file type from the directory read, so each
+            # entry is classified once instead of stat'ed by every is_dir() call
+            with os.scandir(dir_path) as it:
+                entries = []
+                for entry in it:
+                    # Filter hidden files if needed
+                    if not self.show_hidden and entry.name.startswith('.'):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    entries.append((is_dir, entry))
             
             # Sort: directories first, then files, alphabetically
-            entries.sort(key=lambda x: (not x.is_dir(), x.name.lower()))
+            entries.sort(key=lambda x: (not x[0], x[1].name.lower()))
 
-            # Filter out excluded directories
-            self._debug_log(f"Before filter, entries: {[e.name for e in entries]}")
-            filtered_entries = []
-            for entry in entries:
-                if entry.is_dir():
-                    excluded = self._should_exclude_dir(entry.name)
-                    self._debug_log(f"Checking directory {entry.name}: excluded={excluded}")
-                    if excluded:
+            for is_dir, entry in entries:
+                if is_dir:
+                    # Filter out excluded directories
+                    if self._should_exclude_dir(entry.name):
                         self._debug_log(f"Excluding directory {entry.name}")
                         continue
-                filtered_entries.append(entry)
-            entries = filtered_entries
-            self._debug_log(f"After filter, entries: {[e.name for e in entries]}")
-
-            for entry in entries:
-                if entry.is_dir():
                     # Recursively process subdirectory
-                    child_node = self._build_tree(entry, current_depth + 1)
+                    child_node = self._build_tree(pathlib.Path(entry.path), current_depth + 1)
                     tree_node['children'].append(child_node)
                     tree_node['file_count'] += child_node['file_count']
+                    tree_node['dir_count'] += child_node['dir_count'] + 1
                     tree_node['total_size'] += child_node['total_size']
                     tree_node['line_count'] += child_node['line_count']
                 elif entry.is_file():
@@ -128,7 +126,7 @@ class DirectoryTreeTool(ToolBase):
                     if not self._matches_pattern(entry.name):
                         continue
 
-                    file_info = self._get_file_info(entry)
+                    file_info = self._get_file_info(pathlib.Path(entry.path))
                     tree_node['children'].append(file_info)
                     tree_node['file_count'] += 1
                     tree_node['total_size'] += file_info['size']
@@ -146,32 +144,12 @@ class DirectoryTreeTool(ToolBase):
     def _should_exclude_dir(self, dir_name: str) -> bool:
         """Check if directory should be excluded based on exclude_dirs patterns."""
         import fnmatch
-        import os
-        os.makedirs('temp', exist_ok=True)
-        # Debug: write to file
-        try:
-            with open('temp/debug_exclude.txt', 'a', encoding='utf-8') as f:
-                f.write(f"Checking '{dir_name}' against {self.exclude_dirs}\n")
-        except:
-            pass
         # Debug: print patterns and matching
         self._debug_log(f"exclude_dirs: {self.exclude_dirs}, checking dir '{dir_name}'")
         for pattern in self.exclude_dirs:
             if fnmatch.fnmatch(dir_name, pattern):
                 self._debug_log(f"directory '{dir_name}' matches pattern '{pattern}'")
-                # Also write to file
-                try:
-                    with open('temp/debug_exclude.txt', 'a', encoding='utf-8') as f:
-                        f.write(f"  MATCH: '{dir_name}' matches '{pattern}'\n")
-                except:
-                    pass
                 return True
-        # Write no match
-        try:
-            with open('temp/debug_exclude.txt', 'a', encoding='utf-8') as f:
-                f.write(f"  NO MATCH\n")
-        except:
-            pass
         return False
     
     def _get_file_info(self, file_path: pathlib.Path) -> Dict[str, Any]:
@@ -300,7 +278,7 @@ class DirectoryTreeTool(ToolBase):
         summary = []
         summary.append("")
         summary.append("SUMMARY:")
-        summary.append(f"  Directories: {self._count_directories(tree_node)}")
+        summary.append(f"  Directories: {tree_node['dir_count']}")
         summary.append(f"  Files: {tree_node['file_count']}")
         
         if self.include_sizes:
@@ -310,18 +288,6 @@ class DirectoryTreeTool(ToolBase):
         
         return summary
     
-    def _count_directories(self, tree_node: Dict[str, Any]) -> int:
-        """Count total directories in tree."""
-        count = 0
-        stack = [tree_node]
-        
-        while stack:
-            node = stack.pop()
-            if node['type'] == 'directory':
-                count += 1
-                stack.extend(node['children'])
-        
-        return count - 1  # Exclude root directory
     def _execute_tree_format(self, dir_path: pathlib.Path) -> str:
         """Generate tree format output."""
         # Build tree structure
@@ -337,45 +303,46 @@ class DirectoryTreeTool(ToolBase):
         return self._truncate_output("\n".join(output_lines))
     def _collect_file_entries(self, dir_path: pathlib.Path) -> List[Tuple[str, int, float]]:
         """Collect file entries matching criteria, respecting max_results."""
-        import os
-        from pathlib import Path
         entries = []
+        # Paths stay plain strings; relative paths are a slice off the root prefix
+        root = str(dir_path)
+        prefix_len = len(os.path.join(root, ''))
         # Use stack of (path, depth)
-        stack = [(dir_path, 0)]
+        stack = [(root, 0)]
         while stack and (self.max_results == 0 or len(entries) < self.max_results):
             current_path, depth = stack.pop()
             # If max_depth > 0 and depth >= max_depth, skip deeper traversal
             if self.max_depth > 0 and depth >= self.max_depth:
                 continue
             try:
-                for entry in current_path.iterdir():
-                    # Skip hidden if not showing hidden
-                    if not self.show_hidden and entry.name.startswith('.'):
-                        continue
-                    if entry.is_dir():
-                        # Skip excluded directories
-                        if self._should_exclude_dir(entry.name):
-                            continue
-                        # Add subdirectory to stack for further traversal
-                        stack.append((entry, depth + 1))
-                    elif entry.is_file():
-                        # Check pattern filter
-                        if not self._matches_pattern(entry.name):
+                with os.scandir(current_path) as it:
+                    for entry in it:
+                        # Skip hidden if not showing hidden
+                        if not self.show_hidden and entry.name.startswith('.'):
                             continue
-                        # Get file info
-                        try:
-                            stat_info = entry.stat()
-                            size = stat_info.st_size
-                            mtime = stat_info.st_mtime
-                        except (OSError, PermissionError):
-                            size = -1
-                            mtime = -1
-                        # Compute relative path from root dir
-                        rel_path = str(entry.relative_to(dir_path))
-                        entries.append((rel_path, size, mtime))
-                        # Stop if max_results reached
-                        if self.max_results > 0 and len(entries) >= self.max_results:
-                            break
+                        if entry.is_dir():
+                            # Skip excluded directories
+                            if self._should_exclude_dir(entry.name):
+                                continue
+                            # Add subdirectory to stack for further traversal
+                            stack.append((entry.path, depth + 1))
+                        elif entry.is_file():
+                            # Check pattern filter
+                            if not self._matches_pattern(entry.name):
+                                continue
+                            # Get file info
+                            try:
+                                stat_info = entry.stat()
+                                size = stat_info.st_size
+                                mtime = stat_info.st_mtime
+                            except (OSError, PermissionError):
+                                size = -1
+                                mtime = -1
+                            # Compute relative path from root dir
+                            entries.append((entry.path[prefix_len:], size, mtime))
+                            # Stop if max_results reached
+                            if self.max_results > 0 and len(entries) >= self.max_results:
+                                break
             except (PermissionError, OSError):
                 # Skip directories we can't read
                 continue
@@ -3,6 +3,7 @@ import json
 import os
 import time
 import datetime
+import importlib.util
 import uuid
 from typing import Literal, Optional, Dict, Any
 from pydantic import Field, field_validator, model_validator
@@ -15,16 +16,9 @@ try:
 except ImportError:
     SECURITY_AVAILABLE = False
 
-try:
-    import docker
-    from docker.errors import DockerException, NotFound, APIError
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
-    docker = None
-    DockerException = Exception
-    NotFound = Exception
-    APIError = Exception
+# The Docker SDK (and its requests/urllib3 stack) is only imported when a
+# container is actually run; at tool discovery a spec lookup is enough.
+DOCKER_AVAILABLE = importlib.util.find_spec("docker") is not None
 
 
 class DockerCodeRunner(ToolBase):
@@ -274,7 +268,9 @@ chmod +x "{script_path}"
             # Import DockerExecutor from the existing module
             # Add parent directory to sys.path
             import sys
-            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/..')
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            if project_root not in sys.path:  # runs per execution; don't grow sys.path
+                sys.path.insert(0, project_root)
             from docker_executor import DockerExecutor
         except ImportError as e:
             duration = time.time() - start_time
@@ -388,6 +384,7 @@ chmod +x "{script_path}"
         if not os.path.exists(dockerfile_path):
             dockerfile_path = "docker/executor.Dockerfile"
 
+        from docker.errors import DockerException
         try:
             # Build the image
             image, build_logs = client.images.build(
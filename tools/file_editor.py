@@ -1,10 +1,292 @@
 # tools/file_editor.py
-from typing import List, Optional, Union, Dict, Literal
+from typing import List, Optional, Union, Dict, Literal, Tuple
+import functools
 import os
+import stat
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from pathlib import Path
 from pydantic import Field, model_validator
 from .base import ToolBase
 
+# Upper bound on threads used for one batch (filenames) call
+_MAX_BATCH_WORKERS = 8
+
+# Operations that never modify the target file
+_READ_ONLY_OPERATIONS = frozenset({"read", "grep"})
+
+# operation -> FileEditor method that performs it on one file
+_OPERATION_METHODS = {
+    "read": "_execute_read",
+    "write": "_execute_write",
+    "insert": "_execute_insert",
+    "append": "_execute_append",
+    "replace": "_execute_replace",
+    "delete": "_execute_delete",
+    "grep": "_execute_grep",
+}
+
+# operation -> (fields that must be set, error when one is missing);
+# replace has alternative field sets and is checked separately
+_REQUIRED_FIELDS = {
+    "write": (("content",), "content required for write"),
+    "insert": (("content", "line_number"), "content and line_number required for insert"),
+    "append": (("content",), "content required for append"),
+    "delete": (("line_numbers",), "line_numbers required for delete"),
+    "grep": (("pattern",), "pattern required for grep"),
+}
+
+# Line indexes of recently read files, so paging through a file does not
+# re-read and re-scan it on every call: path -> (stat key, data, offsets)
+_LINE_INDEX_CACHE_SIZE = 16
+# Files modified this recently are not cached: another same-size write within
+# the same timestamp tick would leave every stat field unchanged
+_LINE_INDEX_RACY_NS = 2_000_000_000
+_LINE_INDEX_MAX_BYTES = 16 * 1024 * 1024  # larger files are indexed but not kept
+_line_index_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_line_index_lock = threading.Lock()
+
+
+def _read_normalized(filename: str):
+    """Read a file as bytes for line-based reads and in-place splices.
+
+    Returns (data, rewrite_from). Newlines are translated the way text mode
+    reads them, and rewrite_from is the offset from which the file must be
+    rewritten even if no edit touches it: 0 when translation changed the
+    content (CR/CRLF files are normalized, as a text-mode rewrite would do),
+    otherwise len(data).
+    """
+    with open(filename, 'rb') as f:
+        data = f.read()
+    if b'\r' in data:
+        return data.replace(b'\r\n', b'\n').replace(b'\r', b'\n'), 0
+    return data, len(data)
+
+
+def _count_lines(data: bytes) -> int:
+    """Number of lines readlines() would return for data."""
+    return data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+
+
+def _skip_lines(data: bytes, pos: int, count: int) -> int:
+    """Byte offset reached by skipping count lines from pos (len(data) past the end)."""
+    for _ in range(count):
+        pos = data.find(b'\n', pos) + 1
+        if not pos:
+            return len(data)
+    return pos
+
+
+def _line_index(filename: str):
+    """Return (data, offsets) for the normalized content of filename.
+
+    offsets[i] is the byte offset at which 0-based line i starts and
+    offsets[-1] == len(data), so the file has len(offsets) - 1 lines. The
+    index is reused while the file's identity (device, inode), mtime, ctime
+    and size are unchanged; it is only stored once the file's last change is
+    old enough that a same-size rewrite could not share its timestamps.
+    """
+    st = os.stat(filename)
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    with _line_index_lock:
+        cached = _line_index_cache.get(filename)
+        if cached is not None and cached[0] == key:
+            _line_index_cache.move_to_end(filename)
+            return cached[1], cached[2]
+
+    data, _ = _read_normalized(filename)
+    # Each piece of the split ends one byte before the next line starts
+    offsets = [0]
+    offsets.extend(accumulate(map((1).__add__, map(len, data.split(b'\n')))))
+    offsets[-1] -= 1  # the last piece has no newline after it
+    if len(offsets) > 1 and offsets[-1] == offsets[-2]:
+        offsets.pop()  # empty piece after a trailing newline (or empty file)
+
+    changed_at = max(st.st_mtime_ns, st.st_ctime_ns)
+    if len(data) <= _LINE_INDEX_MAX_BYTES and time.time_ns() - changed_at > _LINE_INDEX_RACY_NS:
+        with _line_index_lock:
+            _line_index_cache[filename] = (key, data, offsets)
+            _line_index_cache.move_to_end(filename)
+            while len(_line_index_cache) > _LINE_INDEX_CACHE_SIZE:
+                _line_index_cache.popitem(last=False)
+    return data, offsets
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_range_string(spec: str) -> Optional[Tuple[int, int]]:
+    """(start, end) from a "start-end" line_numbers string, or None if malformed."""
+    try:
+        start_str, end_str = spec.split('-')
+        return int(start_str.strip()), int(end_str.strip())
+    except ValueError:
+        return None
+
+
+def _parse_line_spec(spec, total_lines: int, allow_all: bool = True):
+    """Resolve a line_numbers value to the 1-based line numbers it selects.
+
+    Accepts None or 'all' (every line, if allow_all), an int, a list (a
+    2-element list is an inclusive [start, end] range) or a "start-end"
+    string. Raises ValueError with the message to report when the value is
+    malformed or out of range for a file with total_lines lines.
+    """
+    if allow_all and (spec is None or spec == 'all'):
+        return range(1, total_lines + 1)
+    if isinstance(spec, int):
+        if spec < 1 or spec > total_lines:
+            raise ValueError(f"Line number {spec} is out of range (file has {total_lines} lines)")
+        return [spec]
+    if isinstance(spec, list):
+        if len(spec) != 2:
+            # Regular list of discrete line numbers
+            bad = _first_out_of_range(spec, total_lines)
+            if bad is not None:
+                raise ValueError(f"Line number {bad} is out of range (file has {total_lines} lines)")
+            return spec
+        start, end = spec
+    elif isinstance(spec, str) and '-' in spec:
+        parsed = _parse_range_string(spec)
+        if parsed is None:
+            raise ValueError(f"Invalid range format '{spec}'. Use format like '1-10'")
+        start, end = parsed
+    else:
+        raise ValueError(f"Invalid line_numbers parameter: {spec}")
+    if start < 1 or end > total_lines or start > end:
+        raise ValueError(f"Invalid range {start}-{end} (file has {total_lines} lines)")
+    return range(start, end + 1)
+
+
+def _replace_file_text(filename: str, text: str) -> None:
+    """Replace the whole content of filename with text.
+
+    An existing file is replaced by writing a temp file next to it and
+    renaming it over the original, so a failure midway never leaves it
+    truncated. A symlink's target is what gets replaced, and the original
+    mode and (where permitted) owner are kept. A file with other hard links
+    is written in place instead, since a rename would split it from them.
+    """
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        st = None
+    if st is None or st.st_nlink > 1:
+        # Nothing to protect (new file), or keep the hard links intact
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return
+    target = os.path.realpath(filename)
+    with tempfile.NamedTemporaryFile(
+        mode='w', encoding='utf-8',
+        dir=os.path.dirname(target),
+        delete=False,
+        suffix='.fileeditor_tmp'
+    ) as tf:
+        tf.write(text)
+    try:
+        if hasattr(os, 'chown'):
+            try:
+                os.chown(tf.name, st.st_uid, st.st_gid)
+            except PermissionError:
+                pass  # only root may give files away; keep our own ownership
+        os.chmod(tf.name, stat.S_IMODE(st.st_mode))
+        os.replace(tf.name, target)
+    except BaseException:
+        os.unlink(tf.name)
+        raise
+
+
+def _forget_line_index(filename: str) -> None:
+    """Drop the cached line index of filename after it has been written."""
+    with _line_index_lock:
+        _line_index_cache.pop(filename, None)
+
+
+def _first_out_of_range(line_nums, total_lines: int):
+    """Return a line number outside 1..total_lines, or None if all are valid.
+
+    Only the minimum and maximum need checking, so this is two C-level
+    passes instead of a compare per element in Python.
+    """
+    if not line_nums:
+        return None
+    lo = min(line_nums)
+    if lo < 1:
+        return lo
+    hi = max(line_nums)
+    if hi > total_lines:
+        return hi
+    return None
+
+
+def _content_text(content) -> Tuple[str, int]:
+    """Return (text, line count) for str or list content, each line newline-terminated.
+
+    A list is joined in one pass rather than concatenating a newline onto
+    every item first.
+    """
+    if isinstance(content, str):
+        return content + "\n", 1
+    if not content:
+        return "", 0
+    return "\n".join(content) + "\n", len(content)
+
+
+def _apply_line_edits(filename: str, data: bytes, rewrite_from: int, edits) -> None:
+    """Apply sorted, non-overlapping (start, stop, new_text) edits of 0-based lines [start, stop).
+
+    When every edit keeps its byte length, only the edited bytes are
+    overwritten in place. Otherwise the result is assembled into one buffer
+    and written with a single write; bytes before the first edit are left
+    on disk untouched, and only the new text and everything after the first
+    edit point are written.
+    """
+    spans = []  # (byte start, byte end, new bytes) of each edit
+    pos = line = 0  # byte offset of the start of 0-based line `line`
+    for start, stop, new_text in edits:
+        pos = _skip_lines(data, pos, start - line)
+        end = _skip_lines(data, pos, stop - start)
+        spans.append((pos, end, new_text.encode('utf-8')))
+        pos, line = end, stop
+
+    with open(filename, 'r+b') as f:
+        if rewrite_from == len(data) and all(len(new) == end - begin for begin, end, new in spans):
+            for begin, _, new in spans:
+                f.seek(begin)
+                f.write(new)
+        else:
+            write_from = min(spans[0][0], rewrite_from) if spans else rewrite_from
+            parts = []
+            prev_end = write_from
+            for begin, end, new in spans:
+                parts.append(data[prev_end:begin])
+                parts.append(new)
+                prev_end = end
+            parts.append(data[prev_end:])
+            f.seek(write_from)
+            f.write(b''.join(parts))
+            f.truncate()
+    _forget_line_index(filename)
+
+
+def _line_runs(indices) -> List[Tuple[int, int]]:
+    """Merge sorted 0-based line indices into [start, stop) runs of consecutive lines."""
+    runs = []
+    for idx in indices:
+        if runs and runs[-1][1] == idx:
+            runs[-1] = (runs[-1][0], idx + 1)
+        else:
+            runs.append((idx, idx + 1))
+    return runs
+
+
+def _splice_lines(filename: str, data: bytes, rewrite_from: int, start: int, stop: int, new_text: str) -> None:
+    """Replace 0-based lines [start, stop) of the file with new_text."""
+    _apply_line_edits(filename, data, rewrite_from, ((start, stop, new_text),))
+
 
 class FileEditor(ToolBase):
     """Unified file editor supporting read, write, insert, append, replace, and delete operations.
@@ -52,19 +334,9 @@ class FileEditor(ToolBase):
 
     @model_validator(mode='after')
     def validate_operation(self):
+        """Check the fields the operation needs, then the filename/filenames choice."""
         op = self.operation
-        if op == "read":
-            pass
-        elif op == "write":
-            if self.content is None:
-                raise ValueError("content required for write")
-        elif op == "insert":
-            if self.content is None or self.line_number is None:
-                raise ValueError("content and line_number required for insert")
-        elif op == "append":
-            if self.content is None:
-                raise ValueError("content required for append")
-        elif op == "replace":
+        if op == "replace":
             # For replace operation, we accept either:
             # 1. replacements dict (original behavior)
             # 2. content + line_numbers (for replacing range/list with same content)
@@ -74,17 +346,12 @@ class FileEditor(ToolBase):
                     raise ValueError("For replace operation, either replacements dict or content is required")
                 if self.line_numbers is None and self.line_number is None:
                     raise ValueError("For replace operation with content, line_numbers or line_number is required")
-        elif op == "delete":
-            if self.line_numbers is None:
-                raise ValueError("line_numbers required for delete")
-        elif op == "grep":
-            if self.pattern is None:
-                raise ValueError("pattern required for grep")
-        return self
-
+        elif op in _REQUIRED_FIELDS:
+            fields, message = _REQUIRED_FIELDS[op]
+            for name in fields:
+                if getattr(self, name) is None:
+                    raise ValueError(message)
 
-    @model_validator(mode='after')
-    def validate_filenames(self):
         if self.filename is None and self.filenames is None:
             raise ValueError("Either filename or filenames must be provided")
         if self.filename is not None and self.filenames is not None:
@@ -93,6 +360,9 @@ class FileEditor(ToolBase):
             raise ValueError("filenames list cannot be empty")
         return self
 
+    def modifies_state(self) -> bool:
+        return self.operation not in _READ_ONLY_OPERATIONS
+
     def execute(self) -> str:
         # Determine target files
         if self.filenames is not None:
@@ -102,35 +372,29 @@ class FileEditor(ToolBase):
             target_files = [self.filename]
             batch_mode = False
         
-        results = []
-        for filename in target_files:
-            try:
-                actual_filename = filename
-                # Validate path is within workspace if workspace_path is set
-                validated_filename = self._validate_path(actual_filename)
-                if self.operation == "read":
-                    result = self._execute_read(validated_filename)
-                elif self.operation == "write":
-                    result = self._execute_write(validated_filename)
-                elif self.operation == "insert":
-                    result = self._execute_insert(validated_filename)
-                elif self.operation == "append":
-                    result = self._execute_append(validated_filename)
-                elif self.operation == "replace":
-                    result = self._execute_replace(validated_filename)
-                elif self.operation == "delete":
-                    result = self._execute_delete(validated_filename)
-                elif self.operation == "grep":
-                    result = self._execute_grep(validated_filename)
-                else:
-                    result = f"Error: Unknown operation {self.operation}"
-                    result = self._execute_delete(validated_filename)
-                results.append(f"{filename}: {result}")
-            except Exception as e:
-                results.append(f"{filename}: Error: {e}")
+        # Resolve the operation once for the whole batch
+        method_name = _OPERATION_METHODS.get(self.operation)
+        if method_name is None:
+            return f"Error: Unknown operation {self.operation}"
+        operation = getattr(self, method_name)
+
+        if len(target_files) > 1:
+            # Per-file work is blocking file I/O, so overlap it across threads.
+            # Modifying operations take a per-path lock so a file listed twice
+            # is never rewritten by two threads at once; map() keeps input order.
+            file_locks = {} if self.operation not in _READ_ONLY_OPERATIONS else None
+            with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(target_files))) as pool:
+                outcomes = list(pool.map(lambda fn: self._execute_one(operation, fn, file_locks), target_files))
+        else:
+            outcomes = [self._execute_one(operation, target_files[0])]
+
         # Format output
         if batch_mode:
-            success_count = sum(1 for r in results if "Error:" not in r)
+            results = []
+            success_count = 0
+            for filename, (result, ok) in zip(target_files, outcomes):
+                results.append(f"{filename}: {result}")
+                success_count += ok
             error_count = len(results) - success_count
             output = f"Batch operation '{self.operation}' completed.\n"
             output += f"Total files processed: {len(target_files)}\n"
@@ -140,63 +404,34 @@ class FileEditor(ToolBase):
         else:
             # Single file: return the result directly (without filename prefix)
             # The result already includes filename in its message
-            result = results[0].split(": ", 1)[1] if ": " in results[0] else results[0]
-            return self._truncate_output(result)
+            return self._truncate_output(outcomes[0][0])
+
+    def _execute_one(self, operation, filename: str, file_locks: Optional[Dict[str, threading.Lock]] = None) -> Tuple[str, bool]:
+        """Run operation on one file and return its result and whether it succeeded."""
+        try:
+            # Validate path is within workspace if workspace_path is set
+            validated_filename = self._validate_path(filename)
+            if file_locks is None:
+                result = operation(validated_filename)
+            else:
+                with file_locks.setdefault(validated_filename, threading.Lock()):
+                    result = operation(validated_filename)
+            # Handlers report failures with an "Error" prefixed result
+            return result, not result.startswith("Error")
+        except Exception as e:
+            return f"Error: {e}", False
 
     # Helper methods that accept filename parameter
     def _execute_read(self, filename: str) -> str:
         """Read file or specific lines."""
-        with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        total_lines = len(lines)
-
-        if self.line_numbers is None or self.line_numbers == 'all':
-            # Read all lines
-            result_lines = lines
-            line_indices = list(range(1, total_lines + 1))
-        elif isinstance(self.line_numbers, int):
-            # Single line number
-            line_num = self.line_numbers
-            if line_num < 1 or line_num > total_lines:
-                return f"Error: Line number {line_num} is out of range (file has {total_lines} lines)"
-            result_lines = [lines[line_num - 1]]
-            line_indices = [line_num]
-        elif isinstance(self.line_numbers, list):
-            # List of line numbers
-            line_indices = []
-            result_lines = []
-            
-            # Special case: 2-element list treated as range [start, end]
-            if len(self.line_numbers) == 2:
-                start, end = self.line_numbers[0], self.line_numbers[1]
-                if start < 1 or end > total_lines or start > end:
-                    return f"Error: Invalid range {start}-{end} (file has {total_lines} lines)"
-                line_indices = list(range(start, end + 1))
-                result_lines = [lines[i - 1] for i in line_indices]
-            else:
-                # Regular list of discrete line numbers
-                for line_num in self.line_numbers:
-                    if line_num < 1 or line_num > total_lines:
-                        return f"Error: Line number {line_num} is out of range (file has {total_lines} lines)"
-                    line_indices.append(line_num)
-                    result_lines.append(lines[line_num - 1])
-        elif isinstance(self.line_numbers, str) and '-' in self.line_numbers:
-            # Range string like "1-10"
-            try:
-                start_str, end_str = self.line_numbers.split('-')
-                start = int(start_str.strip())
-                end = int(end_str.strip())
+        data, offsets = _line_index(filename)
 
-                if start < 1 or end > total_lines or start > end:
-                    return f"Error: Invalid range {start}-{end} (file has {total_lines} lines)"
+        total_lines = len(offsets) - 1
 
-                line_indices = list(range(start, end + 1))
-                result_lines = [lines[i - 1] for i in line_indices]
-            except ValueError:
-                return f"Error: Invalid range format '{self.line_numbers}'. Use format like '1-10'"
-        else:
-            return f"Error: Invalid line_numbers parameter: {self.line_numbers}"
+        try:
+            line_indices = _parse_line_spec(self.line_numbers, total_lines)
+        except ValueError as e:
+            return f"Error: {e}"
 
         # Apply context lines if specified
         if self.context_lines > 0:
@@ -206,17 +441,15 @@ class FileEditor(ToolBase):
                 end = min(total_lines, idx + self.context_lines)
                 expanded_indices.update(range(start, end + 1))
             line_indices = sorted(expanded_indices)
-            result_lines = [lines[i-1] for i in line_indices]
 
-        # Format the output
+        # Decode only the span of lines that is shown, not the whole file
         output_lines = []
-        for idx, line in zip(line_indices, result_lines):
-            output_lines.append(f"Line {idx}: {line.rstrip()}")
-
-        return f"File: {filename}\nTotal lines: {total_lines}\n" + "\n".join(output_lines)
-        output_lines = []
-        for idx, line in zip(line_indices, result_lines):
-            output_lines.append(f"Line {idx}: {line.rstrip()}")
+        if line_indices:
+            first = min(line_indices)
+            # A trailing newline leaves an empty last item, which is never indexed
+            span = data[offsets[first - 1]:offsets[max(line_indices)]].decode('utf-8').split('\n')
+            for idx in line_indices:
+                output_lines.append(f"Line {idx}: {span[idx - first].rstrip()}")
 
         return f"File: {filename}\nTotal lines: {total_lines}\n" + "\n".join(output_lines)
 
@@ -225,93 +458,73 @@ class FileEditor(ToolBase):
         if self.line_number is None:
             # Write entire file
             content_str = self.content if isinstance(self.content, str) else "\n".join(self.content)
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(content_str)
+            _replace_file_text(filename, content_str)
+            _forget_line_index(filename)
             return f"Successfully wrote to {filename}"
         else:
             # Write to specific line
-            with open(filename, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            data, rewrite_from = _read_normalized(filename)
 
-            total_lines = len(lines)
+            total_lines = _count_lines(data)
             line_num = self.line_number
 
             if line_num < 1 or line_num > total_lines + 1:
                 return f"Error: Line number {line_num} is out of range (file has {total_lines} lines)"
 
-            # Convert content to list of lines
-            if isinstance(self.content, str):
-                new_lines = [self.content + "\n"]
-            else:
-                new_lines = [line + "\n" for line in self.content]
+            new_text, new_count = _content_text(self.content)
 
             if self.mode == "replace":
                 # Overwrite existing line
                 if line_num <= total_lines:
-                    lines[line_num - 1] = new_lines[0]
+                    _splice_lines(filename, data, rewrite_from, line_num - 1, line_num, (self.content if isinstance(self.content, str) else self.content[0]) + "\n")
                 else:
                     # Append if beyond end
-                    lines.extend(new_lines)
+                    _splice_lines(filename, data, rewrite_from, total_lines, total_lines, new_text)
                 result_msg = f"Replaced line {line_num}"
             elif self.mode == "insert":
                 # Insert before line
-                lines = lines[:line_num - 1] + new_lines + lines[line_num - 1:]
-                result_msg = f"Inserted {len(new_lines)} line(s) before line {line_num}"
+                _splice_lines(filename, data, rewrite_from, line_num - 1, line_num - 1, new_text)
+                result_msg = f"Inserted {new_count} line(s) before line {line_num}"
             elif self.mode == "append":
                 # Insert after line
-                lines = lines[:line_num] + new_lines + lines[line_num:]
-                result_msg = f"Appended {len(new_lines)} line(s) after line {line_num}"
+                _splice_lines(filename, data, rewrite_from, line_num, line_num, new_text)
+                result_msg = f"Appended {new_count} line(s) after line {line_num}"
             else:
                 return f"Error: Invalid mode '{self.mode}'"
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
-
             return f"Successfully modified {filename}: {result_msg}"
 
     def _execute_insert(self, filename: str) -> str:
         """Insert lines before specified line."""
-        with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        data, rewrite_from = _read_normalized(filename)
 
-        total_lines = len(lines)
+        total_lines = _count_lines(data)
         line_num = self.line_number
 
         if line_num < 1 or line_num > total_lines + 1:
             return f"Error: Line number {line_num} is out of range (file has {total_lines} lines)"
 
-        # Convert content to list of lines with newline
-        if isinstance(self.content, str):
-            new_lines = [self.content + "\n"]
-        else:
-            new_lines = [line + "\n" for line in self.content]
-
-        lines = lines[:line_num - 1] + new_lines + lines[line_num - 1:]
+        new_text, new_count = _content_text(self.content)
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        _splice_lines(filename, data, rewrite_from, line_num - 1, line_num - 1, new_text)
 
-        return f"Successfully inserted {len(new_lines)} line(s) before line {line_num} in {filename}"
+        return f"Successfully inserted {new_count} line(s) before line {line_num} in {filename}"
 
     def _execute_append(self, filename: str) -> str:
         """Append lines to end of file."""
-        with open(filename, 'a', encoding='utf-8') as f:
-            if isinstance(self.content, str):
-                f.write(self.content + "\n")
-                lines_added = 1
-            else:
-                for line in self.content:
-                    f.write(line + "\n")
-                lines_added = len(self.content)
+        # Build and encode the appended text once and hand it to a single write
+        payload, lines_added = _content_text(self.content)
+        with open(filename, 'ab') as f:
+            f.write(payload.encode('utf-8'))
+        _forget_line_index(filename)
 
         return f"Successfully appended {lines_added} line(s) to {filename}"
 
     def _execute_replace(self, filename: str) -> str:
         """Replace specific lines."""
-        with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        data, rewrite_from = _read_normalized(filename)
 
-        total_lines = len(lines)
+        total_lines = _count_lines(data)
         
         # Build replacements dict from either self.replacements or content + line_numbers/line_number
         replacements = {}
@@ -329,39 +542,11 @@ class FileEditor(ToolBase):
             if line_numbers is None:
                 return "Error: No line numbers specified for replace operation"
             
-            # Parse line_numbers into list of line numbers
-            line_nums = []
-            
-            if line_numbers == 'all':
-                line_nums = list(range(1, total_lines + 1))
-            elif isinstance(line_numbers, int):
-                line_nums = [line_numbers]
-            elif isinstance(line_numbers, list):
-                # Special case: 2-element list treated as range [start, end]
-                if len(line_numbers) == 2:
-                    start, end = line_numbers[0], line_numbers[1]
-                    if start < 1 or end > total_lines or start > end:
-                        return f"Error: Invalid range {start}-{end} (file has {total_lines} lines)"
-                    line_nums = list(range(start, end + 1))
-                else:
-                    line_nums = line_numbers
-            elif isinstance(line_numbers, str) and '-' in line_numbers:
-                try:
-                    start_str, end_str = line_numbers.split('-')
-                    start = int(start_str.strip())
-                    end = int(end_str.strip())
-                    if start < 1 or end > total_lines or start > end:
-                        return f"Error: Invalid range {start}-{end} (file has {total_lines} lines)"
-                    line_nums = list(range(start, end + 1))
-                except ValueError:
-                    return f"Error: Invalid range format '{line_numbers}'. Use format like '1-10'"
-            else:
-                return f"Error: Invalid line_numbers parameter: {line_numbers}"
-            
-            # Validate all line numbers are in range
-            for line_num in line_nums:
-                if line_num < 1 or line_num > total_lines:
-                    return f"Error: Line number {line_num} is out of range (file has {total_lines} lines)"
+            # Parse and validate line_numbers
+            try:
+                line_nums = _parse_line_spec(line_numbers, total_lines)
+            except ValueError as e:
+                return f"Error: {e}"
             
             # Create replacements dict from content
             content = self.content
@@ -379,67 +564,41 @@ class FileEditor(ToolBase):
                 return f"Error: Invalid content type: {type(content)}"
         
         # Apply replacements
-        for line_num, new_content in replacements.items():
-            lines[line_num - 1] = new_content + "\n"
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        bad = _first_out_of_range(replacements, total_lines)
+        if bad is not None:
+            return f"Error: Line number {bad} is out of range (file has {total_lines} lines)"
+        _apply_line_edits(filename, data, rewrite_from, [
+            (line_num - 1, line_num, replacements[line_num] + "\n")
+            for line_num in sorted(replacements)
+        ])
 
         return f"Successfully replaced {len(replacements)} line(s) in {filename}"
 
     def _execute_delete(self, filename: str) -> str:
         """Delete specific lines."""
-        with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        data, rewrite_from = _read_normalized(filename)
 
-        total_lines = len(lines)
+        total_lines = _count_lines(data)
 
-        # Determine which line indices to delete
-        delete_indices = set()
-
-        if isinstance(self.line_numbers, int):
-            line_num = self.line_numbers
-            if line_num < 1 or line_num > total_lines:
-                return f"Error: Line number {line_num} is out of range (file has {total_lines} lines)"
-            delete_indices.add(line_num - 1)
-        elif isinstance(self.line_numbers, list):
-            # Special case: 2-element list treated as range [start, end]
-            if len(self.line_numbers) == 2:
-                start, end = self.line_numbers[0], self.line_numbers[1]
-                if start < 1 or end > total_lines or start > end:
-                    return f"Error: Invalid range {start}-{end} (file has {total_lines} lines)"
-                for line_num in range(start, end + 1):
-                    delete_indices.add(line_num - 1)
-            else:
-                # Regular list of discrete line numbers
-                for line_num in self.line_numbers:
-                    if line_num < 1 or line_num > total_lines:
-                        return f"Error: Line number {line_num} is out of range (file has {total_lines} lines)"
-                    delete_indices.add(line_num - 1)
-        elif isinstance(self.line_numbers, str) and '-' in self.line_numbers:
-            try:
-                start_str, end_str = self.line_numbers.split('-')
-                start = int(start_str.strip())
-                end = int(end_str.strip())
-
-                if start < 1 or end > total_lines or start > end:
-                    return f"Error: Invalid range {start}-{end} (file has {total_lines} lines)"
-
-                for line_num in range(start, end + 1):
-                    delete_indices.add(line_num - 1)
-            except ValueError:
-                return f"Error: Invalid range format '{self.line_numbers}'. Use format like '1-10'"
+        # Determine which lines to delete
+        try:
+            line_nums = _parse_line_spec(self.line_numbers, total_lines, allow_all=False)
+        except ValueError as e:
+            return f"Error: {e}"
+
+        # A range is deleted as one span; other selections as runs of consecutive lines
+        if isinstance(line_nums, range):
+            runs = [(line_nums.start - 1, line_nums.stop - 1)]
+            deleted = len(line_nums)
         else:
-            return f"Error: Invalid line_numbers parameter: {self.line_numbers}"
-
-        # Delete lines (in reverse order to preserve indices)
-        for idx in sorted(delete_indices, reverse=True):
-            del lines[idx]
+            delete_indices = {line_num - 1 for line_num in line_nums}
+            runs = _line_runs(sorted(delete_indices))
+            deleted = len(delete_indices)
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        # Delete lines
+        _apply_line_edits(filename, data, rewrite_from, [(start, stop, "") for start, stop in runs])
 
-        return f"Successfully deleted {len(delete_indices)} line(s) from {filename}"
+        return f"Successfully deleted {deleted} line(s) from {filename}"
 
     def _execute_grep(self, filename: str) -> str:
         """Search for pattern in file."""
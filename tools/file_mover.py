@@ -1,11 +1,62 @@
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from pathlib import Path
 from .base import ToolBase
+import os
 import shutil
 import glob
-import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from itertools import starmap
 from pydantic import Field, model_validator
 
+# Upper bound on threads used for one batch move
+_MAX_MOVE_WORKERS = 8
+
+# Sources sharing a parent from which one directory scan replaces their stats
+_SCANDIR_MIN_SIBLINGS = 8
+
+
+def _source_dir_flags(sources: List[Path]) -> Dict[Path, Optional[bool]]:
+    """Map each source to whether it is a directory, or None if it does not exist.
+
+    Sources sharing a parent with enough siblings are answered from one
+    os.scandir of that parent; the rest, symlinks and names not listed
+    there get their own stat.
+    """
+    by_parent = {}
+    for source in sources:
+        by_parent.setdefault(source.parent, []).append(source)
+    flags = {}
+    for parent, children in by_parent.items():
+        entries = {}
+        if len(children) >= _SCANDIR_MIN_SIBLINGS:
+            try:
+                with os.scandir(parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                pass
+        for source in children:
+            entry = entries.get(source.name)
+            if entry is not None and not entry.is_symlink():
+                flags[source] = entry.is_dir(follow_symlinks=False)
+                continue
+            try:
+                flags[source] = stat.S_ISDIR(source.stat().st_mode)
+            except (OSError, ValueError):
+                flags[source] = None
+    return flags
+
+
+def _move_one(item) -> Optional[Exception]:
+    """Move one (source, final_dest, type) plan item, returning the error instead of raising it."""
+    source, final_dest, _ = item
+    try:
+        shutil.move(str(source), str(final_dest))
+    except Exception as e:
+        return e
+    return None
+
+
 class FileMover(ToolBase):
     """Move files and directories. Supports single file, batch moves via list, and glob patterns.
     
@@ -58,28 +109,43 @@ class FileMover(ToolBase):
         """Return the longest common parent directory for a list of paths."""
         if not paths:
             return Path.cwd()
-        # Convert all paths to absolute and resolve
-        abs_paths = [p.absolute().resolve() for p in paths]
-        # Split each path into parts
-        parts_list = [list(p.parts) for p in abs_paths]
-        # Find the shortest path (by parts)
-        min_len = min(len(parts) for parts in parts_list)
-        common_parts = []
-        for i in range(min_len):
-            part = parts_list[0][i]
-            if all(parts[i] == part for parts in parts_list):
-                common_parts.append(part)
-            else:
-                break
-        if not common_parts:
+        # Absolute (not resolved) paths, matching the relative_to() in execute
+        abs_paths = [str(p.absolute()) for p in paths]
+        try:
+            common = Path(os.path.commonpath(abs_paths))
+        except ValueError:
             # No common prefix (different drives?) return root
-            return Path(abs_paths[0].anchor) if abs_paths else Path.cwd()
-        common = Path(*common_parts)
+            return Path(Path(abs_paths[0]).anchor)
         # Ensure it's a directory (if not, take parent)
         if common.is_file():
             common = common.parent
         return common
 
+    def _move_all(self, plan) -> None:
+        """Move every (source, final_dest, type) item in plan, raising the first failure in plan order.
+
+        Moves are blocking file system calls, so independent ones are overlapped
+        on a thread pool. A plan where two items share a destination, one item
+        moves onto another's source, or one source lies inside another is
+        moved one item at a time, in order.
+        """
+        sources = {source.absolute() for source, _, _ in plan}
+        destinations = {final_dest.absolute() for _, final_dest, _ in plan}
+        independent = (
+            len(destinations) == len(plan)
+            and sources.isdisjoint(destinations)
+            and not any(parent in sources for source in sources for parent in source.parents)
+        )
+        if len(plan) < 2 or not independent:
+            for source, final_dest, _ in plan:
+                shutil.move(str(source), str(final_dest))
+            return
+        with ThreadPoolExecutor(max_workers=min(_MAX_MOVE_WORKERS, len(plan))) as pool:
+            errors = list(pool.map(_move_one, plan))
+        for error in errors:
+            if error is not None:
+                raise error
+
     def execute(self) -> str:
         try:
             destination = Path(self.destination_path)
@@ -107,8 +173,9 @@ class FileMover(ToolBase):
             sources = validated_sources
             
             # Validate all sources exist before moving anything
+            source_is_dir = _source_dir_flags(sources)
             for source in sources:
-                if not source.exists():
+                if source_is_dir[source] is None:
                     return self._truncate_output(f"Error: Source path '{source}' does not exist")
             
             # Determine if this is a batch move (multiple sources)
@@ -128,7 +195,10 @@ class FileMover(ToolBase):
             if is_batch and self.preserve_structure:
                 common_parent = self._common_parent(sources)
             
-            moved_items = []
+            # (source, final destination, type) of each item, in source order
+            plan = []
+            # Directories already ensured by create_dirs, so each is created once
+            created_dirs = set()
             for source in sources:
                 # Determine final destination path for this source
                 if is_batch:
@@ -148,25 +218,25 @@ class FileMover(ToolBase):
                 
                 # If create_dirs is True, create parent directories of final destination
                 if self.create_dirs:
-                    if final_dest.suffix:  # looks like a file
-                        final_dest.parent.mkdir(parents=True, exist_ok=True)
-                    else:
-                        # destination is a directory (ensure it exists)
-                        final_dest.mkdir(parents=True, exist_ok=True)
+                    # looks like a file -> its parent; else the destination directory itself
+                    dir_to_create = final_dest.parent if final_dest.suffix else final_dest
+                    if dir_to_create not in created_dirs:
+                        dir_to_create.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(dir_to_create)
                 
-                # Move the file or directory
-                shutil.move(str(source), str(final_dest))
-                
-                # Record what was moved
-                moved_type = "directory" if source.is_dir() else "file"
-                moved_items.append((str(source), str(final_dest), moved_type))
+                moved_type = "directory" if source_is_dir[source] else "file"
+                plan.append((source, final_dest, moved_type))
+            
+            # Move the files and directories (shutil.move renames when on the same filesystem)
+            self._move_all(plan)
+            moved_items = [(str(source), str(final_dest), typ) for source, final_dest, typ in plan]
             
             # Generate success message
             if len(moved_items) == 1:
                 src, dest, typ = moved_items[0]
                 return self._truncate_output(f"Successfully moved {typ} from '{src}' to '{dest}'")
             else:
-                details = "\n".join([f"  - {typ}: '{src}' -> '{dest}'" for src, dest, typ in moved_items])
+                details = "\n".join(starmap("  - {2}: '{0}' -> '{1}'".format, moved_items))
                 return self._truncate_output(f"Successfully moved {len(moved_items)} items:\n{details}")
             
         except Exception as e:
@@ -1,5 +1,4 @@
 from .base import ToolBase
-import os
 import pathlib
 from pydantic import Field
 from typing import Optional, ClassVar, Literal, Union, List
@@ -7,6 +6,8 @@ from typing import Optional, ClassVar, Literal, Union, List
 class FilePreviewTool(ToolBase):
     """Show beginning and end of file with line numbers."""
     tool: Literal["FilePreviewTool"] = "FilePreviewTool"
+    parallel_safe: ClassVar[bool] = True
+    cacheable: ClassVar[bool] = True
     
     # Safety limits
     MAX_HEAD_LINES: ClassVar[int] = 500
@@ -3,15 +3,18 @@ import os
 import re
 import fnmatch
 import bisect
+import functools
 from pathlib import Path
 from pydantic import Field
-from typing import List, Optional, ClassVar, Literal
+from typing import Iterator, List, Optional, ClassVar, Literal
 
 class FileSearchTool(ToolBase):
     """Search for patterns across multiple files or directories with regex, multiline, context lines, and line numbers.
     Supports regex (with (?s) flag for dot-matches-newline) and plain text multi-line searches.
     Use file_pattern glob to limit files, or directory/filenames."""
     tool: Literal["FileSearchTool"] = "FileSearchTool"
+    parallel_safe: ClassVar[bool] = True
+    cacheable: ClassVar[bool] = True
     
     # Safety limits
     MAX_FILE_SIZE: ClassVar[int] = 10_000_000  # 10MB
@@ -35,12 +38,24 @@ class FileSearchTool(ToolBase):
         description="Directory names to exclude from search (exact match or glob patterns)"
     )
     
+    @functools.cached_property
+    def _exclude_dir_rules(self):
+        """Split exclude_dirs into exact names and one compiled matcher for the glob patterns."""
+        names = set()
+        globs = []
+        for pattern in self.exclude_dirs:
+            pattern = os.path.normcase(pattern)
+            if any(c in pattern for c in '*?['):
+                globs.append(fnmatch.translate(pattern))
+            else:
+                names.add(pattern)
+        return names, (re.compile('|'.join(globs)).match if globs else None)
+
     def _should_exclude_dir(self, dirname: str) -> bool:
         """Check if a directory should be excluded based on exclude_dirs patterns."""
-        for pattern in self.exclude_dirs:
-            if fnmatch.fnmatch(dirname, pattern):
-                return True
-        return False
+        names, glob_match = self._exclude_dir_rules
+        dirname = os.path.normcase(dirname)
+        return dirname in names or (glob_match is not None and glob_match(dirname) is not None)
 
     def _is_path_excluded(self, file_path: str) -> bool:
         """Check if a file path should be excluded based on exclude_dirs patterns."""
@@ -51,6 +66,50 @@ class FileSearchTool(ToolBase):
                 return True
         return False
 
+    def _walk_files(self, top: str) -> Iterator[str]:
+        """Yield all file paths under top in os.walk order, skipping excluded directories.
+
+        Uses os.scandir directly so each entry's type comes from the cached
+        DirEntry instead of an extra stat per file.
+        """
+        stack = [top]
+        while stack:
+            root = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            yield entry.path
+                        elif not entry.is_symlink() and not self._should_exclude_dir(entry.name):
+                            subdirs.append(entry.path)
+            except OSError:
+                continue
+            # Reversed so the first subdirectory is walked next, as os.walk does
+            stack.extend(reversed(subdirs))
+
+    def _expand_directory(self, directory: str, limit: int) -> List[str]:
+        """Validate files under directory, skipping files outside the workspace.
+
+        Stops once limit files are collected; callers only need to know that
+        the search is too large, not the exact size of the tree.
+        """
+        validated = []
+        for full_path in self._walk_files(directory):
+            if len(validated) >= limit:
+                break
+            # Validate each subfile (should be within workspace since root is)
+            try:
+                validated.append(self._validate_path(full_path))
+            except ValueError:
+                # Skip files outside workspace
+                continue
+        return validated
+
     def execute(self) -> str:
         try:
             # Determine which files to search
@@ -63,18 +122,8 @@ class FileSearchTool(ToolBase):
                         return f"Error: {e}"
                     if os.path.isdir(validated_f):
                         # treat as directory, expand recursively with exclusion
-                        for root, dirs, files in os.walk(validated_f):
-                            # Modify dirs in-place to exclude unwanted directories
-                            dirs[:] = [d for d in dirs if not self._should_exclude_dir(d)]
-                            for file in files:
-                                full_path = os.path.join(root, file)
-                                # Validate each subfile (should be within workspace since root is)
-                                try:
-                                    validated_sub = self._validate_path(full_path)
-                                    files_to_search.append(validated_sub)
-                                except ValueError:
-                                    # Skip files outside workspace
-                                    continue
+                        files_to_search.extend(self._expand_directory(
+                            validated_f, self.MAX_FILES_TO_SEARCH + 1 - len(files_to_search)))
                     else:
                         files_to_search.append(validated_f)
             elif self.directory:
@@ -85,18 +134,7 @@ class FileSearchTool(ToolBase):
                     return f"Error: {e}"
                 if not os.path.isdir(validated_dir):
                     return f"Error: '{self.directory}' is not a valid directory."
-                for root, dirs, files in os.walk(validated_dir):
-                    # Modify dirs in-place to exclude unwanted directories
-                    dirs[:] = [d for d in dirs if not self._should_exclude_dir(d)]
-                    for file in files:
-                        full_path = os.path.join(root, file)
-                        # Validate each subfile (should be within workspace since root is)
-                        try:
-                            validated_sub = self._validate_path(full_path)
-                            files_to_search.append(validated_sub)
-                        except ValueError:
-                            # Skip files outside workspace
-                            continue
+                files_to_search.extend(self._expand_directory(validated_dir, self.MAX_FILES_TO_SEARCH + 1))
             elif self.file_pattern:
                 # Use glob to find files matching pattern, respecting workspace and exclusions
                 files_to_search = []
@@ -116,7 +154,7 @@ class FileSearchTool(ToolBase):
             
             # Limit number of files to prevent excessive scanning (optional)
             if len(files_to_search) > self.MAX_FILES_TO_SEARCH:
-                return f"Error: Too many files to search ({len(files_to_search)}). Please narrow your search."
+                return f"Error: Too many files to search (more than {self.MAX_FILES_TO_SEARCH}). Please narrow your search."
             
             # Prepare pattern
             if self.use_regex:
@@ -1,9 +1,8 @@
 from .base import ToolBase
 import ast
-import os
 import pathlib
 from pydantic import Field
-from typing import Optional, List, Dict, Any, Literal
+from typing import ClassVar, Optional, List, Dict, Any, Literal
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,6 +10,8 @@ logger = logging.getLogger(__name__)
 class FileSummaryTool(ToolBase):
     """Extract structural elements from code files using AST parsing."""
     tool: Literal["FileSummaryTool"] = "FileSummaryTool"
+    parallel_safe: ClassVar[bool] = True
+    cacheable: ClassVar[bool] = True
     
     filename: str = Field(description="Path to the file to analyze")
     include_imports: bool = Field(default=True, description="Include import statements in summary")
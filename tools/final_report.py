@@ -1,7 +1,6 @@
 from pydantic import Field
 from typing import Optional, Literal
 from datetime import datetime
-import os
 from pathlib import Path
 from .final import Final
 
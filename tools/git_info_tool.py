@@ -1,11 +1,22 @@
 # tools/git_info_tool.py
-from typing import Literal, Optional, List
+from typing import ClassVar, Literal, Optional, List
 from pydantic import Field
 import subprocess
-import os
 from pathlib import Path
 from .base import ToolBase
 
+# operation -> GitInfoTool method that runs it
+_OPERATION_METHODS = {
+    "status": "_git_status",
+    "diff": "_git_diff",
+    "log": "_git_log",
+    "branch": "_git_branch",
+    "show": "_git_show",
+    "remote": "_git_remote",
+    "blame": "_git_blame",
+    "config": "_git_config",
+}
+
 
 class GitInfoTool(ToolBase):
     """
@@ -14,6 +25,8 @@ class GitInfoTool(ToolBase):
     All operations are read-only and cannot modify the repository.
     """
     tool: Literal["GitInfoTool"] = "GitInfoTool"
+    parallel_safe: ClassVar[bool] = True
+    cacheable: ClassVar[bool] = True
 
     
     operation: Literal["status", "diff", "log", "branch", "show", "remote", "blame", "config"] = Field(
@@ -129,24 +142,10 @@ class GitInfoTool(ToolBase):
                     return self._truncate_output(f"Git not available or not a git repository: {repo_root}")
             
             # Execute operation
-            if self.operation == "status":
-                return self._git_status(repo_root)
-            elif self.operation == "diff":
-                return self._git_diff(repo_root)
-            elif self.operation == "log":
-                return self._git_log(repo_root)
-            elif self.operation == "branch":
-                return self._git_branch(repo_root)
-            elif self.operation == "show":
-                return self._git_show(repo_root)
-            elif self.operation == "remote":
-                return self._git_remote(repo_root)
-            elif self.operation == "blame":
-                return self._git_blame(repo_root)
-            elif self.operation == "config":
-                return self._git_config(repo_root)
-            else:
+            method_name = _OPERATION_METHODS.get(self.operation)
+            if method_name is None:
                 return self._truncate_output(f"Unknown operation: {self.operation}")
+            return getattr(self, method_name)(repo_root)
         
         except Exception as e:
             return self._truncate_output(f"Error executing git operation: {e}")
@@ -8,12 +8,11 @@ Provides fast file discovery using Python's glob module with:
 - Both tree and list output formats
 """
 from .base import ToolBase
-import os
 import sys
 import glob
 import fnmatch
 from pathlib import Path
-from typing import List, Optional, Literal
+from typing import ClassVar, List, Optional, Literal
 from pydantic import Field
 
 class GlobTool(ToolBase):
@@ -34,6 +33,8 @@ class GlobTool(ToolBase):
         page=2, per_page=50 gets the second page of 50 results each
     """
     tool: Literal["GlobTool"] = "GlobTool"
+    parallel_safe: ClassVar[bool] = True
+    cacheable: ClassVar[bool] = True
 
 
     directory: str = Field(
@@ -5,7 +5,6 @@ Validates MCP server configurations and tests connectivity.
 Supports both single-server and multi-server configurations.
 """
 import json
-import os
 import logging
 from typing import Dict, Any, List, Optional, Union, Literal
 from pathlib import Path
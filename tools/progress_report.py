@@ -1,7 +1,6 @@
 from pydantic import Field
 from typing import Optional, Literal
 from datetime import datetime
-import os
 from pathlib import Path
 from .base import ToolBase
 
@@ -24,9 +23,9 @@ class ProgressReport(ToolBase):
     )
 
     def execute(self) -> str:
-        # Ensure reports directory exists
+        # The reports directory is created on demand when the first write
+        # finds it missing, so repeated reports cost no mkdir call
         reports_dir = Path("./reports")
-        reports_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate timestamp for this update
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -58,7 +57,12 @@ class ProgressReport(ToolBase):
         # Write report content
         try:
             mode = "a" if self.append else "w"
-            with open(filepath, mode, encoding="utf-8") as f:
+            try:
+                f = open(filepath, mode, encoding="utf-8")
+            except FileNotFoundError:
+                reports_dir.mkdir(parents=True, exist_ok=True)
+                f = open(filepath, mode, encoding="utf-8")
+            with f:
                 if self.append:
                     f.write(f"\n\n--- Progress Update at {timestamp} ---\n\n")
                 else:
@@ -12,6 +12,22 @@ import glob
 
 from .base import ToolBase
 from .code_modifier_utils import apply_code_modifier, compute_diff
+import os
+
+
+def _backup_file(file_path, backup_path):
+    """Back up file_path as backup_path without copying its data when possible.
+
+    The commit step replaces each file by renaming a temp file over it, so the
+    original inode is never written to; a hard link to it is a complete backup.
+    Falls back to a real copy where hard links are unsupported.
+    """
+    try:
+        os.link(file_path, backup_path)
+    except OSError:
+        shutil.copy2(file_path, backup_path)
+
+
 def _commit_changes_atomically(modified_contents):
     """
     Atomically write modified contents to files.
@@ -28,7 +44,7 @@ def _commit_changes_atomically(modified_contents):
         for file_path, (original, new) in modified_contents.items():
             # create backup
             backup_path = file_path.with_suffix(file_path.suffix + '.refactor_backup')
-            shutil.copy2(file_path, backup_path)
+            _backup_file(file_path, backup_path)
             backups.append((file_path, backup_path))
             # create temp file
             with tempfile.NamedTemporaryFile(
@@ -51,8 +67,12 @@ def _commit_changes_atomically(modified_contents):
         # rollback: restore from backups
         for file_path, backup_path in backups:
             if backup_path.exists():
-                shutil.copy2(backup_path, file_path)
-                backup_path.unlink()
+                # Rename the backup back into place; if the file was never
+                # replaced, both names are links to one inode and rename is a
+                # no-op, so drop the extra link
+                backup_path.replace(file_path)
+                if backup_path.exists():
+                    backup_path.unlink()
         # delete any temp files
         for _, temp_path in temps:
             if temp_path.exists():
@@ -1,7 +1,8 @@
 # tools/utils.py
-from typing import Any, Dict, Type, Tuple
+from typing import Any, Dict, Type, Tuple, List
 from pydantic import BaseModel
 import copy
+import functools
 
 
 def _simplify_schema(schema: dict) -> dict:
@@ -103,15 +104,37 @@ def model_to_openai_tool(model: Type[BaseModel]) -> Dict[str, Any]:
         del schema["properties"]["workspace_path"]
         if "required" in schema and "workspace_path" in schema["required"]:
             schema["required"].remove("workspace_path")
-    # Remove the top-level title and description from parameters
-    parameters = {k: v for k, v in schema.items() if k not in ("title", "description")}
+    # Remove the top-level title and description from parameters; the
+    # schema is freshly generated, so it can be trimmed in place
+    description = schema.pop("description", "")
+    schema.pop("title", None)
     # Simplify the parameters schema
-    parameters = _simplify_schema(parameters)
+    parameters = _simplify_schema(schema)
     return {
         "type": "function",
         "function": {
             "name": model.__name__,
-            "description": schema.get("description", ""),
+            "description": description,
             "parameters": parameters,
         }
-    }
\ No newline at end of file
+    }
+
+
+# Per class, so toolsets that differ by a few tools (simplified vs full,
+# newly registered or MCP tools) share the schemas of the rest
+_openai_tool_for = functools.lru_cache(maxsize=256)(model_to_openai_tool)
+
+
+@functools.lru_cache(maxsize=8)
+def _tool_definitions(tool_classes: Tuple[Type[BaseModel], ...]) -> Tuple[Dict[str, Any], ...]:
+    return tuple(_openai_tool_for(cls) for cls in tool_classes)
+
+
+def tool_definitions_for(tool_classes) -> List[Dict[str, Any]]:
+    """
+    Return OpenAI tool definitions for tool_classes, memoized by the class tuple.
+    Tool schemas are static for the process lifetime, so repeated Agent
+    construction / restart reuses the already generated definitions.
+    The returned dicts are shared and must not be mutated.
+    """
+    return list(_tool_definitions(tuple(tool_classes)))